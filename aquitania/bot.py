@@ -25,12 +25,17 @@ make it understandable to others.
 will make it pip installable soon.
 
 10/05/2018 - Changed name from GeneralManager to Aquitania.
+
+18/10/2026 - Exits are built in parallel, one process per asset, and exit points of each asset can be split among
+'n_exit_processes' worker processes. Elapsed time of each stage of exit building is summed over all assets.
+
+18/10/2026 - At most 'n_asset_processes' assets build exits at the same time, each of them holds the whole G01 candles
+history in memory (and may start its own exit point workers).
 """
 import cProfile
 import datetime
 import importlib
 import re
-import _pickle
 import argparse
 import sys
 
@@ -45,8 +50,9 @@ from aquitania.brains.models.random_forest import RandomForestClf
 from aquitania.data_processing.util import generate_folder, clean_indicator_data, clean_ai_data
 from aquitania.data_source.broker.broker_selection import select_broker
 from aquitania.execution.live_management.live_environment import LiveEnvironment
+from aquitania.indicator.management.checkpoint_policy import CheckpointPolicy
 from aquitania.indicator.management.indicator_manager import *
-from aquitania.liquidation.build_exit import build_exits
+from aquitania.liquidation.build_exit import build_exits, exit_pool
 from aquitania.resources.no_deamon_pool import MyPool
 from aquitania.strategies.example_strategy import ExampleStrategy
 
@@ -67,7 +73,8 @@ class Bot:
 
     def __init__(self, broker='test', storage='pandas_hdf5', asset_ids=ref.cur_ordered_by_spread[0:1],
                  strategy=ExampleStrategy(), is_clean=False, start_dt=datetime.datetime(1971, 2, 1),
-                 model=RandomForestClf, params={}):
+                 model=RandomForestClf, params={}, is_vectorized=False, n_ts_processes=1, checkpoint_policy=None,
+                 n_exit_processes=1, n_asset_processes=2):
         """
         Initializes GeneralManager, which is a class that has methods to download all Candles (historic and live) and
         run them through indicators, as well as to create exit points and an AI strategy.
@@ -78,6 +85,11 @@ class Bot:
         :param strategy: Strategy to be used
         :param is_clean: if True will reset all historical data
         :param start_dt: start date for historical simulations
+        :param is_vectorized: if True will run historical simulations through NumpyFeeder (only closed indicators)
+        :param n_ts_processes: number of processes that feed timestamps of an asset in parallel (needs is_vectorized)
+        :param checkpoint_policy: (CheckpointPolicy) when to save output and state during historical simulations
+        :param n_exit_processes: number of processes that build exit points of an asset in parallel
+        :param n_asset_processes: number of assets that build exits in parallel
         """
         # Instantiate broker_instance
         self._broker_instance = select_broker(broker, storage)
@@ -85,6 +97,11 @@ class Bot:
         self.is_live = True
         self.strategy = strategy
         self.start_date = start_dt
+        self.is_vectorized = is_vectorized
+        self.n_ts_processes = n_ts_processes
+        self.checkpoint_policy = checkpoint_policy
+        self.n_exit_processes = n_exit_processes
+        self.n_asset_processes = n_asset_processes
 
         # Instantiate AI variables
         self.model = model
@@ -187,7 +204,7 @@ class Bot:
         time_a = time.time()
 
         # Load historic data and feed it to the indicators
-        indicator_manager.update_load_run_data()
+        indicator_manager.update_load_run_data(self.n_ts_processes)
 
         # Calculates elapsed time
         print('Elapsed time to run simulation on ', asset + ':', time.time() - time_a)
@@ -208,16 +225,16 @@ class Bot:
         # Creates folder if it doesn't exist
         generate_folder(folder)
 
+        # Instantiates a new IndicatorManager
+        indicator_manager = IndicatorManager(self._broker_instance, asset_id, self.strategy, self.start_date,
+                                             is_vectorized=self.is_vectorized,
+                                             checkpoint_policy=self.checkpoint_policy)
+
         # Loads IndicatorManager saved state if there is any
-        for the_file in os.listdir(folder):
-            if asset_id + '.pkl' in the_file:
-                with open(folder + asset_id + '.pkl', 'rb') as f:
-                    indicator_manager = _pickle.load(f)
-                    indicator_manager.hdm.is_san_n_store = True
-                    return indicator_manager
+        if indicator_manager.load_snapshot():
+            indicator_manager.hdm.is_san_n_store = True
 
-        # Instantiates a new IndicatorManager in case it didn't return the function previously
-        return IndicatorManager(self._broker_instance, asset_id, self.strategy, self.start_date)
+        return indicator_manager
 
     def run(self, is_complete=False, is_live=False):
         """
@@ -245,29 +262,55 @@ class Bot:
 
     def run_liquidation(self):
         """
-        Creates exit points as defined in the Strategy at 'self.strategy'.
+        Creates exit points as defined in the Strategy at 'self.strategy', one process per asset.
 
         Saves exits on 'data/exits'
         """
         # Initializes time counter
         time_a = time.time()
 
-        for asset_id in self.asset_ids:
-            # Build Exit for a specific asset
-            print('Creating exits for security:', asset_id)
-
-            # Gets signal from strategy
-            # TODO implement multiple signals and multiple exit points
-            signal = self.strategy.signal
-
-            # Generate all possible exits according to possible Exit points
-            build_exits(self._broker_instance, asset_id, signal, 14400)
+        # Starts multiprocessing to build exits of each asset, memory grows with the number of assets in parallel
+        asset_pool = MyPool(max(1, min(self.n_asset_processes, len(self.asset_ids))))
+        timings = asset_pool.map(self.build_asset_exits, self.asset_ids)
+        asset_pool.close()
+        asset_pool.join()
 
         # Prints time it took to generate and evaluate Exits
         print('\n\n----------------------------------------------------------------')
+        for stage in timings[0] if timings else []:
+            print('{}: {:.2f} seconds'.format(stage, sum(timing[stage] for timing in timings)))
         print('Exit generation took: {} seconds'.format(time.time() - time_a))
         print('----------------------------------------------------------------')
 
+    def build_asset_exits(self, asset_id):
+        """
+        Build exits for a specific asset, exit points are split among 'n_exit_processes' worker processes.
+
+        This was made to be used in a parallel fashion. Each asset is a process.
+
+        :param asset_id: (str) Asset which exits will be built
+
+        :return: Elapsed seconds of each stage
+        :rtype: dict
+        """
+        # Build Exit for a specific asset
+        print('Creating exits for security:', asset_id)
+
+        # Gets signal from strategy
+        # TODO implement multiple signals and multiple exit points
+        signal = self.strategy.signal
+
+        # Instantiates worker processes for exit points (there are only two exit points, stop and profit)
+        pool = exit_pool(min(self.n_exit_processes, 2)) if self.n_exit_processes > 1 else None
+
+        try:
+            # Generate all possible exits according to possible Exit points
+            return build_exits(self._broker_instance, asset_id, signal, 14400, pool=pool)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
     def run_brains(self, save_to_disk=False):
         """
         Generates an automated AI strategy and evaluates this strategy.
@@ -323,6 +366,13 @@ def arg_parser():
           -sd, --startdate     The Start Date - format YYYY-MM-DD
           -ed, --enddate       The End Date - format YYYY-MM-DD
           -t, --trade          Trading strategy to be used
+          -v, --vectorized     Runs simulations through NumpyFeeder
+          -tp, --tsprocesses   Number of processes feeding timestamps of an asset in parallel (needs -v)
+          -cr, --checkpointrows     Saves output and state every N Candles
+          -cs, --checkpointseconds  Saves output and state every T seconds
+          -mb, --memorybudget       Memory budget in MB per asset (sets chunk size)
+          -ep, --exitprocesses Number of processes building exit points of an asset in parallel
+          -ap, --assetprocesses  Number of assets building exits in parallel
     :rtype: argparse.Namespace
     """
     # Creates parser
@@ -363,6 +413,24 @@ def arg_parser():
     # Selects trading strategy
     parser.add_argument('-t', '--trade', type=str, metavar='', help='Trading strategy to be used (CamelCase)')
 
+    # Selects if simulations should run through NumpyFeeder (only for Strategies without open indicators)
+    parser.add_argument('-v', '--vectorized', action='store_true', help='Runs simulations through NumpyFeeder')
+
+    # Selects how many processes feed timestamps of an asset in parallel (only with NumpyFeeder)
+    parser.add_argument('-tp', '--tsprocesses', type=int, default=1, help='Processes feeding timestamps in parallel')
+
+    # Selects when output and state are saved (only at the end if none is set)
+    parser.add_argument('-cr', '--checkpointrows', type=int, help='Saves output and state every N Candles')
+    parser.add_argument('-cs', '--checkpointseconds', type=float, help='Saves output and state every T seconds')
+    parser.add_argument('-mb', '--memorybudget', type=int, help='Memory budget in MB per asset (sets chunk size)')
+
+    # Selects how many processes build exit points of an asset in parallel
+    parser.add_argument('-ep', '--exitprocesses', type=int, default=1,
+                        help='Processes building exit points in parallel')
+
+    # Selects how many assets build exits in parallel
+    parser.add_argument('-ap', '--assetprocesses', type=int, default=2, help='Assets building exits in parallel')
+
     # Returns argument parser
     return parser.parse_args()
 
@@ -504,8 +572,16 @@ if __name__ == '__main__':
     # Set if this will be a new backtest, or if it should use data/states from previous simulations
     clean_data = args.clean
 
+    # Sets when output and state are saved, keeps default policy if nothing was set
+    checkpoint_policy_ = None
+    if any(arg is not None for arg in (args.checkpointrows, args.checkpointseconds, args.memorybudget)):
+        memory_budget = args.memorybudget * 2 ** 20 if args.memorybudget is not None else None
+        checkpoint_policy_ = CheckpointPolicy(args.checkpointrows, args.checkpointseconds, memory_budget)
+
     # Initialize General Manager
-    bot = Bot(broker_, storage_, asset_list, strategy_, clean_data, start_date)
+    bot = Bot(broker_, storage_, asset_list, strategy_, clean_data, start_date, is_vectorized=args.vectorized,
+              n_ts_processes=args.tsprocesses, checkpoint_policy=checkpoint_policy_,
+              n_exit_processes=args.exitprocesses, n_asset_processes=args.assetprocesses)
 
     # Selects execution mode accordingly to the ArgumentParser
     select_execution_mode(bot, args)
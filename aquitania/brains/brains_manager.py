@@ -22,14 +22,16 @@ simpler model_manager would on its outside world methods.
 
 I will also create the possibility to work with splitting into Train, Test, and Validation Data, and working to make a
 automatic grid search for it.
+
+18/10/2026 - Results set is loaded from the liquidation store ('consolidate' partitions) in a single concatenation.
 """
 import _pickle
-import pandas as pd
 
 from aquitania.brains.models.random_forest import RandomForestClf
 from aquitania.data_processing.analytics_loader import build_ai_df
 from aquitania.data_processing.indicator_transformer import IndicatorTransformer
 from aquitania.execution.oracle import Oracle
+from aquitania.liquidation.liquidation_store import load_liquidations
 from aquitania.brains.is_oos_split.train_test_split import TrainTestSplit
 from aquitania.brains.model_manager import ModelManager
 
@@ -95,16 +97,8 @@ class BrainsManager:
         return transformed_df
 
     def generate_results_set(self, signal):
-        results_set = None
         # Load results set
-        for currency in self.list_of_currencies:
-            if results_set is None:
-                results_set = pd.read_hdf('data/liquidation/' + currency + '_' + signal + '_CONSOLIDATE')
-            else:
-                temp_df = pd.read_hdf('data/liquidation/' + currency + '_' + signal + '_CONSOLIDATE')
-                results_set = pd.concat([results_set, temp_df])
-
-        return results_set
+        return load_liquidations(self.list_of_currencies, signal, 'consolidate')
 
     def save_strategy_to_disk(self):
         """
@@ -18,11 +18,17 @@ all the timestamps, OR a unified DataFrame for all currencies and timestamps, de
 
 Started refactoring this module on 26/04/2018. Currently thinking about dividing it into 2 different modules. Decided to
 make it only one module but remove AnalyticsLoader class and leave only standalone methods.
+
+18/10/2026 - Entry column is loaded from the liquidation store, reading only the 'entry' column of exits.
+
+18/10/2026 - Indicator output is read only for signal rows (row coordinates from signal row index) and, when building
+liquidation DataFrames, only for selected columns, instead of reading whole files and filtering them in memory.
 """
 import os.path
 import pandas as pd
 
 from aquitania.data_processing.util import get_stored_ai, add_asset_columns_to_df, save_df, add_to_dataframe
+from aquitania.liquidation.liquidation_store import load_liquidation
 
 
 def build_liquidation_dfs(broker_instance, asset, list_of_columns, signal):
@@ -38,14 +44,11 @@ def build_liquidation_dfs(broker_instance, asset, list_of_columns, signal):
     :return: DataFrame with all possible entries
     :rtype: pandas DataFrame
     """
-    # Get column names
-    # TODO this operation is too expansive, need to refactor this for a cheaper operation / pickle_state this inside strategy
+    # Get column names (from column catalog, indicator output files are not opened)
     columns_dict = get_dataframes_that_contain_columns(broker_instance, asset, list_of_columns)
 
     # Instantiate variables
-    timestamp = signal[0]
     final_df = None
-    complete = 'complete_{}'.format(timestamp)
 
     # Check if there is an indicator output file for given asset
     for filename in os.listdir(broker_instance.ds.indicator_output_folder):
@@ -56,29 +59,18 @@ def build_liquidation_dfs(broker_instance, asset, list_of_columns, signal):
     else:
         raise IOError('No indicator that for selected currency: ' + asset)
 
-    # Retrieves DataFrame that will be used to filter valid signal rows
-    df = pd.read_hdf(broker_instance.get_indicator_filename(asset, timestamp))[[signal, complete]]
+    # Retrieves rows where signal is set and their DateTimes (signal row index)
+    rows, datetimes = get_signal_filter(broker_instance, asset, signal)
 
     # Gets all DataFrames according to key values (each key represents one timestamp)
     for key in columns_dict.keys():
 
-        # Builds filepath str
-        filepath = '{}/{}/{}'.format(broker_instance.ds.indicator_output_folder, asset, key)
-
-        # Loads Indicators for given timestamp and asset
-        temp_df = pd.read_hdf(filepath)[list(columns_dict[key])]
+        # Loads only signal rows and selected columns of Indicators for given timestamp and asset
+        temp_df = get_signal_output(broker_instance, asset, key, rows, datetimes, columns_dict[key])
 
         # Instantiates first DataFrame to be joined
         if final_df is None:
-
-            # Creates a filter column
-            temp_df['filter'] = (df[complete] == 1) & (df[signal] != 0)
-
-            # Makes a filter only to select rows where complete and signal are True
-            final_df = temp_df.query('filter == 1')
-
-            # Deletes filter column
-            del final_df['filter']
+            final_df = temp_df
 
         else:
             # Makes inner join with DataFrame that has filtered rows (output will be filtered as well)
@@ -142,10 +134,10 @@ def build_ai_df(broker_instance, asset_list, signal):
         # TODO add verification to check if same size of the liquidation DataFrame
         if not isinstance(cur_df, pd.DataFrame):
             # Routine for when a new AI DataFrame needs to be created
-            df_filter = get_signal_filter(broker_instance, asset, signal)
+            signal_filter = get_signal_filter(broker_instance, asset, signal)
 
             # Get asset output (all timestamps combined into a single DataFrame)
-            cur_df = get_asset_output(broker_instance, asset, df_filter, signal)
+            cur_df = get_asset_output(broker_instance, asset, signal_filter, signal)
 
             # Add columns relative to asset classification to DataFrame
             cur_df = add_asset_columns_to_df(cur_df, asset)
@@ -162,33 +154,75 @@ def build_ai_df(broker_instance, asset_list, signal):
 
 def get_signal_filter(broker_instance, asset, signal):
     """
-    Creates a filter to only select rows that have a signal on a DataFrame.
+    Gets rows that have a signal on indicator output and their DateTimes.
 
     :param broker_instance: (DataSource) connection to broker / database
     :param asset: (str) Asset Name
     :param signal: (str) entry name
 
-    :return: Boolean values to determine which rows to select in a DataFrame
-    :rtype: numpy Array
+    :return: Row coordinates of signals and their DateTimes
+    :rtype: tuple
     """
     # Generates Timestamp Id - single digit number as (str)
     timestamp = signal[0]
 
-    # Gets signal filter
-    with pd.HDFStore(broker_instance.get_indicator_filename(asset, timestamp)) as hdf:
-        df = hdf.select(key='indicators', columns=[signal, 'complete_' + timestamp])
+    # Gets signal rows from signal row index
+    rows = broker_instance.get_signal_rows(asset, signal)
+
+    # Gets DateTimes of signal rows, reading a single column
+    datetimes = broker_instance.get_indicator_rows(asset, get_output_filename(broker_instance, asset, timestamp), rows,
+                                                   ['complete_' + timestamp]).index
 
     # Returns signal filter
-    return df['complete_' + timestamp].astype(bool) & df[signal].astype(bool)
+    return rows, datetimes
+
+
+def get_output_filename(broker_instance, asset, timestamp):
+    """
+    Gets filename of indicator output of a timestamp (without folder).
+
+    :param broker_instance: (DataSource) connection to broker / database
+    :param asset: (str) Asset Name
+    :param timestamp: (str) Timestamp letter
+
+    :rtype: str
+    """
+    return os.path.basename(broker_instance.get_indicator_filename(asset, timestamp))
+
+
+def get_signal_output(broker_instance, asset, filename, rows, datetimes, columns=None):
+    """
+    Loads signal rows of an indicator output file, only for selected columns. Files of all timestamps have a row for
+    each G01 Candle, so signal rows are read by row coordinates. If DateTimes of those rows don't match signals, file is
+    read whole and filtered by DateTime.
+
+    :param broker_instance: (DataSource) connection to broker / database
+    :param asset: (str) Asset Name
+    :param filename: (str) Indicator output filename
+    :param rows: (numpy Array) Row coordinates of signals
+    :param datetimes: (pandas DatetimeIndex) DateTimes of signals
+    :param columns: (list of str) Columns to be loaded, None for all
+
+    :return: Indicator output of signal rows
+    :rtype: pandas DataFrame
+    """
+    df = broker_instance.get_indicator_rows(asset, filename, rows, columns)
+
+    # Routine for files that are not aligned with signal file
+    if not df.index.equals(datetimes):
+        df = broker_instance.get_indicator_rows(asset, filename, None, columns)
+        df = df[df.index.isin(datetimes)]
+
+    return df
 
 
-def get_asset_output(broker_instance, asset, df_filter, signal):
+def get_asset_output(broker_instance, asset, signal_filter, signal):
     """
-    Gets a single huge DataFrame combining all timestamps for a given asset.
+    Gets a single huge DataFrame combining all timestamps for a given asset, only for signal rows.
 
     :param broker_instance: (DataSource) connection to broker / database
     :param asset: (str) Asset Name
-    :param df_filter: (numpy Array) Boolean values to determine which rows to select in a DataFrame
+    :param signal_filter: (tuple) Output of 'get_signal_filter()', row coordinates and DateTimes of signals
     :param signal: (str) entry name
 
     :return: DataFrame combining all timestamps for a given asset
@@ -213,14 +247,14 @@ def get_asset_output(broker_instance, asset, df_filter, signal):
 
             # Runs file by file routine to append them into a single DataFrame
             for the_file in list_output:
-                # Reads and filters DataFrame
-                temp_df = pd.read_hdf(asset_dir + the_file)[df_filter]
+                # Reads only signal rows
+                temp_df = get_signal_output(broker_instance, asset, the_file, *signal_filter)
 
                 # Combines timestamps into a single DataFrame
                 final_df = add_to_dataframe(final_df, temp_df, axis=1)
 
     # Adds an entry column to the DataFrame (next 1Min candle open)
-    final_df['entry'] = pd.read_hdf('data/liquidation/' + asset + '_' + signal)['entry']
+    final_df['entry'] = load_liquidation(asset, signal, 'exits', columns=['entry'])['entry']
 
     # Returns DataFrame with all timestamps
     return final_df
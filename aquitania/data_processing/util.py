@@ -14,6 +14,9 @@
 .. moduleauthor:: H Roark
 
 File to hold utility functions related to data processing.
+
+18/10/2026 - Added 'atomic_write()', the single routine through which index, catalog, header, manifest and snapshot
+files are rewritten.
 """
 
 import os
@@ -27,6 +30,7 @@ def clean_indicator_data():
     Delete all files in folders related to indicator output.
     """
     delete_contents('data/indicator')
+    delete_contents('data/indicator_index')
     delete_contents('data/state')
     delete_contents('data/order_manager')
 
@@ -68,6 +72,35 @@ def generate_folder(folder):
         os.makedirs(folder)
 
 
+def atomic_write(filename, write_fn, mode='wb'):
+    """
+    Rewrites a file atomically and durably. Contents go to a temporary file that is flushed to disk before being
+    renamed over 'filename', and the rename itself is flushed through its folder, so after a process crash or a power
+    loss 'filename' holds either its previous or its new contents.
+
+    :param filename: (str) File path
+    :param write_fn: (callable) Writes contents into the open temporary file it receives
+    :param mode: (str) 'wb' for binary files, 'w' for text files
+    """
+    # Writes temporary file and makes sure it is on disk before renaming
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, mode) as f:
+        write_fn(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Replaces previous file
+    os.replace(temp_filename, filename)
+
+    # Makes rename durable (folders can't be opened on Windows, where replace is already durable enough)
+    if os.name == 'posix':
+        fd = os.open(os.path.dirname(filename) or '.', os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
 def get_stored_ai(finsec, signal):
     df_path = 'data/ai/' + finsec + '_' + signal
     if os.path.exists(df_path):
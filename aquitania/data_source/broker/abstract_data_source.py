@@ -16,11 +16,16 @@
 12/04/2018 - Made a big refactor on this module, pretty much removing for good one of the first classes I ever created
 which was called DataSource and made an improved and more efficient architecture, using DataSource as an abstract class
 to force implementation of certain methods and etc.
+
+18/10/2026 - Added 'numpy_memmap' storage system (NumpyMemmap), Candles in memory-mapped binary columns.
+
+18/10/2026 - Stored data can be loaded for a range of dates.
 """
 
 import abc
 import datetime
 
+from aquitania.data_source.storage.numpy_memmap import NumpyMemmap
 from aquitania.data_source.storage.pandas_h5 import PandasHDF5
 
 
@@ -37,6 +42,8 @@ class AbstractDataSource:
         data_storage_type = data_storage_type.lower()
         if data_storage_type == 'pandas_hdf5':
             return PandasHDF5(self.broker_name)
+        elif data_storage_type == 'numpy_memmap':
+            return NumpyMemmap(self.broker_name)
         else:
             raise NameError('Invalid Storage System Name')
 
@@ -56,27 +63,34 @@ class AbstractDataSource:
     def store(self, df):
         self.ds.add_data(df)
 
-    def load_data(self, asset):
+    def load_data(self, asset, start=None, end=None):
         """
-        Loads data stored in disk for a specific Financial Security, this will fetch all candles.
+        Loads data stored in disk for a specific Financial Security, this will fetch all candles between 'start' and
+        'end' (both included, None means no limit).
 
         :param asset: (str) Select Financial Security
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
         :return: Stored data for selected Financial Security
         :rtype: pandas DataFrame
         """
 
-        return self.ds.get_stored_data(asset)
+        return self.ds.get_stored_data(asset, start, end)
 
-    def load_data_in_chunks(self, asset, chunksize):
+    def load_data_in_chunks(self, asset, chunksize, start=None, end=None):
         """
-        Loads data stored in disk for a specific Financial Security, this will fetch all candles.
+        Loads data stored in disk for a specific Financial Security, this will fetch all candles between 'start' and
+        'end' (both included, None means no limit).
 
         :param asset: (str) Select Financial Security
+        :param chunksize: (int) Number of candles per chunk
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
         :return: Stored data for selected Financial Security
-        :rtype: pandas DataFrame
+        :rtype: generator of pandas DataFrame
         """
 
-        return self.ds.get_stored_data_in_chunks(asset, chunksize)
+        return self.ds.get_stored_data_in_chunks(asset, chunksize, start, end)
 
     def sanitize(self, asset):
         """
@@ -92,9 +106,21 @@ class AbstractDataSource:
     def get_indicator_filename(self, asset, ts):
         return self.ds.get_indicator_filename(asset, ts)
 
+    def get_candles_extremes_filename(self, asset):
+        return self.ds.get_candles_extremes_filename(asset)
+
     def get_dict_of_file_columns(self, asset):
         return self.ds.get_dict_of_file_columns(asset)
 
+    def get_column_catalog(self, asset):
+        return self.ds.get_column_catalog(asset)
+
+    def get_signal_rows(self, asset, signal):
+        return self.ds.get_signal_rows(asset, signal)
+
+    def get_indicator_rows(self, asset, filename, rows=None, columns=None):
+        return self.ds.get_indicator_rows(asset, filename, rows, columns)
+
     def gen_asset_dict(self, asset):
         """
         Get Data Dictionary.
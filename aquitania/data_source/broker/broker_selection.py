@@ -34,7 +34,7 @@ def select_broker(broker_name, data_storage_name):
     as different kinds of data requires different DataSources.
 
     :param broker_name: (str) Broker Name (Ex.: oanda, fxcm, test)
-    :param data_storage_name: (str) Identifier of Data Storage System (pandas_hdf5)
+    :param data_storage_name: (str) Identifier of Data Storage System (pandas_hdf5 or numpy_memmap)
     """
     broker_name = broker_name.lower()
     if broker_name == 'oanda':
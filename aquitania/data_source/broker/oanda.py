@@ -19,6 +19,10 @@ Both as a data source and also as a platform to execute orders in the future.
 
 12/04/2018 - Making a very big refactor here as there is a lot of code not very well written. Decided to work with an
 abstract DataSource class. I will implement an abstract class for Storage as well.
+
+18/10/2026 - Candles are downloaded by OandaDownloader, which requests windows of the missing range concurrently.
+
+18/10/2026 - Payloads of candles are parsed into a DataFrame of typed columns at once ('parse_candles()').
 """
 import os
 import time
@@ -34,6 +38,8 @@ from oandapyV20 import API, oandapyV20
 from dateutil import parser
 from aquitania.data_processing.util import generate_folder
 from aquitania.data_source.broker.abstract_data_source import AbstractDataSource
+from aquitania.data_source.broker.oanda_downloader import OandaDownloader, OANDA_URL, N_CONNECTIONS, \
+    REQUESTS_PER_SECOND
 from aquitania.resources import references
 from oandapyV20.endpoints import instruments
 from oandapyV20.endpoints import pricing
@@ -56,12 +62,16 @@ class Oanda(AbstractDataSource):
     api (API): Oanda's API object
     """
 
-    def __init__(self, broker_name, data_storage_type):
+    def __init__(self, broker_name, data_storage_type, base_url=OANDA_URL, n_connections=N_CONNECTIONS,
+                 requests_per_second=REQUESTS_PER_SECOND):
         """
         Initializes Oanda's DataSource object.
 
         :param broker_name (str): Broker Name (Ex.: 'oanda')
         :param data_storage_type (str): ata Storage Type (Ex.: 'pandas_hdf5')
+        :param base_url (str): Base URL of Oanda's REST API used to download candles
+        :param n_connections (int): Number of concurrent candle requests
+        :param requests_per_second (float): Maximum number of candle requests per second
         """
         # Sets file paths
         self.folder_path = 'data/broker/'
@@ -79,6 +89,9 @@ class Oanda(AbstractDataSource):
         # Configures API access
         self.api = API(access_token=self.token)
 
+        # Configures concurrent candle downloads
+        self.downloader = OandaDownloader(self.token, base_url, n_connections, requests_per_second)
+
     def get_trading_data(self):
         """
         Returns account ID and token to trade with Oanda's API.
@@ -211,31 +224,14 @@ class Oanda(AbstractDataSource):
         else:
             raise TypeError('Oanda start_date is of a wrong type. Try datetime.datetime or np.datetime64.')
 
-        # Generate 'entry_params' that will be used to fetch candles
-        entry_params = {'from': proc_start_date, 'financial instrument': finsec, 'granularity': 'M1'}
-
-        # Generate dummy raw_data
-        raw_data = None
-
-        # Download candle routine
-        while raw_data is None or len(raw_data['candles']) == 5000:
-
-            # Check if there was already a first batched download
-            if raw_data is not None:
-                # Sets correct initial date for the candle request
-                candle_time = parser.parse(raw_data['candles'][-1]['time'][0:19])
-                entry_params['from'] = next_candle_datetime(candle_time, 1)
+        # Downloads windows of candles concurrently, they are exported in order
+        try:
+            for raw_data in self.downloader.download(finsec, proc_start_date):
+                q1.put(raw_data)
 
-            # Avoid process crashing if Oanda's server fail for any reason not responding
-            try:
-                raw_data = self.connection_historic_data(generate_oanda_params(entry_params, 5000))
-                if raw_data:
-                    q1.put(raw_data)
-            except:
-                if raw_data is None and not dtfx.is_fx_working_hours_from_tz(datetime.datetime.now()):
-                    return
-                Warning('Unable to connect to Oanda. Trying again in 10 seconds.')
-                time.sleep(10)
+        # Candles that were exported are stored, next download starts after them
+        except IOError as error:
+            print('{}Unable to download candles from Oanda: {}'.format(dtfx.now(), error))
 
     def get_spread_data(self, finsec):
         """
@@ -353,42 +349,12 @@ class Oanda(AbstractDataSource):
                         'h'
                         'l'
                         'c'
-        :return returns processed data
-        :rtype list of lists
-            processed_data
-                candle_time
-                financial_instrument
-                timestamp
-                open
-                high
-                low
-                close
-                volume
+        :return returns processed data, only complete candles in FX working hours (may be empty)
+        :rtype pandas DataFrame
+            index: datetime
+            columns: fi, ts, open, high, low, close, volume
         """
-        # Instantiates empty list of candles
-        list_candles = []
-
-        for candle in raw_data['candles']:
-
-            # Transform Oanda's datetime string to datetime.datetime
-            candle_time = parser.parse(candle['time'][0:19])
-
-            # Get currency code
-            currency = references.currencies_dict[raw_data['instrument']]
-
-            # Create tuple of candle elements
-            export_candle = (candle_time, currency, 0, float(candle['bid']['o']), float(candle["bid"]["h"]), float(
-                candle['bid']['l']), float(candle['bid']['c']), candle['volume'])
-
-            # Oanda may feed open candles, check if complete to store in database
-            if candle['complete']:
-                # Check if valid market hours
-                if dtfx.is_fx_working_hours_from_tz(candle_time):
-                    # Appends to list of valid only candles
-                    list_candles.append(export_candle)
-
-        # May return empty value
-        return list_candles
+        return parse_candles(raw_data)
 
     def get_asset_attributes(self, asset):
         """
@@ -412,6 +378,35 @@ class Oanda(AbstractDataSource):
                 return var['maximumOrderUnits'], var['minimumTradeSize'], var['type']
 
 
+def parse_candles(raw_data):
+    """
+    Parses a whole payload of candles into typed columns at once: fixed format timestamps are parsed by NumPy, prices
+    are converted by column and FX working hours are evaluated for all candles together.
+
+    :param raw_data: (dict) Raw data from server (see 'Oanda.data_processing_manager()')
+
+    :return: Complete candles in FX working hours
+    :rtype: pandas DataFrame
+    """
+    candles = raw_data['candles']
+    bids = [candle['bid'] for candle in candles]
+
+    # Timestamps are 'YYYY-MM-DDTHH:MM:SS' followed by fraction of seconds and timezone (always UTC)
+    datetimes = np.array([candle['time'][0:19] for candle in candles], dtype='datetime64[s]').astype('datetime64[ns]')
+
+    df = pd.DataFrame({'fi': references.currencies_dict[raw_data['instrument']], 'ts': 0,
+                       'open': np.array([bid['o'] for bid in bids]).astype(np.float64),
+                       'high': np.array([bid['h'] for bid in bids]).astype(np.float64),
+                       'low': np.array([bid['l'] for bid in bids]).astype(np.float64),
+                       'close': np.array([bid['c'] for bid in bids]).astype(np.float64),
+                       'volume': np.array([candle['volume'] for candle in candles], dtype=np.int64)},
+                      index=pd.DatetimeIndex(datetimes, name='datetime'))
+
+    # Oanda may feed open candles, only complete candles in valid market hours are kept
+    is_complete = np.array([candle['complete'] for candle in candles], dtype=bool)
+    return df[is_complete & dtfx.is_fx_working_hours_array(df.index)]
+
+
 def generate_oanda_params(params, count):
     """
     Generates params necessary as input to request candles from Oanda's server.
@@ -0,0 +1,227 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created a concurrent candle downloader. Oanda candles used to be requested one page of 5000 candles at a
+time, each page starting after the last candle of the previous one, sleeping 10 seconds on any error. Now the range of
+missing candles is split into independent windows of WINDOW_MINUTES minutes (never more than 5000 G01 candles), which
+are requested concurrently over a pool of HTTP connections:
+
+    - TokenBucket limits requests per second (Oanda allows 120 requests per second)
+    - Failed requests (connection errors, 429 and 5xx) are retried with exponential backoff
+    - Windows are yielded in order, with at most 2 * n_connections windows in flight
+
+Base URL is configurable, so that a local HTTP server can stand in for Oanda.
+"""
+import collections
+import datetime
+import threading
+import time
+
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+import aquitania.resources.datetimefx as dtfx
+
+# Oanda's REST API (practice environment)
+OANDA_URL = 'https://api-fxpractice.oanda.com'
+
+# Minutes in a window, Oanda returns at most 5000 candles per request
+WINDOW_MINUTES = 5000
+
+# Default number of pooled connections and requests per second
+N_CONNECTIONS = 8
+REQUESTS_PER_SECOND = 60
+
+# Retries of a failed request, first one after BACKOFF seconds, doubling every time
+MAX_RETRIES = 6
+BACKOFF = 0.5
+
+# Oanda's datetime format
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        """
+        Initializes TokenBucket, thread-safe rate limiter.
+
+        :param rate: (float) Tokens added per second
+        :param capacity: (float) Maximum number of tokens (burst), defaults to 'rate'
+        """
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes a token, blocking until there is one.
+        """
+        while True:
+            with self._lock:
+                # Refills tokens for elapsed time
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class OandaDownloader:
+    def __init__(self, token, base_url=OANDA_URL, n_connections=N_CONNECTIONS,
+                 requests_per_second=REQUESTS_PER_SECOND, max_retries=MAX_RETRIES, backoff=BACKOFF):
+        """
+        Initializes OandaDownloader.
+
+        :param token: (str) Oanda's API token
+        :param base_url: (str) Base URL of Oanda's REST API
+        :param n_connections: (int) Number of concurrent requests (and pooled connections)
+        :param requests_per_second: (float) Maximum number of requests per second
+        :param max_retries: (int) Number of retries of a failed request
+        :param backoff: (float) Seconds before first retry, doubles on every retry
+        """
+        self.base_url = base_url.rstrip('/')
+        self.n_connections = n_connections
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.bucket = TokenBucket(requests_per_second)
+
+        # Pooled connections, shared by all requests
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(pool_connections=1, pool_maxsize=n_connections))
+        self.session.headers.update({'Authorization': 'Bearer {}'.format(token), 'Content-Type': 'application/json'})
+
+    def download(self, finsec, start_date, end_date=None):
+        """
+        Downloads G01 candles of a Financial Security from 'start_date' on, window by window.
+
+        :param finsec: (str) Selected Financial Security
+        :param start_date: (datetime.datetime) First candle datetime (UTC)
+        :param end_date: (datetime.datetime) Datetime to stop at (UTC), None for now
+
+        :return: Raw data of each window with candles, in order (see 'Oanda.connection_historic_data()')
+        :rtype: generator of dict
+        """
+        windows = partition_windows(start_date, end_date)
+        print('{}Requesting candles to {} for {} from {} ({} windows)'.format(
+            dtfx.now(), 'Oanda', finsec, start_date.strftime(DATETIME_FORMAT), len(windows)))
+
+        executor = ThreadPoolExecutor(self.n_connections)
+        try:
+            futures = collections.deque()
+            for window in windows:
+                futures.append(executor.submit(self.request_window, finsec, window))
+
+                # Yields oldest window when there are enough windows in flight
+                if len(futures) >= 2 * self.n_connections:
+                    raw_data = futures.popleft().result()
+                    if len(raw_data['candles']) > 0:
+                        yield raw_data
+
+            while len(futures) > 0:
+                raw_data = futures.popleft().result()
+                if len(raw_data['candles']) > 0:
+                    yield raw_data
+
+        # Windows that were not requested yet are dropped if download fails or is interrupted
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def request_window(self, finsec, window):
+        """
+        Requests candles of a window, retrying with exponential backoff.
+
+        :param finsec: (str) Selected Financial Security
+        :param window: (tuple of datetime.datetime) Start and end of window (end is None for the last window)
+
+        :return: Raw data, only with candles inside the window
+        :rtype: dict
+        """
+        # Last window can't end in the future, it asks for a number of candles instead
+        params = {'granularity': 'M1', 'price': 'B', 'from': window[0].strftime(DATETIME_FORMAT)}
+        if window[1] is None:
+            params['count'] = WINDOW_MINUTES
+        else:
+            params['to'] = window[1].strftime(DATETIME_FORMAT)
+
+        url = '{}/v3/instruments/{}/candles'.format(self.base_url, finsec)
+
+        for retry in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+            except requests.RequestException as error:
+                reason = error
+            else:
+                # Rate limiting and server errors are retried, other client errors won't succeed on a retry
+                if response.status_code == 429 or response.status_code >= 500:
+                    reason = '{} {}'.format(response.status_code, response.text)
+                elif response.status_code >= 400:
+                    raise ValueError('Oanda refused request for {} {}: {} {}'.format(finsec, params,
+                                                                                     response.status_code,
+                                                                                     response.text))
+                else:
+                    raw_data = response.json()
+                    break
+
+            if retry == self.max_retries:
+                raise IOError('Unable to download {} {} from Oanda: {}'.format(finsec, params, reason))
+            time.sleep(self.backoff * 2 ** retry)
+
+        # Candle at the end of a window belongs to the next one
+        if window[1] is not None:
+            end = window[1].strftime(DATETIME_FORMAT)[0:19]
+            raw_data['candles'] = [candle for candle in raw_data['candles'] if candle['time'][0:19] < end]
+
+        return raw_data
+
+    def close(self):
+        self.session.close()
+
+
+def partition_windows(start_date, end_date=None, window_minutes=WINDOW_MINUTES):
+    """
+    Splits a range of datetimes into consecutive windows.
+
+    :param start_date: (datetime.datetime) Start of range (UTC)
+    :param end_date: (datetime.datetime) End of range (UTC), None for now
+    :param window_minutes: (int) Minutes per window
+
+    :return: Start and end of each window, end is None for a window that reaches current time
+    :rtype: list of tuples
+    """
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    end_date = now if end_date is None or end_date > now else end_date
+    step = datetime.timedelta(minutes=window_minutes)
+
+    windows = []
+    while start_date < end_date:
+        window_end = min(start_date + step, end_date)
+        windows.append((start_date, window_end if window_end < now else None))
+        start_date = window_end
+
+    # Routine for a range that starts in the future, still asks for candles from 'start_date' on
+    if len(windows) == 0:
+        windows.append((start_date, None))
+
+    return windows
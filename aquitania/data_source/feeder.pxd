@@ -1,28 +1,39 @@
+from aquitania.data_source.resampler cimport Resampler
 from aquitania.resources.candle cimport Candle
 
 cdef class Feeder:
     cdef public int asset
     cdef list _loaders
     cdef list _candles
+    cdef Resampler _resampler
+    cdef list _signals
+    cdef list _armed
+    cdef list _fed
 
     cdef void feed(self, Candle candle)
 
-    cdef void missing_closed_candles(self, list criteria_table)
+    cdef void feed_frame(self, Candle candle, long long dt, Py_ssize_t r, unsigned char[:, :] is_new,
+                         unsigned char[:, :] is_relevant, long long[:, :] open_time, long long[:, :] close_time,
+                         double[:, :, :] values, long long[:, :] volume)
 
-    cdef void make_candle(self, int ts, Candle candle, list criteria_table)
+    cdef void missing_closed_candles(self, unsigned char[:] criteria_table)
 
-    cdef list generate_criteria_table(self, Candle candle)
+    cdef void new_candle_routine(self, int ts, Candle candle, long long open_time, long long close_time,
+                                 bint is_closing)
 
-    cdef void new_candle_routine(self, int ts, Candle candle)
+    cdef void new_candle(self, int ts, Candle candle, long long open_time, long long close_time)
 
-    cdef void new_candle(self, int ts, Candle candle)
+    cdef void set_values(self, int ts, Candle candle, bint is_relevant, double[:] values, long long volume,
+                         bint is_closing)
 
-    cdef void set_values(self, int ts, Candle candle)
-
-    cdef bint is_closing_candle(self, int ts, Candle candle)
+    cdef void feed_loader(self, int ts)
 
     cdef void store_output(self)
 
-    cpdef exec_df(self, object df)
+    cpdef exec_df(self, object df, bint is_save=*)
+
+    cdef instantiate_first_candle(self, df_line)
+
+cpdef tuple candle_state(Candle candle)
 
-    cdef instantiate_first_candle(self, df_line)
\ No newline at end of file
+cpdef Candle state_candle(int ts, int currency, tuple state)
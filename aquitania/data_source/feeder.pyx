@@ -30,13 +30,32 @@ times. Now I am currently moving this methods inside the Candle class.
 indicators this kind of Feeder makes no sense as it iterates line by line and doesn't leverage on Numpy features. If we
 are only going to process things like SMAs and Bollinger Bands, it is quite easy to make an add-on to calculate this
 directly on Numpy.
+
+18/10/2026 - That add-on is now the NumpyFeeder (numpy_feeder.pyx), that should be used whenever there are no open
+indicators in the Strategy.
+
+18/10/2026 - Candles of larger timestamps are now generated by the Resampler, which computes open and close times and
+running values of all timestamps in arrays. Feeder doesn't call 'Candle.new_ts()' nor does any datetime arithmetic when
+it creates new Candles anymore, it only indexes into those arrays.
+
+18/10/2026 - Signals of each timestamp are found once, at construction. Every time a Loader with signals is fed, its
+timestamp is queued, and '.store_output()' drains the queue to update which timestamps have a signal on, instead of
+going through every indicator of every Loader on every G01 Candle.
+
+18/10/2026 - Added '.state()' and '.set_state()', Feeder goes into state snapshots only with its in-progress Candles.
+
+18/10/2026 - '.exec_df()' can leave output in the OutputBuffers (is_save=False), so IndicatorManager saves output
+only when it also saves a state snapshot, according to its CheckpointPolicy.
 """
 from aquitania.indicator.signal.abstract_signal import AbstractSignal
 from aquitania.indicator.management.indicator_loader cimport IndicatorLoader
 from aquitania.indicator.abstract.indicator_output_abc cimport AbstractIndicatorOutput
+from aquitania.data_source.resampler cimport Resampler
 from aquitania.resources.candle cimport Candle
 from cpython.datetime cimport datetime
 import datetime as dtm
+import numpy as np
+import pandas as pd
 
 cdef class Feeder:
     """
@@ -64,6 +83,44 @@ cdef class Feeder:
         self._loaders = list_of_loaders
         self.asset = asset
         self._candles = None
+        self._resampler = Resampler(len(list_of_loaders))
+
+        # Registry of signals of each timestamp
+        self._signals = [[indicator for indicator in loader.indicator_list if isinstance(indicator, AbstractSignal)]
+                         for loader in list_of_loaders]
+
+        # Timestamps that have a signal on, and queue of fed timestamps that have signals
+        self._armed = [any([signal.last_output[0] for signal in signals]) for signals in self._signals]
+        self._fed = []
+
+    def state(self):
+        """
+        Minimal state needed to resume the Feeder, made of plain Python values.
+
+        :return: Incomplete Candles of the Resampler and current Candle of each timestamp, None before the first Candle
+        :rtype: tuple
+        """
+        if self._candles is None:
+            return None
+
+        return self._resampler.state(), [candle_state(candle) for candle in self._candles]
+
+    def set_state(self, state):
+        """
+        Restores state generated by '.state()'. Indicators need to be restored before, as timestamps that have a signal
+        on come from them.
+
+        :param state: (tuple) Output of '.state()'
+        """
+        # Restores Candles
+        if state is not None:
+            resampler_state, candles = state
+            self._resampler.set_state(resampler_state)
+            self._candles = [state_candle(ts, self.asset, candle) for ts, candle in enumerate(candles)]
+
+        # Timestamps that have a signal on
+        self._armed = [any([signal.last_output[0] for signal in signals]) for signals in self._signals]
+        self._fed = []
 
     def init_build(self, candle):
         """
@@ -74,6 +131,8 @@ cdef class Feeder:
 
         # Initialize variables
         self._candles = self.create_init_candle_array(candle, len(self._loaders))
+        self._resampler.init_candles(pd.Timestamp(candle.datetime).value, candle.open[1], candle.high[1], candle.low[1],
+                                     candle.close[1], candle.volume)
 
     def create_init_candle_array(self, candle, number_of_times):
          return [self.first_candle_ts(candle.new_ts(ts), ts) for ts in range(number_of_times)]
@@ -93,19 +152,45 @@ cdef class Feeder:
 
         :param candle: Input Candle
         """
+        # Generates Candles of all timestamps
+        cdef long long dt = pd.Timestamp(candle.datetime).value
+        cdef tuple frame = self._resampler.resample(np.array([dt]),
+                                                    np.array([[candle.open[1], candle.high[1], candle.low[1],
+                                                               candle.close[1]]]),
+                                                    np.array([candle.volume]))
+
+        self.feed_frame(candle, dt, 0, frame[0], frame[1], frame[2], frame[3], frame[4], frame[5])
+
+    cdef void feed_frame(self, Candle candle, long long dt, Py_ssize_t r, unsigned char[:, :] is_new,
+                         unsigned char[:, :] is_relevant, long long[:, :] open_time, long long[:, :] close_time,
+                         double[:, :, :] values, long long[:, :] volume):
+        """
+        Feeds candle to all Loaders, Candles of all timestamps come from the arrays generated by the Resampler.
+
+        :param candle: Input G01 Candle
+        :param dt: Datetime of G01 Candle in nanoseconds
+        :param r: Row of G01 Candle in Resampler arrays
+        """
         # Goes through every timestamp
-        cdef list criteria_table = self.generate_criteria_table(candle)
+        cdef unsigned char[:] criteria_table = is_new[r]
 
         self.missing_closed_candles(criteria_table)
 
         cdef int ts
 
         for ts in reversed(range(0, 8)):
-            self.make_candle(ts, candle, criteria_table)
+            # Checks if there is the need to create a new Candle
+            if criteria_table[ts]:
+                self.new_candle_routine(ts, candle, open_time[r + 1, ts], close_time[r + 1, ts],
+                                        dt == close_time[r + 1, ts])
+            else:
+                # Check if there is the need to update values (high, low, close)
+                self.set_values(ts, candle, is_relevant[r, ts], values[r + 1, ts], volume[r + 1, ts],
+                                dt == close_time[r + 1, ts])
 
         self.store_output()
 
-    cdef void missing_closed_candles(self, list criteria_table):
+    cdef void missing_closed_candles(self, unsigned char[:] criteria_table):
         """
         This method purpose is to deal with candles that should have closed but didn't because they were actually
         missing from the feed. For example, a candle of '15Min' should close on 08h14, but we only had the 08h13 candle
@@ -118,8 +203,7 @@ cdef class Feeder:
         """
         # Checks if there is a .complete Candle that meets the criteria, if not returns
         cdef int i
-        cdef bint criteria
-        if not any([criteria and not self._candles[i].complete for i, criteria in enumerate(criteria_table)]):
+        if not any([criteria_table[i] and not self._candles[i].complete for i in range(criteria_table.shape[0])]):
             return
 
         # Creates a dummy variable to compare with closing times
@@ -127,8 +211,8 @@ cdef class Feeder:
 
         cdef int ts
         # Gets closing datetime to propagate to all timestamps
-        for ts, criteria in enumerate(criteria_table):
-            if criteria and not self._candles[ts].complete:
+        for ts in range(criteria_table.shape[0]):
+            if criteria_table[ts] and not self._candles[ts].complete:
                 self._candles[ts].complete = True
                 dt = max(self._candles[ts].close_time, dt)
 
@@ -143,134 +227,113 @@ cdef class Feeder:
             self._candles[ts].datetime = dt
             self._candles[ts].close = close
             if self._candles[ts].complete:
-                self._loaders[ts].feed(self._candles[ts])
+                self.feed_loader(ts)
 
         self.store_output()
 
-    cdef void make_candle(self, int ts, Candle candle, list criteria_table):
-        """
-        Creates the Candle a specific timestamp and feeds it to its respective Loader.
-
-        :param ts: Timestamp
-        :param candle: G01 Candle
-        :param criteria_table: criteria table to check if a new Candle should be built
-        """
-
-        # Checks if there is the need to create a new Candle
-        if criteria_table[ts]:
-            self.new_candle_routine(ts, candle)
-        else:
-            # Check if there is the need to update values (high, low, close)
-            self.set_values(ts, candle)
-
-    cdef list generate_criteria_table(self, Candle candle):
-        """
-        Evaluates if it is time to create a new Candle.
-        :param candle: Input Candle
-
-        :return: True if new candle is to be created
-        :rtype: Boolean
-        """
-        cdef Candle candle_ts
-        return [candle.datetime > candle_ts.close_time for candle_ts in self._candles]
-
-    cdef void new_candle_routine(self, int ts, Candle candle):
+    cdef void new_candle_routine(self, int ts, Candle candle, long long open_time, long long close_time,
+                                 bint is_closing):
         """
         Creates new Candle if necessary and feeds indicators the complete candle.
 
         :param ts: Timestamp of Candle to be created
         :param candle: Input G01 Candle
+        :param open_time: Open time of new Candle in nanoseconds
+        :param close_time: Close time of new Candle in nanoseconds
+        :param is_closing: True if G01 Candle is the closing Candle
         """
 
         # Feeds incomplete candle
-        self.new_candle(ts, candle)
-        if self.is_closing_candle(ts, candle):
+        self.new_candle(ts, candle, open_time, close_time)
+        if is_closing:
             # Set correct attributes to candle
             self._candles[ts].complete = True
 
-        self._loaders[ts].feed(self._candles[ts])
+        self.feed_loader(ts)
 
-    cdef void new_candle(self, int ts, Candle candle):
+    cdef void new_candle(self, int ts, Candle candle, long long open_time, long long close_time):
         """
         Creates a new Candle for a given timestamp from a G01 Candle.
 
         :param ts: Timestamp of Candle to be created
         :param candle: Input G01 Candle
+        :param open_time: Open time of new Candle in nanoseconds
+        :param close_time: Close time of new Candle in nanoseconds
         """
         if ts == 0:
             self._candles[ts] = candle
         else:
-            self._candles[ts] = candle.new_ts(ts)
+            self._candles[ts] = Candle(ts, candle.currency, candle.datetime, pd.Timestamp(open_time),
+                                       pd.Timestamp(close_time), candle.open[1], candle.high[1], candle.low[1],
+                                       candle.close[1], candle.volume, False)
 
-    cdef void set_values(self, int ts, Candle candle):
+    cdef void set_values(self, int ts, Candle candle, bint is_relevant, double[:] values, long long volume,
+                         bint is_closing):
         """
         Routine to update incomplete candles of larger timestamps.
 
         :param ts: Timestamp of Candle to be updated
         :param candle: Input G01 Candle
+        :param is_relevant: True if Candle has a new high or low value (proxy to know whether to feed it)
+        :param values: Values of Candle after G01 Candle (open, high, low and close tuples flattened)
+        :param volume: Volume of Candle after G01 Candle
+        :param is_closing: True if G01 Candle is the closing Candle
         """
-        cdef object loader = self._loaders[ts]
-
-        # Proxy to know whether to feed larger timestamps
-        cdef bint is_relevant = False
-
-        # Checks if needs to update high value
-        if candle.high[1] > self._candles[ts].high[1]:
-            self._candles[ts].high = (self._candles[ts].high[0], candle.high[1])
-            self._candles[ts].low = (-candle.high[1], self._candles[ts].low[1])
-            is_relevant = True
-
-        # Check if needs to update low value
-        if candle.low[1] < self._candles[ts].low[1]:
-            self._candles[ts].low = (self._candles[ts].low[0], candle.low[1])
-            self._candles[ts].high = (-candle.low[1], self._candles[ts].high[1])
-            is_relevant = True
+        # Updates high and low values
+        if is_relevant:
+            self._candles[ts].high = (values[2], values[3])
+            self._candles[ts].low = (values[4], values[5])
 
         # Updates close value and volume
         self._candles[ts].close = candle.close
-        self._candles[ts].volume += candle.volume
+        self._candles[ts].volume = volume
         self._candles[ts].datetime = candle.datetime
 
         # Feeds closing candle
-        if self.is_closing_candle(ts, candle):
+        if is_closing:
             # Set correct attributes to candle
             self._candles[ts].complete = True
-            loader.feed(self._candles[ts])
+            self.feed_loader(ts)
         elif is_relevant:
-            loader.feed(self._candles[ts])
+            self.feed_loader(ts)
 
-    cdef bint is_closing_candle(self, int ts, Candle candle):
+    cdef void feed_loader(self, int ts):
         """
-        Routine to know whether a Candle is the closing Candle.
-
-        :param ts: Timestamp of Candle to be updated
-        :param candle: Input G01 Candle
+        Feeds current Candle of a timestamp to its Loader, and queues timestamp if it has signals.
 
-        :return: True if it is the closing Candle
-        :rtype: Boolean
+        :param ts: Timestamp to be fed
         """
-        return candle.datetime == self._candles[ts].close_time
+        self._loaders[ts].feed(self._candles[ts])
+
+        if self._signals[ts]:
+            self._fed.append(ts)
 
     cdef void store_output(self):
-        cdef IndicatorLoader loader, loader_
-        cdef AbstractIndicatorOutput indicator, indicator_
-
-        for ts, loader in enumerate(self._loaders):
-            for indicator in loader.indicator_list:
-                if isinstance(indicator, AbstractSignal) and indicator.last_output[0] and self._candles[ts].complete:
-                    for ts_, loader_ in enumerate(self._loaders):
-                        loader_.store_candle(self._candles[ts_])
-                        for indicator_ in loader_.indicator_list:
-                            indicator_.save_output()
-                    break
-
-    cpdef exec_df(self, object df):
         """
-        Feed all Candles of DataFrame to the instantiated indicators.
+        Stores output of all indicators once for every timestamp that has a signal on and a complete Candle.
+        """
+        cdef IndicatorLoader loader
+        cdef AbstractIndicatorOutput indicator
+        cdef int ts
+
+        # Drains queue of fed timestamps, checking whether their signals are on
+        while self._fed:
+            ts = self._fed.pop()
+            self._armed[ts] = any([signal.last_output[0] for signal in self._signals[ts]])
 
-        Every time it saves the output into disk it yields so that the IndicatorManager can pickle_state its state.
+        for ts in range(len(self._loaders)):
+            if self._armed[ts] and self._candles[ts].complete:
+                for ts_, loader in enumerate(self._loaders):
+                    loader.store_candle(self._candles[ts_])
+                    for indicator in loader.indicator_list:
+                        indicator.save_output()
+
+    cpdef exec_df(self, object df, bint is_save=True):
+        """
+        Feed all Candles of DataFrame to the instantiated indicators.
 
         :param df: (pandas DataFrame) Candles to be fed
+        :param is_save: (bool) False to keep output in memory until '.save_output()' is called
         """
         # If DataFrame is empty finishes process
         if df.shape[0] == 0:
@@ -286,6 +349,19 @@ cdef class Feeder:
         cdef float close
         cdef int volume
         cdef Candle candle
+        cdef Py_ssize_t r = 0
+
+        # Generates Candles of all timestamps (prices go through C float, exactly as the Candles below)
+        datetimes = df.index.values.astype('datetime64[ns]').view(np.int64)
+        prices = df[['open', 'high', 'low', 'close']].values.astype(np.float32)
+        cdef tuple frame = self._resampler.resample(datetimes, prices, df['volume'].values)
+        cdef long long[:] dts = datetimes
+        cdef unsigned char[:, :] is_new = frame[0]
+        cdef unsigned char[:, :] is_relevant = frame[1]
+        cdef long long[:, :] open_time = frame[2]
+        cdef long long[:, :] close_time = frame[3]
+        cdef double[:, :, :] values = frame[4]
+        cdef long long[:, :] volume_ = frame[5]
 
         # Routine to execute the DataFrame
         for dt_tm, open_, high, low, close, volume in df.itertuples():  # itertuples() is much faster than iterrows()
@@ -294,10 +370,12 @@ cdef class Feeder:
             candle = Candle(0, self.asset, dt_tm, dt_tm, dt_tm, open_, high, low, close, volume, True)
 
             # Feeds Candle
-            self.feed(candle)
+            self.feed_frame(candle, dts[r], r, is_new, is_relevant, open_time, close_time, values, volume_)
+            r += 1
 
-        # Finished all Candles, pickle_state it all to disk
-        self.save_output()
+        # Finished all Candles, saves output to disk
+        if is_save:
+            self.save_output()
         return dt_tm
 
     cdef instantiate_first_candle(self, df_line):
@@ -325,7 +403,46 @@ cdef class Feeder:
     def save_output(self):
         # Saves output of indicators
         # TODO consider a less volatile storage than .h5
-        # TODO need to pickle_state state and output at the same time
-
         for loader in self._loaders:
             loader.save_output()
+
+    def output_nbytes(self):
+        """
+        Memory held by output of all loaders that wasn't saved yet.
+
+        :rtype: int
+        """
+        return sum([loader.output_nbytes() for loader in self._loaders])
+
+
+cpdef tuple candle_state(Candle candle):
+    """
+    Values of a Candle as plain Python values, datetimes in nanoseconds.
+
+    :param candle: (Candle) Input Candle
+
+    :rtype: tuple
+    """
+    return (pd.Timestamp(candle.datetime).value, pd.Timestamp(candle.open_time).value,
+            pd.Timestamp(candle.close_time).value, candle.open, candle.high, candle.low, candle.close, candle.volume,
+            candle.complete)
+
+
+cpdef Candle state_candle(int ts, int currency, tuple state):
+    """
+    Instantiates Candle from the output of 'candle_state()'.
+
+    :param ts: (int) Timestamp
+    :param currency: (int) Asset
+    :param state: (tuple) Output of 'candle_state()'
+
+    :rtype: Candle
+    """
+    dt, open_time, close_time, open_, high, low, close, volume, complete = state
+
+    # Instantiates Candle and sets (down, up) tuples as they were
+    cdef Candle candle = Candle(ts, currency, pd.Timestamp(dt), pd.Timestamp(open_time), pd.Timestamp(close_time),
+                                open_[1], high[1], low[1], close[1], volume, complete)
+    candle.open, candle.high, candle.low, candle.close = open_, high, low, close
+
+    return candle
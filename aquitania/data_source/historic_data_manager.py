@@ -21,13 +21,40 @@ FeedManager creates feeds for live usage.
 
 HistoricDataManager creates databases of candles mainly to do historic tests and to create states that will be used
 on live trading.
+
+18/10/2026 - Download -> process -> store pipeline is event-driven: stages block on bounded queues (QUEUE_MAXSIZE
+packages, so a fast downloader waits for storage instead of filling memory) and each stage puts SENTINEL on its output
+queue when it is done, instead of polling queues and shared flags every second with a full garbage collection.
+
+18/10/2026 - A stage that fails keeps consuming its input queue until SENTINEL, so that the stages before it don't
+block forever on a full queue, and each stage reports its exception (or None) on a reports queue. The exception of the
+first stage that reports a failure is raised to the caller after all the stages have finished.
+
+18/10/2026 - Removed '.get_live_data()', live Candles come from LiveDataService.
+
+18/10/2026 - Historic updates run their stages in threads of the current process when stored Candles are less than
+THREADED_GAP old (a few downloads, not worth starting three processes), and in processes for larger gaps, unless
+'is_threaded' is set.
 """
-import time
-import gc
+import datetime
+import queue
+import threading
 import multiprocessing as mp
 import pandas as pd
 import aquitania.resources.datetimefx as dtfx
 
+# Marks end of stream on a queue
+SENTINEL = None
+
+# Maximum number of data packages waiting on each queue
+QUEUE_MAXSIZE = 16
+
+# Seconds between checks for workers that died without reporting
+REPORT_TIMEOUT = 1
+
+# Updates of Candles stored up to this long ago run in threads, instead of processes
+THREADED_GAP = datetime.timedelta(days=3)
+
 
 class HistoricDataManager:
     """
@@ -44,7 +71,16 @@ class HistoricDataManager:
     This class manages the multiprocessing, most of the hard coding is done inside the data_source module.
     """
 
-    def __init__(self, broker_instance, asset, is_san_n_store):
+    def __init__(self, broker_instance, asset, is_san_n_store, is_threaded=None):
+        """
+        Initializes HistoricDataManager.
+
+        :param broker_instance: (DataSource) Object derived from AbstractDataSource
+        :param asset: (str) Asset Name
+        :param is_san_n_store: (bool) True to sanitize Candles database after storing
+        :param is_threaded: (bool) True to update historic database in threads, False in processes, None to choose by
+            age of stored Candles (see THREADED_GAP)
+        """
         # Checks if list or not
         self.asset = asset
 
@@ -53,72 +89,35 @@ class HistoricDataManager:
 
         # TODO improve this sanitize routine for live feed
         self.is_san_n_store = is_san_n_store
+        self.is_threaded = is_threaded
 
-        self.live_start_dates = None
-
-    def get_live_data(self):
+    def update_historic_database(self, q3):
         """
-        Streams live_data through a MultiProcessing Queue().
+        Downloads, processes and stores new Candles.
 
-        :return: Live Candles
-        :rtype: List of Lists
+        :param q3: (Queue) Queue that also receives processed Candles (followed by SENTINEL), None for no live feed
         """
-        # Create queue variables:
-        q1 = mp.Queue()
-        q2 = mp.Queue()
-        q3 = mp.Queue()
-
-        # Manages if candle importing is still ongoing.
-        step1 = mp.Value('i', 1)
-        step2 = mp.Value('i', 1)
-
-        # Assigns a process to each one of the functions below:
-        p = mp.Process(target=self.download_candles, args=(self.get_live_start_dates(), step1, q1))
-        w = mp.Process(target=self.process_data, args=(step1, step2, q1, q2, q3))
-
-        # Start all the multiprocessing
-        p.start()
-        w.start()
-
-        # Wait for the multiprocessing to finish and join all of them.
-        p.join()
-        w.join()
-
-        if not q3.empty():
-            list_of_candles = q3.get()
-            self.live_start_dates = list_of_candles[-1][0]
-            return list_of_candles
-        return None
-
-    def get_live_start_dates(self):
-        if self.live_start_dates is None:
-            return self.get_historic_start_dates()
-        else:
-            return self.live_start_dates
+        start_date = self.get_historic_start_dates()
 
-    def update_historic_database(self, q3):
-        # Create queue variables:
-        q1 = mp.Queue()
-        q2 = mp.Queue()
-
-        # Manages if candle importing is still ongoing.
-        step1 = mp.Value('i', 1)
-        step2 = mp.Value('i', 1)
+        # Create queue variables and workers (threads or processes):
+        is_threaded = is_small_gap(start_date) if self.is_threaded is None else self.is_threaded
+        if is_threaded:
+            q1, q2, reports, worker = queue.Queue(QUEUE_MAXSIZE), queue.Queue(QUEUE_MAXSIZE), queue.Queue(), \
+                                      threading.Thread
+        else:
+            q1, q2, reports, worker = mp.Queue(QUEUE_MAXSIZE), mp.Queue(QUEUE_MAXSIZE), mp.Queue(), mp.Process
 
-        # Assigns a process to each one of the functions below:
-        p = mp.Process(target=self.download_candles, args=(self.get_historic_start_dates(), step1, q1))
-        w = mp.Process(target=self.process_data, args=(step1, step2, q1, q2, q3))
-        z = mp.Process(target=self.add_candles_database, args=(step2, q2))
+        # Assigns a worker to each one of the functions below:
+        workers = [worker(target=self.download_candles, args=(start_date, q1, reports)),
+                   worker(target=self.process_data, args=(q1, q2, q3, reports)),
+                   worker(target=self.add_candles_database, args=(q2, reports))]
 
-        # Start all the multiprocessing
-        p.start()
-        w.start()
-        z.start()
+        # Start all the workers
+        for worker in workers:
+            worker.start()
 
-        # Wait for the multiprocessing to finish and join all of them.
-        p.join()
-        w.join()
-        z.join()
+        # Wait for the workers to finish and raise their errors
+        join_workers(workers, reports)
 
         # Only sanitize on next run
         self.is_san_n_store = False
@@ -126,59 +125,74 @@ class HistoricDataManager:
     def get_historic_start_dates(self):
         return self._broker_instance.get_historic_data_status(self.asset)
 
-    def download_candles(self, start_date, step1, q1):
+    def download_candles(self, start_date, q1, reports):
         """
         Function that manages candle download from the server, uses more specific functions inside broker.
 
-        :broker_instance Is the instance of the broker connection.
-        :q1 Queue 1 is the one that will transport raw data from server download to data processor.
+        :param start_date: (datetime) Date which to start downloading Candles
+        :param q1: (Queue) Transports raw data from server download to data processor, followed by SENTINEL
+        :param reports: (Queue) Receives exception raised by download or None
         """
-        self._broker_instance.candle_downloader(start_date, self.asset, q1)
-        step1.value = 0
-        gc.collect()
-
-    def process_data(self, step1, step2, q1, q2, q3):
+        error = None
+        try:
+            self._broker_instance.candle_downloader(start_date, self.asset, q1)
+        except Exception as e:
+            error = e
+
+        # Following stages finish even if download fails
+        finally:
+            q1.put(SENTINEL)
+            reports.put(error)
+
+    def process_data(self, q1, q2, q3, reports):
         """
-        Function that processes raw data to storage ready data.
+        Function that processes raw data to storage ready data, until it gets SENTINEL.
 
-        :broker_instance Is the instance of the broker connection.
-        :q1 Queue 1 is the one that will transport raw data from server download to data processor.
-        :q2 Queue 2 is the one that will transport processed data to be stored on the computer.
+        :param q1: (Queue) Transports raw data from server download to data processor
+        :param q2: (Queue) Transports processed data to be stored on the computer, None if it is not stored
+        :param q3: (Queue) Transports processed data to live feed, None for no live feed
+        :param reports: (Queue) Receives exception raised by processing or None
         """
-        while bool(step1.value) or not q1.empty():
-            gc.collect()
-            time.sleep(1)
-            while not q1.empty():
-                data_package = q1.get()
+        error = None
+        try:
+            for data_package in consume(q1):
                 c_cndl = self._broker_instance.data_processing_manager(data_package)
 
                 # Checks if object is > 0
                 if len(c_cndl) > 0:
                     # Goes to storage
-                    q2.put(c_cndl)
+                    if q2 is not None:
+                        q2.put(c_cndl)
 
                     # Goes to live feed
-                    if isinstance(q3, mp.queues.Queue):
+                    if q3 is not None:
                         q3.put(c_cndl)
+        except Exception as e:
+            error = e
+
+        # Following stages finish even if processing fails
+        finally:
+            for q in (q2, q3):
+                if q is not None:
+                    q.put(SENTINEL)
 
-        step2.value = 0
+        # Download doesn't block on a full queue if processing fails
+        if error is not None:
+            drain(q1)
+        reports.put(error)
 
-    def add_candles_database(self, step2, q2):
+    def add_candles_database(self, q2, reports):
         """
-        Function that stores process data in the select
-        
-        :broker_instance Is the instance of the broker connection.
-        :q2 Queue 2 is the one that will transport processed data to be stored on the computer.
+        Function that stores process data in the select storage system, until it gets SENTINEL.
+
+        :param q2: (Queue) Transports processed data to be stored on the computer
+        :param reports: (Queue) Receives exception raised by storage or None
         """
         # Initializes counter to verify if it is necessary to sanitize candles
-        size = 0
-
-        while bool(step2.value) or not q2.empty():
-            gc.collect()
-            time.sleep(1)
-            while q2.empty() is False:
-                list_candles = q2.get()
+        error, size = None, 0
 
+        try:
+            for list_candles in consume(q2):
                 # Creates pd.DataFrame in case it is already not, it is here and not in step1 for performance reasons
                 if not isinstance(list_candles, pd.DataFrame):
                     list_candles = pd.DataFrame(list_candles,
@@ -189,8 +203,122 @@ class HistoricDataManager:
                 if list_candles.shape[0] > 0:
                     self._broker_instance.store(list_candles)
                     size += list_candles.shape[0]
+        except Exception as e:
+            error = e
+
+            # Processing doesn't block on a full queue if storage fails
+            drain(q2)
+
+        try:
+            # Sanitizes candles (remove duplicates if any) in case it fetched more than 500 candles
+            if error is None and size > 500:
+                print('{}Sanitizing {} candles database.'.format(dtfx.now(), self.asset))
+                self._broker_instance.sanitize(self.asset)
+        except Exception as e:
+            error = e
+        finally:
+            reports.put(error)
+
+
+def consume(q):
+    """
+    Yields packages of a queue until SENTINEL (compared by identity, as packages may be DataFrames).
+
+    :param q: (Queue) Queue to be consumed
+    """
+    package = q.get()
+    while package is not SENTINEL:
+        yield package
+        package = q.get()
+
+
+def drain(q):
+    """
+    Discards packages of a queue until SENTINEL.
+
+    :param q: (Queue) Queue to be drained
+    """
+    for _ in consume(q):
+        pass
+
+
+def join_workers(workers, reports):
+    """
+    Waits for the report of each pipeline stage, joins their workers and raises the first exception reported.
+
+    Reports are read before joining, as a process doesn't finish until the data it put on a multiprocessing Queue is
+    consumed. A worker that dies without reporting (crashed process, exception that can't be pickled) doesn't block it.
+
+    :param workers: (list of Thread or Process) Pipeline stages, in order
+    :param reports: (Queue) Receives one exception or None from each stage
+    """
+    errors = []
+    while len(errors) < len(workers):
+        # Reports of workers that are already dead are all on the queue
+        is_alive = any(worker.is_alive() for worker in workers)
+        try:
+            errors.append(reports.get(timeout=REPORT_TIMEOUT))
+        except queue.Empty:
+            # A process that crashes doesn't report and doesn't drain its input, the other stages are terminated
+            crashed = [worker for worker in workers if getattr(worker, 'exitcode', None)]
+            if len(crashed) > 0:
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+                errors.append(RuntimeError('{} exited with code {}'.format(crashed[0].name, crashed[0].exitcode)))
+                break
+
+            if not is_alive:
+                errors.append(RuntimeError('Pipeline stage finished without reporting'))
+                break
+
+    for worker in workers:
+        worker.join()
+
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def concat_packages(packages):
+    """
+    Concatenates processed data packages into a single one.
+
+    :param packages: (list) Processed data packages (lists of Candles or DataFrames)
+
+    :return: Processed Candles
+    :rtype: list of lists or pandas DataFrame
+    """
+    if isinstance(packages[0], pd.DataFrame):
+        return pd.concat(packages)
+
+    return [candle for package in packages for candle in package]
+
+
+def last_candle_datetime(candles):
+    """
+    Gets datetime of last candle of processed data.
+
+    :param candles: (list of lists or pandas DataFrame) Processed Candles
+
+    :rtype: datetime
+    """
+    if isinstance(candles, pd.DataFrame):
+        return candles.index[-1].to_pydatetime()
+
+    return candles[-1][0]
+
+
+def is_small_gap(start_date):
+    """
+    Checks if stored Candles are recent enough for an update to run in threads.
+
+    :param start_date: (datetime or numpy datetime64) Datetime of last stored Candle (UTC), None if unknown
+
+    :rtype: bool
+    """
+    if start_date is None or pd.isnull(start_date):
+        return False
 
-        # Sanitizes candles (remove duplicates if any) in case it fetched more than 500 candles
-        if size > 500:
-            print('{}Sanitizing {} candles database.'.format(dtfx.now(), self.asset))
-            self._broker_instance.sanitize(self.asset)
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return pd.Timestamp(now) - pd.Timestamp(start_date) <= THREADED_GAP
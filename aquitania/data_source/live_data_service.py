@@ -0,0 +1,119 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created LiveDataService. Live Candles used to be fetched by each IndicatorManager once per minute through
+HistoricDataManager, which created new queues and started a download and a processing process for every asset and
+every minute. LiveDataService is a single long-lived thread per broker instance: it keeps using the same broker
+connection, fetches completed G01 Candles of all subscribed assets once per minute and puts them on a single channel
+(a Queue of (asset, list of Candles) tuples, closed by SENTINEL).
+
+18/10/2026 - An error while fetching an asset is printed and the asset is fetched again on the next minute, it doesn't
+stop the other assets. The channel is only closed by '.stop()', an unexpected error of the service itself is put on the
+channel before SENTINEL and raised to the consumer by '.candles()'.
+"""
+import datetime
+import queue
+import threading
+
+import aquitania.resources.datetimefx as dtfx
+from aquitania.data_source.historic_data_manager import SENTINEL, concat_packages, consume, last_candle_datetime
+
+
+class LiveDataService:
+    def __init__(self, broker_instance, start_dates):
+        """
+        Initializes LiveDataService, which starts fetching Candles on '.start()'.
+
+        :param broker_instance: (DataSource) Object derived from AbstractDataSource
+        :param start_dates: (dict of datetime) Subscribed assets and datetime of their last Candle (Candles after it
+            will be fetched)
+        """
+        self._broker_instance = broker_instance
+        self.start_dates = dict(start_dates)
+        self.channel = queue.Queue()
+
+        # Thread is stopped through an Event, so that it doesn't need to wait for the next minute
+        self._is_stopped = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops fetching Candles, channel gets SENTINEL after last fetched Candles.
+        """
+        self._is_stopped.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def candles(self):
+        """
+        Yields Candles put on channel until service is stopped.
+
+        :return: Asset Name and its new Candles
+        :rtype: Generator of tuples
+        :raises Exception: Unexpected error that stopped the service
+        """
+        for package in consume(self.channel):
+            if isinstance(package, Exception):
+                raise package
+            yield package
+
+    def run(self):
+        """
+        Fetches Candles of all subscribed assets at the start of every minute, until it is stopped.
+        """
+        try:
+            while not self._is_stopped.is_set():
+                for asset in list(self.start_dates):
+                    # An asset that fails doesn't stop the others, it is fetched again on the next minute
+                    try:
+                        self.fetch(asset)
+                    except Exception as error:
+                        print('{}Unable to fetch live candles of {}: {!r}'.format(dtfx.now(), asset, error))
+
+                # Waits for next minute
+                now = datetime.datetime.now()
+                self._is_stopped.wait(60 - now.second - now.microsecond / 1e6)
+
+        # Consumer raises unexpected errors instead of finishing as if service was stopped
+        except Exception as error:
+            self.channel.put(error)
+
+        finally:
+            self.channel.put(SENTINEL)
+
+    def fetch(self, asset):
+        """
+        Downloads and processes Candles of an asset after its start date, then puts them on channel.
+
+        :param asset: (str) Asset Name
+        """
+        # Broker downloader puts raw data packages on a queue
+        raw_packages = queue.Queue()
+        self._broker_instance.candle_downloader(self.start_dates[asset], asset, raw_packages)
+
+        packages = []
+        while not raw_packages.empty():
+            package = self._broker_instance.data_processing_manager(raw_packages.get())
+            if len(package) > 0:
+                packages.append(package)
+
+        # Routine for new Candles
+        if len(packages) > 0:
+            candles = concat_packages(packages)
+            self.start_dates[asset] = last_candle_datetime(candles)
+            self.channel.put((asset, candles))
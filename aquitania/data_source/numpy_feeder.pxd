@@ -0,0 +1,21 @@
+from aquitania.data_source.resampler cimport Resampler
+
+cdef class NumpyFeeder:
+    cdef public int asset
+    cdef list _loaders
+    cdef list _signals
+    cdef Resampler _resampler
+    cdef object _complete
+
+    cpdef exec_df(self, object df, object pool=*, bint is_save=*)
+
+    cdef instantiate_first_candle(self, df_line)
+
+    cdef tuple scan(self, long long[:] dts, unsigned char[:, :] is_new, unsigned char[:, :] is_relevant,
+                    long long[:, :] close_time)
+
+    cdef list feed_indicators(self, tuple events, object values, object volume)
+
+    cdef list feed_indicators_parallel(self, tuple events, object values, object volume, object pool)
+
+    cdef void store_output(self, object dts, tuple events, tuple gaps, object row_complete, list outputs)
@@ -0,0 +1,431 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+NumpyFeeder is the add-on foreseen on the Feeder notes of 21/04/2018: a Feeder that leverages on Numpy for strategies
+that don't have any event based indicators.
+
+18/10/2026 - Created NumpyFeeder. It walks the G01 arrays in a single typed loop applying exactly the same rules of the
+Feeder (including the gap routine of '.missing_closed_candles()'), but instead of instantiating Candles and feeding them
+one by one, it collects the closed Candles of every timestamp into a CandleArray, feeds each indicator only once per
+DataFrame through '.indicator_logic_batch()' and stores the output of all signals in a few NumPy operations. The output
+is the same as the one generated by the Feeder.
+
+It only works with closed indicators (is_open=False) that implement '.indicator_logic_batch()'.
+
+18/10/2026 - Candle values and closing times now come from the Resampler (resampler.pyx), NumpyFeeder only keeps track
+of which Candles are complete.
+
+18/10/2026 - Timestamps are independent once closed Candles are selected, so '.exec_df()' accepts a multiprocessing Pool
+to feed the indicators of each timestamp in a different process. Candles are shared with worker processes through
+shared memory, indicators travel to workers and come back with their new state.
+
+18/10/2026 - Added '.state()' and '.set_state()' for state snapshots, same as Feeder.
+
+18/10/2026 - Output can be kept in memory after '.exec_df()' (is_save=False), same as Feeder.
+"""
+import multiprocessing
+import numpy as np
+import pandas as pd
+
+from multiprocessing import resource_tracker, shared_memory
+
+from aquitania.data_source.resampler cimport Resampler
+from aquitania.indicator.signal.abstract_signal import AbstractSignal
+from aquitania.indicator.management.indicator_loader cimport IndicatorLoader
+from aquitania.resources.candle_array import CandleArray
+
+# datetime(1970, 1, 2) in nanoseconds, the dummy datetime Feeder uses to compare closing times
+cdef long long DUMMY_CLOSE_TIME = 86400000000000
+
+cdef class NumpyFeeder:
+    """
+    NumpyFeeder is an object that will receive as input G01 Candles in columnar form and generate closed candles of
+    several timestamps:
+
+        1. G01
+        2. G05
+        3. G15
+        4. G30
+        5. G60
+        6. Daily
+        7. Weekly
+        8. Monthly
+    """
+
+    def __init__(self, list list_of_loaders, int asset):
+        """
+        NumpyFeeder class is initialized with the list_of_loaders to whom the Candles will be fed.
+
+        :param list_of_loaders: List of Loaders, each element in the list refers to a timestamp.
+        """
+
+        # Initialize variables
+        self._loaders = list_of_loaders
+        self.asset = asset
+        self._resampler = Resampler(len(list_of_loaders))
+        self._complete = None
+
+        # Open indicators need every incomplete Candle, they don't work in batch
+        for loader in list_of_loaders:
+            for indicator in loader.indicator_list:
+                if indicator.is_open:
+                    raise ValueError('NumpyFeeder only works with closed indicators, {} is open.'.format(indicator.id))
+
+        # Position of the signals of each timestamp in its indicator list
+        self._signals = [[i for i, indicator in enumerate(loader.indicator_list) if isinstance(indicator, AbstractSignal)]
+                         for loader in list_of_loaders]
+
+    def state(self):
+        """
+        Minimal state needed to resume the NumpyFeeder, made of plain Python values.
+
+        :return: Incomplete Candles of the Resampler and their completeness, None before the first Candle
+        :rtype: tuple
+        """
+        if self._complete is None:
+            return None
+
+        return self._resampler.state(), self._complete.tolist()
+
+    def set_state(self, state):
+        """
+        Restores state generated by '.state()'.
+
+        :param state: (tuple) Output of '.state()'
+        """
+        if state is not None:
+            resampler_state, complete = state
+            self._resampler.set_state(resampler_state)
+            self._complete = np.array(complete, dtype=np.uint8)
+
+    cpdef exec_df(self, object df, object pool=None, bint is_save=True):
+        """
+        Feed all Candles of DataFrame to the instantiated indicators.
+
+        :param df: (pandas DataFrame) Candles to be fed
+        :param pool: (multiprocessing Pool) If set, each timestamp is fed in a worker process of this pool
+        :param is_save: (bool) False to keep output in memory until '.save_output()' is called
+        """
+        # If DataFrame is empty finishes process
+        if df.shape[0] == 0:
+            return
+
+        # Instantiate the first candle
+        self.instantiate_first_candle(df.iloc[0])
+
+        # Generates Candles of all timestamps (prices go through C float, exactly as in Feeder.exec_df())
+        dts = df.index.values.astype('datetime64[ns]').view(np.int64)
+        prices = df[['open', 'high', 'low', 'close']].values.astype(np.float32)
+        is_new, is_relevant, open_time, close_time, values, volume = self._resampler.resample(dts, prices,
+                                                                                              df['volume'].values)
+
+        # Selects closed Candles of all timestamps
+        events, gaps, row_complete = self.scan(dts, is_new, is_relevant, close_time)
+
+        # Feeds indicators and stores output of every signal
+        if pool is None:
+            outputs = self.feed_indicators(events, values, volume)
+        else:
+            outputs = self.feed_indicators_parallel(events, values, volume, pool)
+        self.store_output(dts, events, gaps, row_complete, outputs)
+
+        # Finished all Candles, saves output to disk
+        if is_save:
+            self.save_output()
+        return df.index[-1]
+
+    cdef instantiate_first_candle(self, df_line):
+        """
+        NumpyFeeder needs to have the incomplete Candles already instantiated to work with, it creates them the same
+        way as Feeder.init_build() does.
+
+        :param df_line: (pandas Series) First line of Candles DataFrame
+        """
+        # If Candle states are already initialized there is no need to run this method
+        if self._complete is not None:
+            return
+
+        # Get Candle Values
+        open_, high, low, close, volume = df_line.values
+        cdef int ts
+
+        # Initializes Candle states
+        self._resampler.init_candles(pd.Timestamp(df_line.name).value, open_, high, low, close, volume)
+        self._complete = np.array([ts == 0 for ts in range(len(self._loaders))], dtype=np.uint8)
+
+    cdef tuple scan(self, long long[:] dts, unsigned char[:, :] is_new, unsigned char[:, :] is_relevant,
+                    long long[:, :] close_time):
+        """
+        Runs the Feeder routines on every G01 Candle and selects every closed Candle that would be fed to the loaders.
+
+        Each fed Candle is saved with its row in the Resampler arrays and with a key that orders it in time: 2 * row on
+        the gap routine (missing closed candles) and 2 * row + 1 on the routine of the Candle itself.
+
+        :param dts: (numpy Array) G01 datetimes in nanoseconds
+        :param is_new: (numpy Array) True where Resampler created a new Candle
+        :param is_relevant: (numpy Array) True where Resampler updated high or low values
+        :param close_time: (numpy Array) Close times generated by Resampler
+
+        :return: fed Candles of each timestamp, gap routines and Candle completeness after each row
+        :rtype: tuple of tuples
+        """
+        # Initialize variables
+        cdef Py_ssize_t n = dts.shape[0], n_ts = len(self._loaders), r, ts, m, n_gaps = 0
+        cdef long long dt, gap_dt
+        cdef bint is_gap
+        cdef unsigned char[:] complete = self._complete
+
+        # Each row may feed a timestamp twice: once on the gap routine and once on its own routine
+        ev_row_arr = np.empty((n_ts, 2 * n), dtype=np.int64)
+        ev_key_arr = np.empty((n_ts, 2 * n), dtype=np.int64)
+        n_events_arr = np.zeros(n_ts, dtype=np.int64)
+        cdef long long[:, :] ev_row = ev_row_arr
+        cdef long long[:, :] ev_key = ev_key_arr
+        cdef long long[:] n_events = n_events_arr
+
+        # Gap routines and Candle completeness after each row (needed to know when signals are stored)
+        gap_key_arr = np.empty(n, dtype=np.int64)
+        gap_dt_arr = np.empty(n, dtype=np.int64)
+        gap_complete_arr = np.empty((n, n_ts), dtype=np.uint8)
+        row_complete_arr = np.empty((n, n_ts), dtype=np.uint8)
+        cdef long long[:] gap_key = gap_key_arr
+        cdef long long[:] gap_dts = gap_dt_arr
+        cdef unsigned char[:, :] gap_complete = gap_complete_arr
+        cdef unsigned char[:, :] row_complete = row_complete_arr
+
+        for r in range(n):
+            dt = dts[r]
+
+            # Same as Feeder.missing_closed_candles()
+            is_gap = False
+            for ts in range(n_ts):
+                if is_new[r, ts] and not complete[ts]:
+                    is_gap = True
+
+            if is_gap:
+                gap_dt = DUMMY_CLOSE_TIME
+                for ts in range(n_ts):
+                    if is_new[r, ts] and not complete[ts]:
+                        complete[ts] = True
+                        gap_dt = max(close_time[r, ts], gap_dt)
+
+                for ts in reversed(range(1, n_ts)):
+                    if complete[ts]:
+                        m = n_events[ts]
+                        ev_row[ts, m], ev_key[ts, m] = r, 2 * r
+                        n_events[ts] = m + 1
+
+                gap_key[n_gaps] = 2 * r
+                gap_dts[n_gaps] = gap_dt
+                gap_complete[n_gaps, 0] = True
+                for ts in range(1, n_ts):
+                    gap_complete[n_gaps, ts] = is_new[r, ts]
+                n_gaps += 1
+
+            # Same as Feeder.new_candle_routine() and Feeder.set_values()
+            for ts in reversed(range(n_ts)):
+                if is_new[r, ts]:
+                    complete[ts] = ts == 0 or dt == close_time[r + 1, ts]
+                elif dt == close_time[r + 1, ts]:
+                    complete[ts] = True
+                elif not (is_relevant[r, ts] and complete[ts]):
+                    continue
+
+                if complete[ts]:
+                    m = n_events[ts]
+                    ev_row[ts, m], ev_key[ts, m] = r + 1, 2 * r + 1
+                    n_events[ts] = m + 1
+
+            row_complete[r, :] = complete
+
+        events = tuple((ev_row_arr[ts, :n_events[ts]], ev_key_arr[ts, :n_events[ts]]) for ts in range(n_ts))
+        gaps = (gap_key_arr[:n_gaps], gap_dt_arr[:n_gaps], gap_complete_arr[:n_gaps])
+
+        return events, gaps, row_complete_arr
+
+    cdef list feed_indicators(self, tuple events, object values, object volume):
+        """
+        Feeds the closed Candles of each timestamp to its indicators at once.
+
+        :param events: Fed Candles of each timestamp
+        :param values: (numpy Array) Candle values generated by Resampler
+        :param volume: (numpy Array) Candle volumes generated by Resampler
+
+        :return: For each timestamp, for each indicator, output before the DataFrame followed by output of each Candle
+        :rtype: list of lists of lists
+        """
+        cdef IndicatorLoader loader
+
+        return [feed_batch(loader.indicator_list, CandleArray(values[events[ts][0], ts], volume[events[ts][0], ts]))
+                for ts, loader in enumerate(self._loaders)]
+
+    cdef list feed_indicators_parallel(self, tuple events, object values, object volume, object pool):
+        """
+        Same as '.feed_indicators()', but the indicators of each timestamp are fed in a worker process of 'pool'.
+
+        :param events: Fed Candles of each timestamp
+        :param values: (numpy Array) Candle values generated by Resampler
+        :param volume: (numpy Array) Candle volumes generated by Resampler
+        :param pool: (multiprocessing Pool) Worker processes
+
+        :return: For each timestamp, for each indicator, output before the DataFrame followed by output of each Candle
+        :rtype: list of lists of lists
+        """
+        cdef IndicatorLoader loader
+        cdef list results = None
+
+        # Shares Candles of all timestamps with worker processes
+        shm = shared_memory.SharedMemory(create=True, size=values.nbytes + volume.nbytes)
+        try:
+            np.ndarray(values.shape, np.float64, shm.buf)[:] = values
+            np.ndarray(volume.shape, np.int64, shm.buf, values.nbytes)[:] = volume
+
+            # Indicators travel without their OutputBuffer, which stays in this process
+            for loader in self._loaders:
+                for indicator in loader.indicator_list:
+                    indicator.output_buffer = None
+
+            results = pool.map(feed_loader, [(shm.name, values.shape, volume.shape, ts, events[ts][0],
+                                              loader.indicator_list) for ts, loader in enumerate(self._loaders)])
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+            # Routine for when a worker failed, original indicators get their OutputBuffer back
+            if results is None:
+                for loader in self._loaders:
+                    loader.replace_indicators(loader.indicator_list)
+
+        # Indicators come back with their state after the DataFrame
+        for loader, (indicator_list, output) in zip(self._loaders, results):
+            loader.replace_indicators(indicator_list)
+
+        return [output for indicator_list, output in results]
+
+    cdef void store_output(self, object dts, tuple events, tuple gaps, object row_complete, list outputs):
+        """
+        Stores output of all indicators every time a signal is True on a complete Candle, the same way as
+        Feeder.store_output() does after every fed G01 Candle.
+
+        :param dts: (numpy Array) G01 datetimes in nanoseconds
+        :param events: Fed Candles of each timestamp
+        :param gaps: Gap routines
+        :param row_complete: Candle completeness after each row
+        :param outputs: Output of each indicator
+        """
+        cdef IndicatorLoader loader
+        cdef Py_ssize_t row
+
+        # Builds every moment in which Feeder would store output, ordered in time
+        gap_key, gap_dt, gap_complete = gaps
+        keys = np.concatenate([gap_key, 2 * np.arange(dts.shape[0]) + 1])
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+        datetimes = np.concatenate([gap_dt, dts])[order]
+        complete = np.concatenate([gap_complete, row_complete])[order].astype(bool)
+
+        # Counts how many times output is stored at each moment (once for each timestamp that has a signal)
+        n_stores = np.zeros(keys.shape[0], dtype=np.int64)
+        for ts, signals in enumerate(self._signals):
+            if not signals:
+                continue
+
+            # Position of the last Candle fed to the timestamp at each moment
+            position = np.searchsorted(events[ts][1], keys, side='right')
+            is_signal = np.zeros(keys.shape[0], dtype=bool)
+            for i in signals:
+                is_signal |= np.array([bool(output[0]) for output in outputs[ts][i]])[position]
+
+            n_stores += is_signal & complete[:, ts]
+
+        # Routine for when no signal was found
+        rows = np.repeat(np.arange(keys.shape[0]), n_stores)
+        if rows.shape[0] == 0:
+            return
+
+        # Stores Candles and output of all indicators
+        for ts, loader in enumerate(self._loaders):
+            row = loader.store_candles(datetimes[rows], complete[rows, ts])
+            position = np.searchsorted(events[ts][1], keys[rows], side='right').tolist()
+            for indicator, output in zip(loader.indicator_list, outputs[ts]):
+                indicator.save_outputs(row, [output[i] for i in position])
+
+    def save_output(self):
+        # Saves output of indicators
+        for loader in self._loaders:
+            loader.save_output()
+
+    def output_nbytes(self):
+        """
+        Memory held by output of all loaders that wasn't saved yet.
+
+        :rtype: int
+        """
+        return sum([loader.output_nbytes() for loader in self._loaders])
+
+
+def timestamp_pool(int n_processes):
+    """
+    Instantiates a Pool of worker processes for NumpyFeeder.exec_df().
+
+    Resource tracker is started before workers, otherwise each worker would start its own tracker and unlink, when
+    finished, shared memory blocks that belong to NumpyFeeder.
+
+    :param n_processes: (int) Number of worker processes
+
+    :return: Pool of worker processes
+    :rtype: multiprocessing Pool
+    """
+    resource_tracker.ensure_running()
+    return multiprocessing.Pool(n_processes)
+
+
+def feed_batch(list indicator_list, object candles):
+    """
+    Feeds closed Candles of a timestamp to its indicators at once.
+
+    :param indicator_list: (list of indicators) Indicators of a timestamp
+    :param candles: (CandleArray) Closed Candles
+
+    :return: For each indicator, output before the Candles followed by output of each Candle
+    :rtype: list of lists
+    """
+    return [[indicator.last_output] + (indicator.feed_batch(candles) if len(candles) > 0 else [])
+            for indicator in indicator_list]
+
+
+def feed_loader(tuple task):
+    """
+    Worker process routine of NumpyFeeder.feed_indicators_parallel().
+
+    :param task: (tuple) Shared memory name, shapes of values and volume, timestamp, rows of closed Candles, indicators
+
+    :return: Indicators with their new state and their output
+    :rtype: tuple
+    """
+    name, values_shape, volume_shape, ts, rows, indicator_list = task
+
+    # Gets closed Candles of the timestamp from shared memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        values = np.ndarray(values_shape, np.float64, shm.buf)
+        volume = np.ndarray(volume_shape, np.int64, shm.buf, values.nbytes)
+        candles = CandleArray(values[rows, ts], volume[rows, ts])
+        del values, volume
+    finally:
+        shm.close()
+
+    return indicator_list, feed_batch(indicator_list, candles)
@@ -0,0 +1,28 @@
+cpdef tuple open_close_times(object dts, int ts)
+
+cdef tuple div_by_sec(object dts, long long duration)
+
+cdef tuple daily_criteria(object dts)
+
+cdef tuple weekly_criteria(object dts)
+
+cdef tuple monthly_criteria(object dts)
+
+cdef object next_market_close(object dts)
+
+cdef object weekdays(object dts)
+
+cdef class Resampler:
+    cdef public int n_ts
+    cdef object _values
+    cdef object _volume
+    cdef object _open_time
+    cdef object _close_time
+
+    cpdef void init_candles(self, long long dt, double open_, double high, double low, double close, long long volume)
+
+    cpdef tuple resample(self, object dts, object prices, object volume)
+
+    cdef void scan(self, long long[:] dts, double[:, :] prices, long long[:] volume, long long[:, :, :] boundaries,
+                   unsigned char[:, :] is_new, unsigned char[:, :] is_relevant, long long[:, :] open_time,
+                   long long[:, :] close_time, double[:, :, :] values, long long[:, :] volume_)
@@ -0,0 +1,288 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+Resampler generates, from arrays of G01 Candles, the Candles of every timestamp before they reach the Feeders.
+
+18/10/2026 - Created Resampler. Feeder used to instantiate a new Candle through 'Candle.new_ts()' and to run the rules
+of 'datetimefx.init_open_close_times()' every time a Candle of a larger timestamp had to be created. Now the open and
+close times of all timestamps are computed once per DataFrame in NumPy, and a single typed loop generates the running
+values (high, low, close and volume) of the Candle of every timestamp after each G01 Candle. Feeder and NumpyFeeder only
+index into those arrays.
+
+18/10/2026 - Added '.state()' and '.set_state()' for state snapshots, the incomplete Candle of each timestamp.
+
+18/10/2026 - Market closes are looked up on 'datetimefx.MARKET_CALENDAR' instead of converting datetimes to New York.
+"""
+import numpy as np
+import pandas as pd
+import aquitania.resources.datetimefx as dtfx
+
+# Timestamps that are simple divisions of time (G05, G15, G30 and G60) and their duration in nanoseconds
+cdef dict TS_DURATION = {1: 300000000000, 2: 900000000000, 3: 1800000000000, 4: 3600000000000}
+
+# Durations in nanoseconds
+cdef long long MINUTE = 60000000000
+cdef long long HOUR = 3600000000000
+cdef long long DAY = 86400000000000
+cdef long long WEEK = 604800000000000
+
+
+cpdef tuple open_close_times(object dts, int ts):
+    """
+    Vectorized version of 'datetimefx.init_open_close_times()'.
+
+    :param dts: (numpy Array) Minute aligned G01 datetimes in nanoseconds
+    :param ts: Timestamp of Candles
+
+    :return: Candle open times, Candle close times (in nanoseconds)
+    :rtype: tuple of 2 numpy Arrays
+    """
+    # This if elif structure is the same of 'datetimefx.init_open_close_times()'
+    if ts == 0:
+        return dts.copy(), dts.copy()
+    elif ts in TS_DURATION:
+        return div_by_sec(dts, TS_DURATION[ts])
+    elif ts == 5:
+        return daily_criteria(dts)
+    elif ts == 6:
+        return weekly_criteria(dts)
+    elif ts == 7:
+        return monthly_criteria(dts)
+    else:
+        raise ValueError('Invalid Candle TimeStamp')
+
+
+cdef tuple div_by_sec(object dts, long long duration):
+    open_time = dts // duration * duration
+    return open_time, open_time + duration - MINUTE
+
+
+cdef tuple daily_criteria(object dts):
+    # Initialize variables
+    open_time = dts // DAY * DAY
+    close_time = open_time + DAY - MINUTE
+    weekday = weekdays(dts)
+
+    # Puts Monday together with Sunday
+    open_time = np.where(weekday == 0, open_time - DAY, open_time)
+    close_time = np.where(weekday == 6, close_time + DAY, close_time)
+
+    # Friday closes with the market
+    is_friday = weekday == 4
+    close_time[is_friday] = next_market_close(dts[is_friday])
+
+    return open_time, close_time
+
+
+cdef tuple weekly_criteria(object dts):
+    # Need to divide in to groups: 1. 3-5 Thursday to Saturday, 2. Other weekdays
+    weekday = weekdays(dts)
+    open_time = np.where((3 <= weekday) & (weekday <= 5), dts // WEEK * WEEK - 4 * DAY, dts // WEEK * WEEK + 3 * DAY)
+
+    # Week closes with the market
+    close_time = open_time + WEEK - MINUTE
+    weekday = weekdays(close_time)
+    is_market_close = (4 <= weekday) & (weekday <= 5)
+    close_time[is_market_close] = next_market_close(dts[is_market_close])
+
+    return open_time, close_time
+
+
+cdef tuple monthly_criteria(object dts):
+    # Monthly rules only change with the month, they are evaluated once per hour and spread to all G01 Candles
+    hours, inverse = np.unique(dts // HOUR * HOUR, return_inverse=True)
+    times = [dtfx.init_open_close_times(pd.Timestamp(hour), 7) for hour in hours.tolist()]
+    open_time = np.array([pd.Timestamp(open_).value for open_, close in times], dtype=np.int64)
+    close_time = np.array([pd.Timestamp(close).value for open_, close in times], dtype=np.int64)
+
+    return open_time[inverse], close_time[inverse]
+
+
+cdef object next_market_close(object dts):
+    """
+    Vectorized version of 'datetimefx.next_market_close()', it gets the next Friday 16h59 in New York.
+
+    :param dts: (numpy Array) GMT datetimes in nanoseconds
+
+    :return: GMT datetimes of next market close in nanoseconds
+    :rtype: numpy Array
+    """
+    # Friday close of market week in seconds
+    close_time = dtfx.MARKET_CALENDAR.week_close(dts // 1000000000)
+
+    # Moves to 16h59 candle, keeping seconds of datetimes
+    return close_time * 1000000000 - MINUTE + dts % MINUTE
+
+
+cdef object weekdays(object dts):
+    # 01/01/1970 was a Thursday
+    return (dts // DAY + 3) % 7
+
+
+cdef class Resampler:
+    """
+    Resampler keeps the incomplete Candle of each timestamp as rows of NumPy arrays, with the same (down, up) tuple
+    convention of the Candle class:
+
+        open[0], open[1], high[0], high[1], low[0], low[1], close[0], close[1]
+    """
+
+    def __init__(self, int n_ts):
+        """
+        Resampler class is initialized with the number of timestamps to be generated.
+
+        :param n_ts: Number of timestamps, starting at G01
+        """
+        # Initialize variables
+        self.n_ts = n_ts
+        self._values = None
+        self._volume = None
+        self._open_time = None
+        self._close_time = None
+
+    cpdef void init_candles(self, long long dt, double open_, double high, double low, double close, long long volume):
+        """
+        Instantiates the incomplete Candles of all timestamps from the first G01 Candle, the same way as Feeder always
+        did.
+
+        :param dt: Datetime of the first G01 Candle in nanoseconds
+        :param open_: Open value
+        :param high: High value
+        :param low: Low value
+        :param close: Close value
+        :param volume: Volume
+        """
+        # It distorts candle to enable feeder to feed first candle of larger timestamps
+        self._values = np.array([(-open_, open_, -low * 0.95, high * 0.95, -high, low, -close, close)] * self.n_ts)
+        self._volume = np.full(self.n_ts, volume, dtype=np.int64)
+
+        # Gets open and close times of all timestamps
+        times = [open_close_times(np.array([dt], dtype=np.int64), ts) for ts in range(self.n_ts)]
+        self._open_time = np.array([open_time[0] for open_time, close_time in times])
+        self._close_time = np.array([close_time[0] for open_time, close_time in times])
+
+    def state(self):
+        """
+        Incomplete Candles of all timestamps as plain Python values, None if Candles were not instantiated yet.
+
+        :return: Open times, close times, Candle values and volumes
+        :rtype: tuple of lists
+        """
+        if self._values is None:
+            return None
+
+        return self._open_time.tolist(), self._close_time.tolist(), self._values.tolist(), self._volume.tolist()
+
+    def set_state(self, state):
+        """
+        Restores incomplete Candles generated by '.state()'.
+
+        :param state: (tuple of lists) Output of '.state()'
+        """
+        if state is None:
+            self._open_time, self._close_time, self._values, self._volume = None, None, None, None
+            return
+
+        open_time, close_time, values, volume = state
+        self._open_time = np.array(open_time, dtype=np.int64)
+        self._close_time = np.array(close_time, dtype=np.int64)
+        self._values = np.array(values, dtype=np.float64)
+        self._volume = np.array(volume, dtype=np.int64)
+
+    cpdef tuple resample(self, object dts, object prices, object volume):
+        """
+        Generates the Candles of all timestamps after each G01 Candle.
+
+        Output arrays that hold Candle values have one more row than input, row 0 is the state before the first G01
+        Candle and row r + 1 the state after G01 Candle r.
+
+        :param dts: (numpy Array) G01 datetimes in nanoseconds
+        :param prices: (numpy Array) G01 open, high, low and close values
+        :param volume: (numpy Array) G01 volumes
+
+        :return: is_new (a new Candle was created), is_relevant (Candle has new high or low), open times, close times,
+        Candle values and volumes
+        :rtype: tuple of numpy Arrays
+        """
+        # Initialize variables
+        cdef Py_ssize_t n = dts.shape[0]
+
+        # Gets open and close times of new Candles
+        times = [open_close_times(dts, ts) for ts in range(self.n_ts)]
+        boundaries = np.array([[open_time for open_time, close_time in times],
+                               [close_time for open_time, close_time in times]])
+
+        # Output arrays, starting from current state
+        is_new = np.zeros((n, self.n_ts), dtype=np.uint8)
+        is_relevant = np.zeros((n, self.n_ts), dtype=np.uint8)
+        open_time = np.empty((n + 1, self.n_ts), dtype=np.int64)
+        close_time = np.empty((n + 1, self.n_ts), dtype=np.int64)
+        values = np.empty((n + 1, self.n_ts, 8))
+        volume_ = np.empty((n + 1, self.n_ts), dtype=np.int64)
+        open_time[0], close_time[0], values[0], volume_[0] = self._open_time, self._close_time, self._values, self._volume
+
+        # Generates Candles
+        self.scan(dts.astype(np.int64), prices.astype(np.float64), volume.astype(np.int64), boundaries, is_new,
+                  is_relevant, open_time, close_time, values, volume_)
+
+        # Saves state for the next DataFrame
+        self._open_time, self._close_time = open_time[n].copy(), close_time[n].copy()
+        self._values, self._volume = values[n].copy(), volume_[n].copy()
+
+        return is_new, is_relevant, open_time, close_time, values, volume_
+
+    cdef void scan(self, long long[:] dts, double[:, :] prices, long long[:] volume, long long[:, :, :] boundaries,
+                   unsigned char[:, :] is_new, unsigned char[:, :] is_relevant, long long[:, :] open_time,
+                   long long[:, :] close_time, double[:, :, :] values, long long[:, :] volume_):
+        """
+        Same rules of 'Feeder.new_candle()' and 'Feeder.set_values()' in a typed loop.
+        """
+        cdef Py_ssize_t r, ts, k
+        cdef long long dt
+
+        for r in range(dts.shape[0]):
+            dt = dts[r]
+
+            for ts in range(self.n_ts):
+
+                # Creates new Candle
+                if dt > close_time[r, ts]:
+                    is_new[r, ts] = True
+                    open_time[r + 1, ts], close_time[r + 1, ts] = boundaries[0, ts, r], boundaries[1, ts, r]
+                    values[r + 1, ts, 0], values[r + 1, ts, 1] = -prices[r, 0], prices[r, 0]
+                    values[r + 1, ts, 2], values[r + 1, ts, 3] = -prices[r, 2], prices[r, 1]
+                    values[r + 1, ts, 4], values[r + 1, ts, 5] = -prices[r, 1], prices[r, 2]
+                    values[r + 1, ts, 6], values[r + 1, ts, 7] = -prices[r, 3], prices[r, 3]
+                    volume_[r + 1, ts] = volume[r]
+                    continue
+
+                # Updates Candle
+                open_time[r + 1, ts], close_time[r + 1, ts] = open_time[r, ts], close_time[r, ts]
+                for k in range(6):
+                    values[r + 1, ts, k] = values[r, ts, k]
+
+                # Checks if needs to update high value
+                if prices[r, 1] > values[r + 1, ts, 3]:
+                    values[r + 1, ts, 3], values[r + 1, ts, 4] = prices[r, 1], -prices[r, 1]
+                    is_relevant[r, ts] = True
+
+                # Check if needs to update low value
+                if prices[r, 2] < values[r + 1, ts, 5]:
+                    values[r + 1, ts, 5], values[r + 1, ts, 2] = prices[r, 2], -prices[r, 2]
+                    is_relevant[r, ts] = True
+
+                # Updates close value and volume
+                values[r + 1, ts, 6], values[r + 1, ts, 7] = -prices[r, 3], prices[r, 3]
+                volume_[r + 1, ts] = volume_[r, ts] + volume[r]
@@ -14,13 +14,26 @@
 .. moduleauthor:: H Roark
 
 12/04/2018 - Created an abstract storage system.
+
+18/10/2026 - Stored data can be loaded for a range of dates ('start' and 'end' on '.get_stored_data()' and
+'.get_stored_data_in_chunks()'), storage systems are expected to seek straight to the selected rows.
+
+18/10/2026 - Columns of indicator output files are looked up in a column catalog (JSON file per broker and asset,
+'data/indicator_index/<broker>/<asset>/catalog.json') that maps each file to its columns, dtypes and range of rows.
+Catalog is updated by '.save_indicators()', so column lookups don't open indicator output files anymore. Files that are
+not in the catalog (saved before it existed) are described once and added to it.
+
+18/10/2026 - Storage systems read indicator output by row coordinates and columns ('.get_indicator_rows()') and find
+rows where a signal is set ('.get_signal_rows()').
 """
 
 import abc
+import json
 import numpy as np
+import pandas as pd
 import os
 
-from aquitania.data_processing.util import generate_folder
+from aquitania.data_processing.util import atomic_write, generate_folder
 from aquitania.data_source.storage.sanity_check import basic_sanitizer
 
 
@@ -30,6 +43,7 @@ class AbstractStorageSystem:
     def __init__(self, broker_name, extension):
         self.candles_folder = '{}/{}'.format('repository', broker_name)
         self.indicator_output_folder = '{}/{}'.format('data/indicator', broker_name)
+        self.indicator_index_folder = '{}/{}'.format('data/indicator_index', broker_name)
         self.extension = extension
 
     def add_data(self, df):
@@ -60,10 +74,22 @@ class AbstractStorageSystem:
         generate_folder('{}/{}/'.format(self.indicator_output_folder, finsec))
         return '{}/{}/{}{}'.format(self.indicator_output_folder, finsec, ts, self.extension)
 
+    def get_indicator_index_filename(self, finsec, ts):
+        generate_folder('{}/{}/'.format(self.indicator_index_folder, finsec))
+        return '{}/{}/{}.npz'.format(self.indicator_index_folder, finsec, ts)
+
     def get_candles_filename(self, finsec):
         generate_folder('{}/{}/'.format(self.candles_folder, finsec))
         return '{}/{}/data{}'.format(self.candles_folder, finsec, self.extension)
 
+    def get_candles_index_filename(self, finsec):
+        generate_folder('{}/{}/'.format(self.candles_folder, finsec))
+        return '{}/{}/data_index.npz'.format(self.candles_folder, finsec)
+
+    def get_candles_extremes_filename(self, finsec):
+        generate_folder('{}/{}/'.format(self.candles_folder, finsec))
+        return '{}/{}/extremes.npz'.format(self.candles_folder, finsec)
+
     def get_candles_controls_filename(self, finsec):
         generate_folder('{}/{}/'.format(self.candles_folder, finsec))
         return '{}/{}/controls{}'.format(self.candles_folder, finsec, self.extension)
@@ -82,52 +108,90 @@ class AbstractStorageSystem:
         """
         return os.path.isfile(self.get_candles_controls_filename(asset))
 
-    def get_dict_of_file_columns(self, asset):
+    def get_signal_rows_filename(self, finsec, signal):
+        generate_folder('{}/{}/'.format(self.indicator_index_folder, finsec))
+        return '{}/{}/{}.rows.npz'.format(self.indicator_index_folder, finsec, signal)
+
+    def get_column_catalog_filename(self, finsec):
+        generate_folder('{}/{}/'.format(self.indicator_index_folder, finsec))
+        return '{}/{}/catalog.json'.format(self.indicator_index_folder, finsec)
+
+    def get_column_catalog(self, asset):
         """
-        Creates a dictionary with keys as timestamp and values as column names.
+        Gets column catalog of indicator output files of an asset. Files that are missing from catalog are described
+        and added to it, files that don't exist anymore are removed from it.
 
         :param asset: (str) Asset Name
 
-        :return: dictionary with keys as timestamp and values as column names
-        :rtype: dict of sets
+        :return: Filename and its number of rows, first and last datetime (nanoseconds) and dtype of each column
+        :rtype: dict of dicts
         """
-        # Sets indicator output folder
-        folder = self.indicator_output_folder
-        generate_folder(folder)
+        # Lists indicator output files of asset (only the folder is read, files aren't opened)
+        folder = '{}/{}'.format(self.indicator_output_folder, asset)
+        filenames = set(os.listdir(folder)) if os.path.isdir(folder) else set()
 
-        # Creates dict
-        columns = {}
+        catalog_filename = self.get_column_catalog_filename(asset)
+        catalog = read_column_catalog(catalog_filename)
 
-        # Gets list of assets
-        for directory in os.listdir(folder):
+        # Routine for catalogs that are out of date
+        if set(catalog.keys()) != filenames:
+            catalog = {filename: catalog[filename] if filename in catalog else
+                       self.describe_indicators('{}/{}'.format(folder, filename)) for filename in filenames}
+            write_column_catalog(catalog_filename, catalog)
 
-            # Checks if there asset is on the list of all assets
-            if asset in directory:
+        return catalog
 
-                # Creates path for desired asset
-                currency_dir = '{}/{}'.format(folder, directory)
+    def update_column_catalog(self, asset, ts, df, n_rows):
+        """
+        Updates column catalog with indicators that were just saved.
 
-                # Iterates through list of files for given asset
-                for the_file in os.listdir(currency_dir):
-                    # Gets filepath for given file
-                    filepath = '{}/{}'.format(currency_dir, the_file)
+        :param asset: (str) Asset Name
+        :param ts: (int) Timestamp id
+        :param df: (pandas DataFrame) Saved indicators
+        :param n_rows: (int) Number of rows of indicator output file after saving 'df'
+        """
+        catalog_filename = self.get_column_catalog_filename(asset)
+        catalog = read_column_catalog(catalog_filename)
+        filename = os.path.basename(self.get_indicator_filename(asset, ts))
+        entry = describe_df(df)
+
+        # Routine for appended rows, extends entry of file
+        previous_rows = n_rows - df.shape[0]
+        if previous_rows > 0:
+            # Entry that is missing or out of date is described again on next read
+            if filename not in catalog or catalog[filename]['n_rows'] != previous_rows:
+                catalog.pop(filename, None)
+                write_column_catalog(catalog_filename, catalog)
+                return
+
+            entry['n_rows'] = int(n_rows)
+            entry['start'] = catalog[filename]['start']
+            entry['columns'] = dict(catalog[filename]['columns'], **entry['columns'])
+
+        catalog[filename] = entry
+        write_column_catalog(catalog_filename, catalog)
 
-                    # Get column name for given file
-                    columns[the_file] = self.get_columns(filepath)
+    def get_dict_of_file_columns(self, asset):
+        """
+        Creates a dictionary with keys as timestamp and values as column names, from column catalog.
 
-        # Returns dictionary with keys as timestamp and values as column names
-        return columns
+        :param asset: (str) Asset Name
+
+        :return: dictionary with keys as timestamp and values as column names
+        :rtype: dict of sets
+        """
+        return {filename: set(entry['columns']) for filename, entry in self.get_column_catalog(asset).items()}
 
     @abc.abstractmethod
     def add_data_storage(self, asset, df):
         pass
 
     @abc.abstractmethod
-    def get_stored_data(self, currency):
+    def get_stored_data(self, currency, start=None, end=None):
         pass
 
     @abc.abstractmethod
-    def get_stored_data_in_chunks(self, currency, chunksize):
+    def get_stored_data_in_chunks(self, currency, chunksize, start=None, end=None):
         pass
 
     @abc.abstractmethod
@@ -139,5 +203,55 @@ class AbstractStorageSystem:
         pass
 
     @abc.abstractmethod
-    def get_columns(self, filepath):
+    def describe_indicators(self, filepath):
+        pass
+
+    @abc.abstractmethod
+    def get_signal_rows(self, asset, signal):
         pass
+
+    @abc.abstractmethod
+    def get_indicator_rows(self, asset, filename, rows=None, columns=None):
+        pass
+
+
+def read_column_catalog(catalog_filename):
+    """
+    Reads column catalog of indicator output files.
+
+    :param catalog_filename: (str) Column catalog file path
+
+    :return: Column catalog, empty if there is no catalog
+    :rtype: dict of dicts
+    """
+    if not os.path.isfile(catalog_filename):
+        return {}
+
+    with open(catalog_filename) as f:
+        return json.load(f)
+
+
+def write_column_catalog(catalog_filename, catalog):
+    """
+    Writes column catalog of indicator output files.
+
+    :param catalog_filename: (str) Column catalog file path
+    :param catalog: (dict of dicts) Column catalog
+    """
+    atomic_write(catalog_filename, lambda f: json.dump(catalog, f), mode='w')
+
+
+def describe_df(df):
+    """
+    Describes indicators DataFrame as an entry of column catalog.
+
+    :param df: (pandas DataFrame) Indicators indexed by datetime
+
+    :return: Number of rows, first and last datetime (nanoseconds, None if empty) and dtype of each column
+    :rtype: dict
+    """
+    datetimes = pd.DatetimeIndex(df.index).as_unit('ns').asi8
+    return {'n_rows': df.shape[0],
+            'start': int(datetimes[0]) if datetimes.shape[0] > 0 else None,
+            'end': int(datetimes[-1]) if datetimes.shape[0] > 0 else None,
+            'columns': {str(column): str(dtype) for column, dtype in df.dtypes.items()}}
@@ -0,0 +1,331 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created a storage system that keeps Candles of each asset in fixed width binary columns, memory-mapped
+through numpy.memmap. Loading chunks or a range of dates only slices the memory maps, there is no parsing and no copy
+of prices or volumes, and appending Candles only writes the new rows at the end of each column.
+
+Files inside the folder of each asset:
+
+    'data.mm' - Header: magic, format version and number of committed rows
+    'datetime.mm' - int64 epoch minutes
+    'open.mm', 'high.mm', 'low.mm', 'close.mm' - float64 prices
+    'volume.mm' - int32 volume
+    'index.mm' - Sidecar index, pairs of (epoch day, first row of that day)
+
+Header is rewritten (temp file and rename) only after columns were appended, so rows of an interrupted append are
+never read and get overwritten by the next append.
+
+18/10/2026 - Sidecar index is also rewritten through a temp file and rename, before the header commits the new rows, so
+an interrupted append can't truncate it. Index entries of rows that were not committed are ignored.
+
+18/10/2026 - Appended columns are flushed to disk before the index and the header are rewritten (both through
+'atomic_write()', which flushes them too), so committed rows survive a power loss as well as a process crash.
+
+Controls and indicator output stay in HDF5 files, exactly as in PandasHDF5.
+"""
+import os
+import struct
+
+import aquitania.resources.references as references
+import pandas as pd
+import numpy as np
+
+from aquitania.data_processing.util import atomic_write, generate_folder
+from aquitania.data_source.storage.pandas_h5 import PandasHDF5
+
+MAGIC = b'AQMM'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHQ')
+
+# Candle columns and their dtypes on disk
+COLUMNS = [('datetime', np.int64), ('open', np.float64), ('high', np.float64), ('low', np.float64),
+           ('close', np.float64), ('volume', np.int32)]
+
+MINUTES_PER_DAY = 1440
+
+
+class NumpyMemmap(PandasHDF5):
+    def __init__(self, broker_name):
+        """
+        Initializes memory-mapped storage system.
+
+        :param broker_name: (str) Broker name (Ex.: oanda, fxcm...)
+        """
+        super().__init__(broker_name=broker_name)
+
+    def get_candles_filename(self, finsec):
+        return self.get_column_filename(finsec, 'data')
+
+    def get_column_filename(self, finsec, column):
+        generate_folder('{}/{}/'.format(self.candles_folder, finsec))
+        return '{}/{}/{}.mm'.format(self.candles_folder, finsec, column)
+
+    def read_n_rows(self, asset):
+        """
+        Reads number of committed rows from header.
+
+        :param asset: (str) Asset Name
+
+        :return: Number of Candles stored
+        :rtype: int
+        """
+        if not self.is_candles(asset):
+            return 0
+
+        with open(self.get_candles_filename(asset), 'rb') as f:
+            magic, version, n_rows = HEADER.unpack(f.read(HEADER.size))
+
+        # Validates header
+        if magic != MAGIC:
+            raise ValueError('{} is not a memory-mapped Candles header.'.format(self.get_candles_filename(asset)))
+        if version != VERSION:
+            raise ValueError('{} has version {}, expected {}.'.format(self.get_candles_filename(asset), version,
+                                                                      VERSION))
+
+        return n_rows
+
+    def write_n_rows(self, asset, n_rows):
+        """
+        Commits number of rows by rewriting header atomically.
+
+        :param asset: (str) Asset Name
+        :param n_rows: (int) Number of Candles stored
+        """
+        atomic_write(self.get_candles_filename(asset), lambda f: f.write(HEADER.pack(MAGIC, VERSION, n_rows)))
+
+    def get_columns_memmap(self, asset):
+        """
+        Memory maps all committed rows of every column.
+
+        :param asset: (str) Asset Name
+
+        :return: Column name and its memory map (None for empty columns)
+        :rtype: dict of numpy memmap
+        """
+        n_rows = self.read_n_rows(asset)
+
+        # np.memmap doesn't map empty files
+        if n_rows == 0:
+            return {column: np.empty(0, dtype=dtype) for column, dtype in COLUMNS}
+
+        # Memory maps are viewed as plain ndarrays, so pandas handles them as any other array
+        return {column: np.memmap(self.get_column_filename(asset, column), dtype=dtype, mode='r',
+                                  shape=(n_rows,)).view(np.ndarray) for column, dtype in COLUMNS}
+
+    def get_index(self, asset):
+        """
+        Reads sidecar index.
+
+        :param asset: (str) Asset Name
+
+        :return: Epoch days and first row of each of them
+        :rtype: numpy Array of shape (n_days, 2)
+        """
+        filename = self.get_column_filename(asset, 'index')
+        if not os.path.isfile(filename):
+            return np.empty((0, 2), dtype=np.int64)
+
+        return np.fromfile(filename, dtype=np.int64).reshape(-1, 2)
+
+    def write_index(self, asset, index):
+        """
+        Rewrites sidecar index atomically.
+
+        :param asset: (str) Asset Name
+        :param index: (numpy Array) Epoch days and first row of each of them
+        """
+        atomic_write(self.get_column_filename(asset, 'index'),
+                     lambda f: f.write(np.ascontiguousarray(index, dtype=np.int64).tobytes()))
+
+    def locate(self, asset, dt, columns=None, index=None):
+        """
+        Row of the first Candle at or after 'dt'. Sidecar index narrows search to a single day, so only a few pages of
+        the datetime column are touched.
+
+        :param asset: (str) Asset Name
+        :param dt: (datetime) Selected datetime
+        :param columns: (dict of numpy memmap) Output of '.get_columns_memmap()', read from disk if not set
+        :param index: (numpy Array) Output of '.get_index()', read from disk if not set
+
+        :return: Row of first Candle at or after 'dt'
+        :rtype: int
+        """
+        columns = self.get_columns_memmap(asset) if columns is None else columns
+        index = self.get_index(asset) if index is None else index
+        minute = -(-pd.Timestamp(dt).value // 60000000000)  # Rounds up to a whole minute
+
+        # Gets rows of the day of 'dt' from sidecar index (entries of an interrupted append are ignored)
+        index = index[index[:, 1] < columns['datetime'].shape[0]]
+        i = np.searchsorted(index[:, 0], minute // MINUTES_PER_DAY, side='right')
+        start = index[i - 1, 1] if i > 0 else 0
+        stop = index[i, 1] if i < index.shape[0] else columns['datetime'].shape[0]
+
+        return int(start + np.searchsorted(columns['datetime'][start:stop], minute))
+
+    def get_stored_data(self, asset, start=None, end=None):
+        """
+        Gets stored data for specific asset, optionally between two dates (both included).
+
+        :param asset: (str) Asset name
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Candles for specified asset, backed by memory maps
+        :rtype: pandas DataFrame
+        """
+        columns = self.get_columns_memmap(asset)
+
+        return columns_to_df(columns, *self.get_row_range(asset, start, end, columns))
+
+    def get_row_range(self, asset, start, end, columns):
+        """
+        Rows of Candles between two dates (both included).
+
+        :param asset: (str) Asset name
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+        :param columns: (dict of numpy memmap) Output of '.get_columns_memmap()'
+
+        :return: First row and last row (not included)
+        :rtype: tuple of int
+        """
+        index = self.get_index(asset)
+
+        first = 0 if start is None else self.locate(asset, start, columns, index)
+        if end is None:
+            last = columns['datetime'].shape[0]
+        else:
+            last = self.locate(asset, pd.Timestamp(end).floor('min') + pd.Timedelta(minutes=1), columns, index)
+
+        return first, max(first, last)
+
+    def get_stored_data_in_chunks(self, asset, chunksize, start=None, end=None):
+        """
+        Generator of stored data for specific asset, 'chunksize' Candles at a time, optionally between two dates (both
+        included).
+
+        :param asset: (str) Asset name
+        :param chunksize: (int) Number of Candles per chunk
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Candles for specified asset, backed by memory maps
+        :rtype: generator of pandas DataFrame
+        """
+        columns = self.get_columns_memmap(asset)
+        first, last = self.get_row_range(asset, start, end, columns)
+
+        for row in range(first, last, chunksize):
+            yield columns_to_df(columns, row, min(row + chunksize, last))
+
+    def save_over_data(self, asset, df):
+        """
+        Overwrites Candles of an asset.
+
+        :param asset: (str) Asset Name
+        :param df: (pandas DataFrame) DataFrame to be store into disk
+        """
+        # DataFrame might be backed by the memory maps that are about to be truncated
+        df = df.copy(deep=True)
+
+        self.write_n_rows(asset, 0)
+        for column, dtype in COLUMNS:
+            open(self.get_column_filename(asset, column), 'wb').close()
+        self.write_index(asset, np.empty((0, 2), dtype=np.int64))
+
+        self.append_columns(asset, df)
+
+    def add_data_storage(self, asset, df):
+        """
+        Saves DataFrame into disk accordingly to asset name.
+
+        :param asset: (str or int) Asset Name
+        :param df: (pandas DataFrame) DataFrame to be store into disk
+        """
+        # Transforms asset (int) into (str) if input was in (int)
+        # TODO improve type handling somewhere else in the code to be able to remove this line
+        if not isinstance(asset, str):
+            asset = references.currencies_list[asset]
+
+        # Save Candles data into disk
+        self.append_columns(asset, df)
+
+        # Update controls with new data
+        self.reset_controls(asset, df.index[-1])
+
+    def append_columns(self, asset, df):
+        """
+        Appends Candles at the end of every column, updates sidecar index and then commits new number of rows.
+
+        :param asset: (str) Asset Name
+        :param df: (pandas DataFrame) Candles to be appended
+        """
+        if df.shape[0] == 0:
+            return
+
+        n_rows = self.read_n_rows(asset)
+        minutes = to_epoch_minutes(df.index)
+
+        # Appends columns (on disk before commit), dropping rows of an append that was interrupted before its commit
+        for column, dtype in COLUMNS:
+            values = minutes if column == 'datetime' else df[column].values
+            with open(self.get_column_filename(asset, column), 'ab') as f:
+                f.truncate(n_rows * np.dtype(dtype).itemsize)
+                np.ascontiguousarray(values, dtype=dtype).tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Appends first row of each new day to sidecar index
+        index = self.get_index(asset)
+        days = minutes // MINUTES_PER_DAY
+        is_new_day = np.r_[True, days[1:] != days[:-1]]
+        if index.shape[0] > 0:
+            index = index[index[:, 1] < n_rows]
+            is_new_day[0] = days[0] != index[-1, 0] if index.shape[0] > 0 else True
+        new_days = np.column_stack([days[is_new_day], np.flatnonzero(is_new_day) + n_rows]).astype(np.int64)
+        self.write_index(asset, np.concatenate([index, new_days]))
+
+        # Commits rows
+        self.write_n_rows(asset, n_rows + df.shape[0])
+
+
+def to_epoch_minutes(datetimes):
+    """
+    Converts datetimes into minutes since 01/01/1970.
+
+    :param datetimes: (pandas DatetimeIndex) Datetimes
+
+    :rtype: numpy Array of int64
+    """
+    return datetimes.values.astype('datetime64[m]').astype(np.int64)
+
+
+def columns_to_df(columns, first, last):
+    """
+    Wraps rows of memory-mapped columns into a DataFrame without copying prices and volumes.
+
+    :param columns: (dict of numpy memmap) Output of 'NumpyMemmap.get_columns_memmap()'
+    :param first: (int) First row
+    :param last: (int) Last row (not included)
+
+    :rtype: pandas DataFrame
+    """
+    index = pd.DatetimeIndex(columns['datetime'][first:last].astype('datetime64[m]').astype('datetime64[ns]'),
+                             name='datetime')
+
+    return pd.DataFrame({column: columns[column][first:last] for column, dtype in COLUMNS[1:]}, index=index,
+                        copy=False)
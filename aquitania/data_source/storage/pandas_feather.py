@@ -14,6 +14,10 @@
 .. moduleauthor:: H Roark
 
 29/05/2018 - Created a feather storage system.
+
+18/10/2026 - Feather files can't be read by rows, ranges of dates are sliced after reading the file.
+
+18/10/2026 - Saving indicators updates the column catalog of the asset.
 """
 import os
 
@@ -22,7 +26,7 @@ import pandas as pd
 import numpy as np
 
 from aquitania.data_processing.util import generate_folder
-from aquitania.data_source.storage.abstract_storage_system import AbstractStorageSystem
+from aquitania.data_source.storage.abstract_storage_system import AbstractStorageSystem, describe_df
 
 
 class PandasFeather(AbstractStorageSystem):
@@ -37,11 +41,13 @@ class PandasFeather(AbstractStorageSystem):
         """
         super().__init__(broker_name=broker_name, extension='.feather')
 
-    def get_stored_data(self, asset):
+    def get_stored_data(self, asset, start=None, end=None):
         """
-        Gets stored data for specific asset.
+        Gets stored data for specific asset, optionally between two dates (both included).
 
         :param asset: (str) Asset name
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
 
         :return: Candles for specified asset
         :rtype: pandas DataFrame
@@ -50,14 +56,17 @@ class PandasFeather(AbstractStorageSystem):
         generate_folder('{}/{}'.format(self.candles_folder, asset))
 
         # Gets DataFrame from disk
-        return pd.read_feather(self.get_candles_filename(asset)).set_index('datetime')
+        df = pd.read_feather(self.get_candles_filename(asset)).set_index('datetime')
+
+        # Selects dates
+        if start is not None or end is not None:
+            df = df.loc[slice(start, end)]
+
+        return df
 
-    def get_stored_data_in_chunks(self, currency, chunksize):
-        df = self.get_stored_data(currency)
-        n_chunks = int(df.shape[0] / chunksize) + 1
-        dividers = [i * chunksize for i in range(1, n_chunks)]
-        # TODO Check if this works
-        return np.split(df, dividers, axis=0)
+    def get_stored_data_in_chunks(self, currency, chunksize, start=None, end=None):
+        df = self.get_stored_data(currency, start, end)
+        return (df.iloc[row:row + chunksize] for row in range(0, df.shape[0], chunksize))
 
     def save_over_data(self, asset, df):
         """
@@ -131,7 +140,56 @@ class PandasFeather(AbstractStorageSystem):
         filename = self.get_indicator_filename(asset, ts)
 
         df.reset_index().to_feather(filename)
+        self.update_column_catalog(asset, ts, df, df.shape[0])
+
+    def describe_indicators(self, filepath):
+        """
+        Describes indicator output file as an entry of column catalog. Feather files can't be read by rows, so the whole
+        file is read, only for files that were saved before the column catalog.
+
+        :param filepath: (str) Indicator output file path
+
+        :return: Number of rows, first and last datetime (nanoseconds, None if empty) and dtype of each column
+        :rtype: dict
+        """
+        df = pd.read_feather(filepath)
+
+        # First column is the index that was reset when saving
+        return describe_df(df.set_index(df.columns[0]))
+
+    def get_signal_rows(self, asset, signal):
+        """
+        Gets rows of indicator output where signal is set and Candle of its timestamp is complete, reading only signal
+        and complete columns.
+
+        :param asset: (str) Asset name
+        :param signal: (str) Signal name (entry)
+
+        :return: Row coordinates of signals
+        :rtype: numpy Array of int64
+        """
+        complete = 'complete_{}'.format(signal[0])
+        df = pd.read_feather(self.get_indicator_filename(asset, signal[0]), columns=[signal, complete])
+
+        return np.flatnonzero(df[complete].astype(bool).values & df[signal].astype(bool).values).astype(np.int64)
+
+    def get_indicator_rows(self, asset, filename, rows=None, columns=None):
+        """
+        Reads only selected rows (by row coordinates) and columns of an indicator output file. Feather files can't be
+        read by rows, rows are selected after reading the file.
+
+        :param asset: (str) Asset name
+        :param filename: (str) Indicator output filename (ex.: 'g.feather')
+        :param rows: (numpy Array) Row coordinates, None for all rows
+        :param columns: (list of str) Columns to be loaded, None for all
+
+        :return: Indicator output
+        :rtype: pandas DataFrame
+        """
+        df = pd.read_feather('{}/{}/{}'.format(self.indicator_output_folder, asset, filename))
+
+        # First column is the index that was reset when saving
+        df = df.set_index(df.columns[0])
+        df = df if columns is None else df[list(columns)]
 
-    def get_columns(self, filepath):
-        # TODO eventually improve performance, check if pandas will support some kind of selection with Feather
-        return pd.read_feather(filepath).columns.values
+        return df if rows is None else df.iloc[rows]
@@ -14,6 +14,16 @@
 .. moduleauthor:: H Roark
 
 12/04/2018 - Created a pandas storage system.
+
+18/10/2026 - Candles and indicator output can be loaded for a range of dates. Each HDF5 table gets a sparse index file
+(.npz) with the datetime of every INDEX_STEP-th row, so a range is read by row coordinates (start, stop) instead of
+reading the whole table and filtering it. Index is extended on every append and rebuilt from the index column of the
+table when it is missing or doesn't match the table.
+
+18/10/2026 - Saving indicators updates the column catalog of the asset.
+
+18/10/2026 - Indicator output can be read by row coordinates and only for some columns ('.get_indicator_rows()'). Rows
+of each signal are kept in a signal row index (.npz), so loaders only read rows where signal is set.
 """
 import os
 
@@ -21,8 +31,17 @@ import aquitania.resources.references as references
 import pandas as pd
 import numpy as np
 
-from aquitania.data_processing.util import generate_folder
-from aquitania.data_source.storage.abstract_storage_system import AbstractStorageSystem
+from aquitania.data_processing.util import atomic_write, generate_folder
+from aquitania.data_source.storage.abstract_storage_system import AbstractStorageSystem, describe_df
+
+# Number of rows between two entries of the sparse index (a day of G01 Candles)
+INDEX_STEP = 1440
+
+# First datetime stored for empty tables
+NO_DATETIME = np.iinfo(np.int64).min
+
+# Number of rows read at a time when scanning indicator output for signal rows
+SCAN_CHUNKSIZE = 10 * INDEX_STEP
 
 
 class PandasHDF5(AbstractStorageSystem):
@@ -37,11 +56,13 @@ class PandasHDF5(AbstractStorageSystem):
         """
         super().__init__(broker_name=broker_name, extension='.h5')
 
-    def get_stored_data(self, asset):
+    def get_stored_data(self, asset, start=None, end=None):
         """
-        Gets stored data for specific asset.
+        Gets stored data for specific asset, optionally between two dates (both included).
         
         :param asset: (str) Asset name
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
         
         :return: Candles for specified asset 
         :rtype: pandas DataFrame
@@ -51,16 +72,232 @@ class PandasHDF5(AbstractStorageSystem):
         generate_folder('{}/{}'.format(self.candles_folder, asset))
 
         # Gets DataFrame from disk
-        with pd.HDFStore(self.get_candles_filename(asset)) as hdf:
-            df = hdf.get(key='G01')
-            return df
+        return self.select_range(self.get_candles_filename(asset), 'G01', self.get_candles_index_filename(asset),
+                                 start, end)
 
-    def get_stored_data_in_chunks(self, asset, chunksize):
+    def get_stored_data_in_chunks(self, asset, chunksize, start=None, end=None):
+        """
+        Generator of stored data for specific asset, optionally between two dates (both included).
+
+        :param asset: (str) Asset name
+        :param chunksize: (int) Number of Candles per chunk
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Candles for specified asset
+        :rtype: generator of pandas DataFrame
+        """
         # Generates candles and asset name if folder don't exist
         generate_folder('{}/{}'.format(self.candles_folder, asset))
 
         # Gets DataFrame from disk
-        return pd.read_hdf(self.get_candles_filename(asset), chunksize=chunksize)
+        return self.select_range_in_chunks(self.get_candles_filename(asset), 'G01',
+                                           self.get_candles_index_filename(asset), chunksize, start, end)
+
+    def get_stored_indicators(self, asset, ts, start=None, end=None):
+        """
+        Gets indicator output of an asset and timestamp, optionally between two dates (both included).
+
+        :param asset: (str) Asset name
+        :param ts: (str) Timestamp letter
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Indicator output
+        :rtype: pandas DataFrame
+        """
+        return self.select_range(self.get_indicator_filename(asset, ts), 'indicators',
+                                 self.get_indicator_index_filename(asset, ts), start, end)
+
+    def get_signal_rows(self, asset, signal):
+        """
+        Gets rows of indicator output where signal is set and Candle of its timestamp is complete. Rows are kept in a
+        signal row index file that is extended with rows appended to the table since it was written, scanning only
+        signal and complete columns, SCAN_CHUNKSIZE rows at a time.
+
+        :param asset: (str) Asset name
+        :param signal: (str) Signal name (entry)
+
+        :return: Row coordinates of signals
+        :rtype: numpy Array of int64
+        """
+        ts = signal[0]
+        complete = 'complete_{}'.format(ts)
+        rows_filename = self.get_signal_rows_filename(asset, signal)
+
+        with pd.HDFStore(self.get_indicator_filename(asset, ts), mode='r') as hdf:
+            n_rows = hdf.get_storer('indicators').nrows
+            first = pd.Timestamp(hdf.select_column('indicators', 'index', start=0, stop=1).iloc[0]).value \
+                if n_rows > 0 else None
+            stored = read_signal_rows(rows_filename)
+
+            # Index that doesn't match table (rewritten or shorter than index) is rebuilt from the first row
+            if stored is None or stored[0] > n_rows or stored[1] != first:
+                stored = 0, first, np.empty(0, dtype=np.int64)
+            elif stored[0] == n_rows:
+                return stored[2]
+
+            # Scans rows appended since index was written
+            rows = [stored[2]]
+            for start in range(stored[0], n_rows, SCAN_CHUNKSIZE):
+                df = hdf.select('indicators', start=start, stop=start + SCAN_CHUNKSIZE, columns=[signal, complete])
+                is_signal = df[complete].astype(bool).values & df[signal].astype(bool).values
+                rows.append(np.flatnonzero(is_signal).astype(np.int64) + start)
+
+        rows = np.concatenate(rows)
+        write_signal_rows(rows_filename, n_rows, first, rows)
+
+        return rows
+
+    def get_indicator_rows(self, asset, filename, rows=None, columns=None):
+        """
+        Reads only selected rows (by row coordinates) and columns of an indicator output file.
+
+        :param asset: (str) Asset name
+        :param filename: (str) Indicator output filename (ex.: 'g.h5')
+        :param rows: (numpy Array) Row coordinates, None for all rows
+        :param columns: (list of str) Columns to be loaded, None for all
+
+        :return: Indicator output
+        :rtype: pandas DataFrame
+        """
+        columns = None if columns is None else list(columns)
+
+        with pd.HDFStore('{}/{}/{}'.format(self.indicator_output_folder, asset, filename), mode='r') as hdf:
+            if rows is None:
+                return hdf.select('indicators', columns=columns)
+
+            # Empty coordinates would select the whole table
+            if len(rows) == 0:
+                return hdf.select('indicators', start=0, stop=0, columns=columns)
+
+            return hdf.select('indicators', where=np.asarray(rows, dtype=np.int64), columns=columns)
+
+    def select_range(self, filename, key, index_filename, start=None, end=None):
+        """
+        Reads rows of a table between two dates (both included), seeking straight to them through the sparse index.
+
+        :param filename: (str) HDF5 file path
+        :param key: (str) Table key
+        :param index_filename: (str) Sparse index file path
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Rows between 'start' and 'end'
+        :rtype: pandas DataFrame
+        """
+        with pd.HDFStore(filename, mode='r') as hdf:
+            # Routine for whole table
+            if start is None and end is None:
+                return hdf.get(key)
+
+            first, last = self.get_row_range(hdf, key, index_filename, start, end)
+            return hdf.select(key, start=first, stop=last).loc[slice(start, end)]
+
+    def select_range_in_chunks(self, filename, key, index_filename, chunksize, start=None, end=None):
+        """
+        Same as '.select_range()', but 'chunksize' rows at a time.
+
+        :param filename: (str) HDF5 file path
+        :param key: (str) Table key
+        :param index_filename: (str) Sparse index file path
+        :param chunksize: (int) Number of rows per chunk
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: Rows between 'start' and 'end'
+        :rtype: generator of pandas DataFrame
+        """
+        with pd.HDFStore(filename, mode='r') as hdf:
+            first, last = self.get_row_range(hdf, key, index_filename, start, end)
+
+            for row in range(first, last, chunksize):
+                df = hdf.select(key, start=row, stop=min(row + chunksize, last))
+
+                # Trims rows of first and last chunks that are out of selected dates
+                if start is not None or end is not None:
+                    df = df.loc[slice(start, end)]
+
+                if df.shape[0] > 0:
+                    yield df
+
+    def get_row_range(self, hdf, key, index_filename, start, end):
+        """
+        Rows of a table that may hold dates between 'start' and 'end', at most one index step more on each side.
+
+        :param hdf: (pandas HDFStore) Opened HDF5 file
+        :param key: (str) Table key
+        :param index_filename: (str) Sparse index file path
+        :param start: (datetime) First datetime to be loaded
+        :param end: (datetime) Last datetime to be loaded
+
+        :return: First row and last row (not included)
+        :rtype: tuple of int
+        """
+        n_rows, datetimes = self.get_sparse_index(hdf, key, index_filename)
+
+        first, last = 0, n_rows
+        if start is not None:
+            first = max(np.searchsorted(datetimes, pd.Timestamp(start).value, 'right') - 1, 0) * INDEX_STEP
+        if end is not None:
+            last = min(np.searchsorted(datetimes, pd.Timestamp(end).value, 'right') * INDEX_STEP, n_rows)
+
+        return int(first), int(last)
+
+    def get_sparse_index(self, hdf, key, index_filename):
+        """
+        Gets sparse index of a table, rebuilding it from the index column of the table if it is missing or doesn't
+        match the table (number of rows or first datetime).
+
+        :param hdf: (pandas HDFStore) Opened HDF5 file
+        :param key: (str) Table key
+        :param index_filename: (str) Sparse index file path
+
+        :return: Number of rows of table and datetime of every INDEX_STEP-th row in nanoseconds
+        :rtype: tuple
+        """
+        n_rows = hdf.get_storer(key).nrows
+        index = read_sparse_index(index_filename)
+
+        # Checks if index matches table
+        if index is not None and index[0] == n_rows:
+            first = hdf.select_column(key, 'index', start=0, stop=1)
+            if n_rows == 0 or pd.Timestamp(first.iloc[0]).value == index[1][0]:
+                return index
+
+        # Rebuilds index
+        datetimes = pd.DatetimeIndex(hdf.select_column(key, 'index').values[::INDEX_STEP])
+        index = n_rows, datetimes.as_unit('ns').asi8
+        write_sparse_index(index_filename, *index)
+
+        return index
+
+    def update_sparse_index(self, filename, key, index_filename, df):
+        """
+        Extends sparse index of a table with rows that were just appended.
+
+        :param filename: (str) HDF5 file path
+        :param key: (str) Table key
+        :param index_filename: (str) Sparse index file path
+        :param df: (pandas DataFrame) Appended rows
+        """
+        with pd.HDFStore(filename, mode='r') as hdf:
+            n_rows = hdf.get_storer(key).nrows
+
+        # Routine for a new table, index is written from scratch
+        previous_rows, datetimes = n_rows - df.shape[0], np.empty(0, dtype=np.int64)
+        if previous_rows > 0:
+            index = read_sparse_index(index_filename)
+
+            # Index that is missing or out of date is rebuilt on next read
+            if index is None or index[0] != previous_rows:
+                remove_sparse_index(index_filename)
+                return
+            datetimes = index[1]
+
+        # Appends datetimes of new rows that are multiples of INDEX_STEP
+        new_datetimes = pd.DatetimeIndex(df.index[-previous_rows % INDEX_STEP::INDEX_STEP]).as_unit('ns').asi8
+        write_sparse_index(index_filename, n_rows, np.concatenate([datetimes, new_datetimes]))
 
     def save_over_data(self, asset, df):
         """
@@ -76,6 +313,9 @@ class PandasHDF5(AbstractStorageSystem):
             # Save new files into disk
             hdf.append(key='G01', value=df, format='table')
 
+        # Sparse index is rebuilt on next read
+        remove_sparse_index(self.get_candles_index_filename(asset))
+
     def add_data_storage(self, asset, df):
         """
         Saves DataFrame into disk accordingly to asset name.
@@ -92,6 +332,7 @@ class PandasHDF5(AbstractStorageSystem):
         # Save Candles data into disk
         with pd.HDFStore(self.get_candles_filename(asset)) as hdf:
             hdf.append(key='G01', value=df, format='table')
+        self.update_sparse_index(self.get_candles_filename(asset), 'G01', self.get_candles_index_filename(asset), df)
 
         # Update controls with new data
         self.reset_controls(asset, df.index[-1])
@@ -168,8 +409,98 @@ class PandasHDF5(AbstractStorageSystem):
         # Saves indicators into disk
         with pd.HDFStore(filename) as hdf:
             hdf.append(key='indicators', value=df, format='table')
+            n_rows = hdf.get_storer('indicators').nrows
+        self.update_sparse_index(filename, 'indicators', self.get_indicator_index_filename(asset, ts), df)
+        self.update_column_catalog(asset, ts, df, n_rows)
+
+    def describe_indicators(self, filepath):
+        """
+        Describes indicator output file as an entry of column catalog, reading only table metadata, first and last row.
+
+        :param filepath: (str) Indicator output file path
+
+        :return: Number of rows, first and last datetime (nanoseconds, None if empty) and dtype of each column
+        :rtype: dict
+        """
+        with pd.HDFStore(filepath, mode='r') as hdf:
+            n_rows = hdf.get_storer('indicators').nrows
+            df = hdf.select('indicators', start=0, stop=0)
+            datetimes = hdf.select_column('indicators', 'index', start=0, stop=1)
+            if n_rows > 1:
+                datetimes = pd.concat([datetimes, hdf.select_column('indicators', 'index', start=n_rows - 1)])
+
+        entry = describe_df(df)
+        entry['n_rows'] = int(n_rows)
+        if n_rows > 0:
+            datetimes = pd.DatetimeIndex(datetimes.values).as_unit('ns').asi8
+            entry['start'], entry['end'] = int(datetimes[0]), int(datetimes[-1])
+
+        return entry
+
+
+def read_sparse_index(index_filename):
+    """
+    Reads sparse index of a HDF5 table.
+
+    :param index_filename: (str) Sparse index file path
+
+    :return: Number of rows of table and datetime of every INDEX_STEP-th row, None if there is no index
+    :rtype: tuple
+    """
+    if not os.path.isfile(index_filename):
+        return None
+
+    with np.load(index_filename) as index:
+        return int(index['n_rows']), index['datetimes']
+
+
+def write_sparse_index(index_filename, n_rows, datetimes):
+    """
+    Writes sparse index of a HDF5 table through 'atomic_write()'.
+
+    :param index_filename: (str) Sparse index file path
+    :param n_rows: (int) Number of rows of table
+    :param datetimes: (numpy Array) Datetime of every INDEX_STEP-th row in nanoseconds
+    """
+    atomic_write(index_filename, lambda f: np.savez(f, n_rows=n_rows, datetimes=datetimes))
+
+
+def remove_sparse_index(index_filename):
+    """
+    Removes sparse index of a HDF5 table.
+
+    :param index_filename: (str) Sparse index file path
+    """
+    if os.path.isfile(index_filename):
+        os.remove(index_filename)
+
+
+def read_signal_rows(rows_filename):
+    """
+    Reads signal row index of an indicator output table.
+
+    :param rows_filename: (str) Signal row index file path
+
+    :return: Number of scanned rows of table, first datetime of table (nanoseconds) and row coordinates of signals,
+        None if there is no index
+    :rtype: tuple
+    """
+    if not os.path.isfile(rows_filename):
+        return None
+
+    with np.load(rows_filename) as index:
+        first = int(index['first'])
+        return int(index['n_rows']), None if first == NO_DATETIME else first, index['rows']
+
+
+def write_signal_rows(rows_filename, n_rows, first, rows):
+    """
+    Writes signal row index of an indicator output table.
 
-    def get_columns(self, filepath):
-        # Get column name for given file
-        with pd.HDFStore(filepath) as hdf:
-            return set(hdf.select('indicators', start=0, stop=0).columns.values)
+    :param rows_filename: (str) Signal row index file path
+    :param n_rows: (int) Number of scanned rows of table
+    :param first: (int) First datetime of table in nanoseconds, None for empty tables
+    :param rows: (numpy Array) Row coordinates of signals
+    """
+    first = NO_DATETIME if first is None else first
+    atomic_write(rows_filename, lambda f: np.savez(f, n_rows=n_rows, first=first, rows=rows))
@@ -12,6 +12,11 @@
 
 """
 .. moduleauthor:: H Roark
+
+18/10/2026 - Live observer feed consumes Candles of all assets from a single LiveDataService channel, instead of every
+IndicatorManager starting its own download and processing processes every minute.
+
+18/10/2026 - Live observer feed raises errors that stop the LiveDataService, instead of returning as if it was stopped.
 """
 import time
 
@@ -19,6 +24,7 @@ import datetime
 import numpy as np
 import os
 
+from aquitania.data_source.live_data_service import LiveDataService
 from aquitania.execution.live_management.display import *
 from aquitania.resources.asset import AssetInfo
 from aquitania.execution.order_manager import OrderManager
@@ -64,18 +70,24 @@ class LiveEnvironment:
         z.join()
 
     def live_observer_feed(self, q1):
-        minute = datetime.datetime.now().minute
+        """
+        Feeds Candles of LiveDataService channel to the IndicatorManager of their asset and puts its output on 'q1'.
 
-        while True:
-            if minute != datetime.datetime.now().minute:
-                minute = datetime.datetime.now().minute
-                for observer_manager in self.l_im:
-                    observer_manager.live_feed()
-                    df = observer_manager.output
-                    if df is not None:
-                        q1.put(df)
-            else:
-                time.sleep(1)
+        :param q1: (multiprocessing Queue) Queue that transports indicator output to brains
+        """
+        managers = {observer_manager.asset: observer_manager for observer_manager in self.l_im}
+
+        # Starts a single service for all assets, which keeps the same broker connection
+        service = LiveDataService(self.broker_instance, {asset: observer_manager.hdm.get_historic_start_dates()
+                                                         for asset, observer_manager in managers.items()})
+        service.start()
+
+        for asset, candles in service.candles():
+            observer_manager = managers[asset]
+            observer_manager.live_candle_processing(candles)
+            df = observer_manager.output
+            if df is not None:
+                q1.put(df)
 
     def brains(self, q1):
         while True:
@@ -9,6 +9,8 @@ cdef class AbstractIndicator:
 
     cpdef void feed(self, Candle candle)
 
+    cpdef list feed_batch(self, object candles)
+
     cdef void set_output(self, tuple result)
 
 
@@ -22,7 +22,15 @@ code but they do other things besides simply attributing a value to a variable.
 
 17/04/2018 - Making quite a big refactor in Aquitania to make it public. Removed most methods this class once had, it
 just has the bare essential. Elegant design. Deleting some old children such as indicator open output and closed output.
+
+18/10/2026 - Added '.state()' and '.set_state()', the minimal state of an indicator that goes into state snapshots.
+Indicators that keep anything besides their last output implement '.indicator_state()' and '.set_indicator_state()'.
+
+18/10/2026 - '.indicator_state()' defaults to the pickled instance attributes of the indicator subclass, so that
+indicators that don't implement the hooks still resume with the values they kept (deques, last values...). Indicators
+without instance attributes (cdef subclasses) that don't implement the hooks raise when saved.
 """
+import _pickle
 
 cdef class AbstractIndicator:
     """
@@ -49,6 +57,76 @@ cdef class AbstractIndicator:
         """
         self.set_output(self.indicator_logic(candle))
 
+    cpdef list feed_batch(self, object candles):
+        """
+        Executes indicator through 'self.indicator_logic_batch()' over many closed Candles at once and sets
+        'last_output' to the output of the last Candle.
+
+        :param candles: (CandleArray) input candles
+
+        :return: Output of every Candle, in the same order they were fed
+        :rtype: list of tuples
+        """
+        cdef list output = self.indicator_logic_batch(candles)
+
+        if output:
+            self.set_output(output[-1])
+
+        return output
+
+    def state(self):
+        """
+        Minimal state needed to resume the indicator, made of plain Python values.
+
+        :return: Direction, last output and state of the indicator logic
+        :rtype: tuple
+        """
+        return self.up, self.last_output, self.indicator_state()
+
+    def set_state(self, state):
+        """
+        Restores state generated by '.state()'.
+
+        :param state: (tuple) Output of '.state()'
+        """
+        self.up, self.last_output, indicator_state = state
+        self.set_indicator_state(indicator_state)
+
+    def indicator_state(self):
+        """
+        State kept by the indicator logic (rolling windows, last values...). By default it is the instance attributes
+        of the indicator subclass, pickled (attributes of the base classes are either saved by '.state()' or rebuilt
+        from the Strategy).
+
+        Indicators whose attributes can't be pickled, or that only need part of them, implement this and
+        '.set_indicator_state()'.
+
+        :rtype: bytes
+        :raises NotImplementedError: If indicator has no instance attributes and doesn't implement this method
+        """
+        if not hasattr(self, '__dict__'):
+            raise NotImplementedError('{} needs to implement indicator_state() and set_indicator_state() to be saved '
+                                      'into state snapshots.'.format(self.__class__.__name__))
+
+        return _pickle.dumps(self.__dict__, protocol=4)
+
+    def set_indicator_state(self, state):
+        """
+        Restores state generated by '.indicator_state()'.
+
+        :param state: Output of '.indicator_state()'
+        """
+        self.__dict__.update(_pickle.loads(state))
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator run over a whole CandleArray. Indicators that implement it can run on the NumpyFeeder.
+
+        :param candles: (CandleArray) input candles
+        """
+        raise NotImplementedError('{} only works with the Feeder, it doesn\'t implement indicator_logic_batch().'.format(
+            self.__class__.__name__))
+
     cdef void set_output(self, tuple result):
         """
         Append to 'output_list' and set 'last_output'.
@@ -1,9 +1,14 @@
 from aquitania.indicator.abstract.indicator_abc cimport AbstractIndicator
+from aquitania.indicator.management.output_buffer cimport OutputBuffer
 
 cdef class AbstractIndicatorOutput(AbstractIndicator):
     cdef:
         public str id
         public list columns
         public bint is_open
+        public OutputBuffer output_buffer
+        public Py_ssize_t output_column
 
     cpdef void save_output(self)
+
+    cpdef void save_outputs(self, Py_ssize_t row, list outputs)
@@ -19,6 +19,7 @@ It was conceived on 27/11/2017.
 
 17/04/2018 - It once was divided into 2 classes Open and Closed Output, now it is back to one very simple class.
 31/05/2018 - Forced implementation of 'last_output' for closed indicators.
+18/10/2026 - Output is written directly into the OutputBuffer of the IndicatorLoader that holds the indicator.
 """
 
 cdef class AbstractIndicatorOutput(AbstractIndicator):
@@ -48,6 +49,8 @@ cdef class AbstractIndicatorOutput(AbstractIndicator):
         self.id = obs_id
         self.columns = ['{}_{}'.format(obs_id, column) for column in columns]
         self.is_open = is_open
+        self.output_buffer = None
+        self.output_column = 0
 
         # Instantiates abstract indicator
         super().__init__()
@@ -81,8 +84,22 @@ cdef class AbstractIndicatorOutput(AbstractIndicator):
 
     cpdef void save_output(self):
         """
-        Append to 'output_list' and set 'last_output'.
+        Writes 'last_output' into the last row of 'output_buffer' (or appends it to 'output_list' when indicator is not
+        held by an IndicatorLoader).
+        """
+        if self.output_buffer is not None:
+            self.output_buffer.write(self.output_buffer.n_rows - 1, self.output_column, self.last_output)
+        else:
+            self.output_list.append(self.last_output)
+
+    cpdef void save_outputs(self, Py_ssize_t row, list outputs):
+        """
+        Writes many outputs at once into 'output_buffer', starting at 'row' (used by NumpyFeeder).
 
-        :param result: Output from '.indicator_logic()'
+        :param row: (int) First row to be written
+        :param outputs: (list of tuples) Outputs to be saved
         """
-        self.output_list.append(self.last_output)
+        if self.output_buffer is not None:
+            self.output_buffer.write_many(row, self.output_column, outputs)
+        else:
+            self.output_list.extend(outputs)
@@ -12,10 +12,12 @@
 
 """
 .. moduleauthor:: H Roark
+
+18/10/2026 - Moving average and standard deviation now come from a RollingMoments accumulator instead of summing the
+whole deque on every Candle.
 """
 from aquitania.indicator.abstract.indicator_output_abc import AbstractIndicatorOutput
-from collections import *
-from statistics import *
+from aquitania.indicator.rolling import RollingMoments
 
 
 class BollingerBands(AbstractIndicatorOutput):
@@ -24,7 +26,7 @@ class BollingerBands(AbstractIndicatorOutput):
 
     def __init__(self, obs_id, period):
         super().__init__(obs_id, ['direction', 'upper_tied', 'lower_tied'], False, (2, -1.0, -1.0))
-        self.ma = deque(maxlen=period)
+        self.ma = RollingMoments(period)
         self.period = period
 
     def indicator_logic(self, candle):
@@ -34,11 +36,31 @@ class BollingerBands(AbstractIndicatorOutput):
         * Upper Band = 20-day SMA + (20-day standard deviation of price x 2)
         * Lower Band = 20-day SMA - (20-day standard deviation of price x 2)
         """
+        return self.bands(candle.close[self.up])
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator that will be run over a whole CandleArray, same output as '.indicator_logic()'.
+        """
+        return [self.bands(close) for close in candles.close[self.up].tolist()]
+
+    def indicator_state(self):
+        return self.ma.snapshot()
+
+    def set_indicator_state(self, state):
+        self.ma.restore(state)
+
+    def bands(self, close):
+        """
+        Feeds a close value to the moving average and calculates the position of the close inside the bands.
+
+        :param close: (float) Close value
+        """
         # Initialize variables
         sma, upper, lower = 2, -1.0, -1.0  # 'sma' = 2 is clever way to generate 'a favor' e 'contra'
 
         # Append close to moving average
-        self.ma.append(candle.close[self.up])
+        self.ma.append(close)
 
         # Check if there are enough candles to calculate moving average
         if len(self.ma) == self.period:
@@ -47,16 +69,16 @@ class BollingerBands(AbstractIndicatorOutput):
             upper, lower = 0.0, 0.0
 
             # Calculates moving average
-            avg = sum(self.ma) / self.period
+            avg = self.ma.mean()
 
             # Tells if current close is above moving average
-            sma = 1 if candle.close[self.up] > avg else 0
+            sma = 1 if close > avg else 0
 
             # Calculates standard deviation
-            std = pstdev(self.ma)
+            std = self.ma.pstdev()
 
             # Calculates difference between current candle and moving average
-            diff = candle.close[self.up] - avg
+            diff = close - avg
 
             # Transform difference to standard deviations
             if diff > 0 and std != 0:
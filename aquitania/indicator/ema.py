@@ -14,37 +14,57 @@
 .. moduleauthor:: H Roark
 
 03/05/2018 - Added to project. Playing around with technical indicators.
+18/10/2026 - Weighted sum now comes from an ExponentialDecay accumulator, it used to be recalculated with powers over
+the whole period on every Candle.
 """
 from aquitania.indicator.abstract.indicator_output_abc import AbstractIndicatorOutput
-from collections import *
-from statistics import *
+from aquitania.indicator.rolling import ExponentialDecay
 
 
 class EMA(AbstractIndicatorOutput):
     def __init__(self, obs_id, period, rate_of_decay):
         super().__init__(obs_id, ['alta'], False, (2,))
-        self.ma = deque(maxlen=period)
+        self.ma = ExponentialDecay(period, rate_of_decay)
         self.period = period
         self.rate_of_decay = rate_of_decay
-        self.divider = sum([1 * ((1 - rate_of_decay) ** i) for i in range(period)])
 
     def indicator_logic(self, candle):
+        """
+        Logic of the indicator that will be run candle by candle.
+        """
+        return self.average(candle.close[self.up])
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator that will be run over a whole CandleArray, same output as '.indicator_logic()'.
+        """
+        return [self.average(close) for close in candles.close[self.up].tolist()]
+
+    def indicator_state(self):
+        return self.ma.snapshot()
+
+    def set_indicator_state(self, state):
+        self.ma.restore(state)
+
+    def average(self, close):
+        """
+        Feeds a close value to the moving average and tells whether the close is above the weighted average.
+
+        :param close: (float) Close value
+        """
         # Initialize variables
         ema = 2  # 'ema' = 2 is clever way to generate 'a favor' e 'contra'
 
         # Append close to moving average
-        self.ma.append(candle.close[self.up])
+        self.ma.append(close)
 
         # Check if there are enough candles to calculate moving average
         if len(self.ma) == self.period:
-            # Calculates sum of weighted closes
-            sum_ = sum([close * ((1 - self.rate_of_decay) ** i) for i, close in enumerate(reversed(self.ma))])
-
             # Gets average of weighted closes
-            avg = sum_ / self.divider
+            avg = self.ma.mean()
 
             # Tells if current close is above moving average
-            ema = 1 if candle.close[self.up] > avg else 0
+            ema = 1 if close > avg else 0
 
-        # Returns values
-        return ema
+        # Returns values in form of a 1 element tuple (mandatory for indicators)
+        return (ema,)
@@ -0,0 +1,109 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created to decide when IndicatorManager saves output and state snapshots during historic simulations. It
+used to save both after every 25,000 Candles chunk, so long simulations on fast disks spent most of their time on
+small HDF appends. Chunk size can also be derived from a memory budget instead of being a fixed number.
+"""
+import time
+
+# Chunk size used when there is no memory budget
+DEFAULT_CHUNKSIZE = 25000
+
+# Bounds of chunk sizes derived from a memory budget
+MIN_CHUNKSIZE = 1000
+MAX_CHUNKSIZE = 2000000
+
+# Estimated bytes held per G01 Candle of a chunk: DataFrame and its copies, plus per timestamp Resampler arrays
+# (values, volumes, open and close times, flags and temporary datetime arithmetic) and Feeder selections
+ROW_BYTES = 160
+TS_ROW_BYTES = 240
+
+
+class CheckpointPolicy:
+    """
+    Tells IndicatorManager when to save output and state: every 'every_rows' Candles, every 'every_seconds' seconds,
+    whenever output held in memory reaches half of 'memory_budget', and always at the end of the data. When nothing
+    is set, it only saves at the end.
+    """
+
+    def __init__(self, every_rows=None, every_seconds=None, memory_budget=None):
+        """
+        Initializes CheckpointPolicy.
+
+        :param every_rows: (int) Number of Candles between checkpoints
+        :param every_seconds: (float) Seconds between checkpoints
+        :param memory_budget: (int) Bytes a simulation may use, half of it for output held in memory
+        """
+        # Initialize variables
+        self.every_rows = every_rows
+        self.every_seconds = every_seconds
+        self.memory_budget = memory_budget
+
+        # Counters since last checkpoint
+        self.n_rows = 0
+        self.last_time = time.time()
+
+    def chunksize(self, n_ts):
+        """
+        Number of Candles per chunk, the largest chunk whose working memory fits in half of 'memory_budget'.
+
+        :param n_ts: (int) Number of timestamps being generated
+
+        :return: Chunk size
+        :rtype: int
+        """
+        if self.memory_budget is None:
+            return DEFAULT_CHUNKSIZE
+
+        chunksize = self.memory_budget // 2 // (ROW_BYTES + TS_ROW_BYTES * n_ts)
+
+        return int(min(max(chunksize, MIN_CHUNKSIZE), MAX_CHUNKSIZE))
+
+    def add_rows(self, n_rows, output_nbytes):
+        """
+        Counts evaluated Candles and tells whether it is time for a checkpoint.
+
+        :param n_rows: (int) Number of Candles evaluated
+        :param output_nbytes: (int) Bytes of output held in memory
+
+        :return: True if output and state should be saved
+        :rtype: bool
+        """
+        self.n_rows += n_rows
+
+        # Checks each criteria
+        if self.every_rows is not None and self.n_rows >= self.every_rows:
+            return True
+        if self.every_seconds is not None and time.time() - self.last_time >= self.every_seconds:
+            return True
+        if self.memory_budget is not None and output_nbytes >= self.memory_budget // 2:
+            return True
+
+        return False
+
+    def is_pending(self):
+        """
+        :return: True if there are Candles evaluated after last checkpoint
+        :rtype: bool
+        """
+        return self.n_rows > 0
+
+    def reset(self):
+        """
+        Restarts counters after a checkpoint.
+        """
+        self.n_rows = 0
+        self.last_time = time.time()
@@ -1,4 +1,5 @@
 from aquitania.resources.candle cimport Candle
+from aquitania.indicator.management.output_buffer cimport OutputBuffer
 
 cdef class IndicatorLoader:
     """
@@ -10,13 +11,18 @@ cdef class IndicatorLoader:
         int _asset
         int _timestamp
         object _broker_instance
-        list _datetimes
-        list _candle_complete
+        OutputBuffer _output
+
+    cpdef void replace_indicators(self, list indicator_list)
 
     cpdef void feed(self, Candle candle)
 
     cdef void store_candle(self, Candle candle)
 
+    cdef Py_ssize_t store_candles(self, object datetimes, object candle_complete)
+
     cpdef void save_output(self)
 
+    cpdef Py_ssize_t output_nbytes(self)
+
     cdef object generate_df(self)
@@ -13,12 +13,16 @@
 """
 .. moduleauthor:: H Roark
 
+18/10/2026 - Output of indicators, datetimes and completeness of stored Candles are now kept in an OutputBuffer, whose
+columns indicators write into directly.
 """
 
+import numpy as np
 import pandas as pd
 import aquitania.resources.references as ref
 import gc
 from aquitania.resources.candle cimport Candle
+from aquitania.indicator.management.output_buffer cimport OutputBuffer
 
 cdef class IndicatorLoader:
     """
@@ -39,8 +43,29 @@ cdef class IndicatorLoader:
         self._asset = asset
         self._timestamp = timestamp
         self._broker_instance = broker_instance
-        self._datetimes = []
-        self._candle_complete = []
+
+        # Output columns: datetime, columns of every indicator and Candle completeness
+        columns = ['datetime']
+        for indicator in indicator_list:
+            indicator.output_buffer, indicator.output_column = None, len(columns)
+            columns.extend(indicator.columns)
+        columns.append('complete_{}'.format(ref.ts_to_letter[timestamp]))
+
+        # Instantiates OutputBuffer and hands it to indicators that have output
+        self._output = OutputBuffer(columns)
+        self.replace_indicators(indicator_list)
+
+    cpdef void replace_indicators(self, list indicator_list):
+        """
+        Replaces indicators by copies of them (ex.: copies that were fed in another process), handing them the
+        OutputBuffer.
+
+        :param indicator_list: Copies of indicators, in the same order
+        """
+        self.indicator_list = indicator_list
+        for indicator in indicator_list:
+            if indicator.columns:
+                indicator.output_buffer = self._output
 
     cpdef void feed(self, Candle candle):
         """
@@ -57,13 +82,31 @@ cdef class IndicatorLoader:
 
     cdef void store_candle(self, Candle candle):
         """
-        Store Candle routine
+        Store Candle routine, adds a row to output that indicators will fill through '.save_output()'.
 
         :param candle: Candle to be stored
         """
+        cdef Py_ssize_t row = self._output.add_rows(1)
+
+        self._output.write(row, 0, (pd.Timestamp(candle.datetime).value,))
+        self._output.write(row, len(self._output.columns) - 1, (candle.complete,))
+
+    cdef Py_ssize_t store_candles(self, object datetimes, object candle_complete):
+        """
+        Store many Candles at once routine (used by NumpyFeeder)
+
+        :param datetimes: (numpy Array) Datetimes of the Candles to be stored in nanoseconds
+        :param candle_complete: (numpy Array) True for each Candle that was complete
+
+        :return: First row of stored Candles
+        :rtype: int
+        """
+        cdef Py_ssize_t row = self._output.add_rows(len(datetimes))
+
+        self._output.write_array(row, 0, datetimes)
+        self._output.write_array(row, len(self._output.columns) - 1, candle_complete)
 
-        self._datetimes.append(candle.datetime)
-        self._candle_complete.append(candle.complete)
+        return row
 
     cpdef void save_output(self):
         """
@@ -83,42 +126,27 @@ cdef class IndicatorLoader:
 
         gc.collect()
 
-    cdef object generate_df(self):
-        # Initialize Variables
-        df = None
+    cpdef Py_ssize_t output_nbytes(self):
+        """
+        Memory held by output that wasn't saved yet.
 
-        # Get candles index
-        index = self._datetimes
+        :rtype: int
+        """
+        return self._output.nbytes()
 
-        # Gets output from indicators
+    cdef object generate_df(self):
+        # Clears output of indicators that are not held by the OutputBuffer (those without columns)
         for indicator in self.indicator_list:
-
-            # Go to next element if columns are empty
-            if not indicator.columns:
+            if indicator.output_buffer is None:
                 indicator.output_list = []
-                continue
-
-            temp_df = pd.DataFrame(indicator.output_list, columns=indicator.columns)
 
-            if df is None:
-                df = temp_df
-            else:
-                df = pd.concat([df, temp_df], axis=1)
+        # Routine for when there is no indicator with output
+        if len(self._output.columns) == 2:
+            self._output.clear()
+            return None
 
-            # Clears list from memory
-            indicator.output_list = []
-
-        if df is None:
-            self._datetimes = []
-            self._candle_complete = []
-            return df
-
-        df['complete_{}'.format(ref.ts_to_letter[self._timestamp])] = self._candle_complete
-
-        df.index = index
-
-        self._datetimes = []
-        self._candle_complete = []
+        # Get candles index
+        index = pd.DatetimeIndex(self._output.column(0).astype(np.int64).view('datetime64[ns]'))
 
-        # Returns values
-        return df
+        # Wraps output columns into a DataFrame (it also clears the buffer)
+        return self._output.generate_df(list(range(1, len(self._output.columns))), index)
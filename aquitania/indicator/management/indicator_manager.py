@@ -23,18 +23,38 @@ Intended to be a simple-ish class that grew into: Feeder, IndicatorLoader, and I
 output in a fashion that will enable them to leverage cross-instrument analysis. The main issue is that we use a lot of
 multiprocessing to run multiple financial instruments, so this will require to work with multiprocessing variable
 sharing variables. I had a lot of trouble implementing this before, but a Queue of tuples might work here.
+
+18/10/2026 - Added 'is_vectorized' option to run historic data through the NumpyFeeder, which feeds all Candles of a
+DataFrame at once to the indicators. It only works for Strategies without open indicators and doesn't have live feed.
+
+18/10/2026 - NumpyFeeder can feed each timestamp in a different process, 'n_processes' in '.load_run_data()' sets how
+many worker processes will be used by this IndicatorManager.
+
+18/10/2026 - IndicatorManager isn't pickled anymore after every chunk. '.save_snapshot()' writes only the state of each
+indicator and of the Feeder into a versioned snapshot file (state_snapshot.py), and '.load_snapshot()' restores it into
+a freshly built IndicatorManager.
+
+18/10/2026 - Output and state snapshots are saved together when the CheckpointPolicy says so (every N Candles, every T
+seconds, when output held in memory gets too big, or only at the end), and chunk size can come from a memory budget.
+
+18/10/2026 - Candles are loaded from 'start_date' to 'end_date' by the storage system, instead of reading all chunks
+and filtering them here.
+
+18/10/2026 - Removed '.live_feed()', live Candles of all assets come from LiveDataService into
+'.live_candle_processing()'.
 """
-import time
 import os
 
 from aquitania.data_processing.util import add_asset_columns_to_df
 from aquitania.data_source.feeder import Feeder
+from aquitania.data_source.numpy_feeder import NumpyFeeder, timestamp_pool
 from aquitania.data_source.historic_data_manager import HistoricDataManager
+from aquitania.indicator.management.checkpoint_policy import CheckpointPolicy, DEFAULT_CHUNKSIZE
 from aquitania.indicator.management.indicator_loader import IndicatorLoader
 from aquitania.resources.candle import Candle
+from aquitania.resources.state_snapshot import read_snapshot, write_snapshot
 import aquitania.resources.references as ref
 import aquitania.resources.datetimefx as dtfx
-import _pickle
 import pandas as pd
 
 
@@ -44,12 +64,15 @@ class IndicatorManager:
     work. Each Financial Security (asset) should run contained in a IndicatorManager object.
     """
 
-    def __init__(self, broker_instance, asset, strategy, start_date=None, end_date=None):
+    def __init__(self, broker_instance, asset, strategy, start_date=None, end_date=None, is_vectorized=False,
+                 checkpoint_policy=None):
         """
         Initializes IndicatorManager.
 
         :param broker_instance: (DataSource) Object derived from AbstractDataSource
         :param asset: (str) Currency that will shape the IndicatorManager
+        :param is_vectorized: (bool) True to run historic data through NumpyFeeder (only closed indicators)
+        :param checkpoint_policy: (CheckpointPolicy) When to save output and state, defaults to every 25,000 Candles
         """
         # Instantiates necessary variables
         self.broker_instance = broker_instance
@@ -58,6 +81,7 @@ class IndicatorManager:
         self.end_date = end_date
         self.strategy = strategy
         self.output = None
+        self.checkpoint_policy = checkpoint_policy or CheckpointPolicy(every_rows=DEFAULT_CHUNKSIZE)
 
         # Instantiate Loaders
         self.list_of_loaders = self.build_loaders()
@@ -66,13 +90,18 @@ class IndicatorManager:
         self.hdm = HistoricDataManager(broker_instance, asset, True)
 
         # Instantiate Feeder
-        self.feeder = Feeder(self.list_of_loaders, ref.currencies_dict[asset])
+        if is_vectorized:
+            self.feeder = NumpyFeeder(self.list_of_loaders, ref.currencies_dict[asset])
+        else:
+            self.feeder = Feeder(self.list_of_loaders, ref.currencies_dict[asset])
 
-    def update_load_run_data(self):
+    def update_load_run_data(self, n_processes=1):
         """
         This method updates, then loads all the historic data and then run all the indicators through it.
 
         It is great for generating historic databases of indicators output.
+
+        :param n_processes: (int) Number of worker processes to feed timestamps in parallel (only for NumpyFeeder)
         """
         print('{}Starting to update database for {}.'.format(dtfx.now(), self.asset))
 
@@ -81,48 +110,65 @@ class IndicatorManager:
         print('{}Database updated. Starting simulations for {}.'.format(dtfx.now(), self.asset))
 
         # Execute indicators in downloaded database (can select initial date)
-        self.load_run_data()
+        self.load_run_data(n_processes)
         print('{}Simulations completed for {}.'.format(dtfx.now(), self.asset))
 
-    def load_run_data(self):
+    def load_run_data(self, n_processes=1):
         """
         This method loads all the historic data and then run all the indicators through it.
-        """
-        # Load generator of DataFrame
-        df_chunks = self.broker_instance.load_data_in_chunks(self.asset, chunksize=25000)
 
-        # Gets Usable DataFrame
-        for df in df_chunks:
-            df = df.loc[slice(self.start_date, self.end_date)]
-            if df.shape[0] > 0:
-                datetime = self.feeder.exec_df(df)
-                self.save_state(datetime)
-
-    def live_feed(self):
-        """
-        Feeds live Candles to the Feeder which will in turn feed all indicators.
-
-        Transforms a list of Candles into individual Candles to be fed.
+        :param n_processes: (int) Number of worker processes to feed timestamps in parallel (only for NumpyFeeder)
         """
-        # Gets list of tuples containing Candle values
-        candles = self.hdm.get_live_data()
-
-        # Checks if blank Candle values
-        if candles is not None:
-            # Runs candle processing routine
-            self.live_candle_processing(candles)
-
-        # Routine for empty candles object
-        else:
-            # Sleeps for a while just not to use 100% of CPU
-            time.sleep(0.1)
+        # Routine for parallel timestamps, which only NumpyFeeder supports
+        pool = None
+        if n_processes > 1:
+            if not isinstance(self.feeder, NumpyFeeder):
+                raise ValueError('Timestamps can only be fed in parallel by NumpyFeeder (is_vectorized=True).')
+            pool = timestamp_pool(min(n_processes, len(self.list_of_loaders)))
+
+        # Chunk size that fits the memory budget
+        policy = self.checkpoint_policy
+        chunksize = policy.chunksize(len(self.list_of_loaders))
+        policy.reset()
+        datetime = None
+
+        try:
+            # Load generator of DataFrame (storage system seeks straight to the first Candle after 'start_date')
+            df_chunks = self.broker_instance.load_data_in_chunks(self.asset, chunksize=chunksize,
+                                                                 start=self.start_date, end=self.end_date)
+
+            # Gets Usable DataFrame
+            for df in df_chunks:
+                if df.shape[0] > 0:
+                    if pool is not None:
+                        datetime = self.feeder.exec_df(df, pool=pool, is_save=False)
+                    else:
+                        datetime = self.feeder.exec_df(df, is_save=False)
+
+                    # Saves output and state when it is time to
+                    if policy.add_rows(df.shape[0], self.feeder.output_nbytes()):
+                        self.checkpoint(datetime)
+
+            # Saves whatever was evaluated after last checkpoint
+            if policy.is_pending():
+                self.checkpoint(datetime)
+
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
     def live_candle_processing(self, candles):
         """
-        Does live processing of candles. It will get a list of tuples and instantiate Candle objects from it.
+        Does live processing of candles. It will get a list of tuples (or a DataFrame with the same columns) and
+        instantiate Candle objects from it.
 
-        :param candles: (list of tuples) Input Candles to be processed (not instantiated yet)
+        :param candles: (list of tuples or pandas DataFrame) Input Candles to be processed (not instantiated yet)
         """
+        # Rows of DataFrames are iterated as tuples (datetime, fi, ts, open, high, low, close, volume)
+        if isinstance(candles, pd.DataFrame):
+            candles = candles.itertuples(name=None)
+
         # Evaluate all incoming Candles
         for candle in candles:
             # Defines asset as string
@@ -192,27 +238,82 @@ class IndicatorManager:
         # Returns IndicatorLoaders in a list
         return loader_list
 
+    def checkpoint(self, dt):
+        """
+        Saves output held by the Feeder and then the state, so that output on disk always matches the snapshot.
+
+        :param dt: (datetime) Last evaluated Candle
+        """
+        self.feeder.save_output()
+        self.save_state(dt)
+        self.checkpoint_policy.reset()
+
     def save_state(self, dt):
         print('{}Saving a batch into disk on {}. Last Candle analyzed: {}.'.format(dtfx.now(), self.asset, dt))
         self.start_date = dtfx.next_candle_datetime(dt, 1)  # Order is important here
-        self.pickle_state()
+        self.save_snapshot()
+
+    def snapshot_filename(self):
+        """
+        :return: Path of the state snapshot of this IndicatorManager
+        :rtype: str
+        """
+        return 'data/state/{}.snap'.format(self.asset)
+
+    def state(self):
+        """
+        Minimal state needed to resume simulations: next datetime to be evaluated, Feeder in-progress Candles and the
+        state of every indicator (with its id, to make sure it is restored into the same Strategy).
 
-    def pickle_state(self):
+        :rtype: dict
         """
-        Save IndicatorManager into disk.
+        return {'asset': self.asset,
+                'start_date': None if self.start_date is None else pd.Timestamp(self.start_date).isoformat(),
+                'feeder': self.feeder.state(),
+                'indicators': [[(indicator.id, indicator.state()) for indicator in loader.indicator_list]
+                               for loader in self.list_of_loaders]}
 
-        This architecture once was much more complex, but only saving the IndicatorManager object into disk (and all its
-        attributes that contains all IndicatorLoaders and by consequence all Indicators are sufficient to store
-        Aquitania states.
+    def set_state(self, state):
         """
-        # Sets file name
-        filename = 'data/state/{}.pkl'.format(self.asset)
+        Restores state generated by '.state()'.
 
-        # Removes file in case it exists
-        if os.path.exists(filename):
-            os.remove(filename)
+        :param state: (dict) Output of '.state()'
+        """
+        # Checks that state belongs to this asset and Strategy
+        if state['asset'] != self.asset:
+            raise ValueError('State of {} can\'t be restored into {}.'.format(state['asset'], self.asset))
+        ids = [[indicator_id for indicator_id, indicator_state in loader] for loader in state['indicators']]
+        if ids != [[indicator.id for indicator in loader.indicator_list] for loader in self.list_of_loaders]:
+            raise ValueError('State of {} was generated by a different Strategy.'.format(self.asset))
+
+        # Restores indicators, then Feeder (it needs to know which signals are on)
+        for loader, indicator_states in zip(self.list_of_loaders, state['indicators']):
+            for indicator, (indicator_id, indicator_state) in zip(loader.indicator_list, indicator_states):
+                indicator.set_state(indicator_state)
+        self.feeder.set_state(state['feeder'])
+
+        # Restores next datetime to be evaluated
+        self.start_date = None if state['start_date'] is None else pd.Timestamp(state['start_date'])
+
+    def save_snapshot(self):
+        """
+        Saves state of IndicatorManager into disk.
+
+        Broker instance, HistoricDataManager and loaders are rebuilt from the Strategy when the snapshot is loaded, so
+        the snapshot size only depends on the state of the indicators.
+        """
+        write_snapshot(self.snapshot_filename(), self.state())
+
+    def load_snapshot(self):
+        """
+        Restores state of IndicatorManager from disk.
+
+        :return: True if there was a snapshot to be loaded
+        :rtype: bool
+        """
+        filename = self.snapshot_filename()
+        if not os.path.exists(filename):
+            return False
 
-        # Writes state to disk
-        # TODO there are better implementations than _pickle (cPickle), messagePack and others. Might check this later.
-        with open(filename, 'wb') as f:
-            _pickle.dump(self, f)
+        self.set_state(read_snapshot(filename))
+        return True
@@ -0,0 +1,28 @@
+cdef class OutputBuffer:
+    cdef readonly list columns
+    cdef readonly Py_ssize_t capacity
+    cdef readonly Py_ssize_t n_rows
+    cdef list _arrays
+    cdef list _kinds
+
+    cpdef Py_ssize_t add_rows(self, Py_ssize_t n)
+
+    cpdef void write(self, Py_ssize_t row, Py_ssize_t column, tuple values)
+
+    cpdef void write_many(self, Py_ssize_t row, Py_ssize_t column, list values)
+
+    cpdef void write_array(self, Py_ssize_t row, Py_ssize_t column, object values)
+
+    cdef void set_kind(self, Py_ssize_t column, str kind)
+
+    cpdef object column(self, Py_ssize_t column)
+
+    cpdef object generate_df(self, list columns, object index)
+
+    cpdef Py_ssize_t nbytes(self)
+
+    cpdef void clear(self)
+
+cdef str kind_of(object value)
+
+cdef str merge_kinds(str kind, str other)
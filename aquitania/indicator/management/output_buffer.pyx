@@ -0,0 +1,218 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created OutputBuffer. Indicators used to append a tuple per stored Candle to a list, that IndicatorLoader
+turned into one DataFrame per indicator glued together by consecutive pd.concat(axis=1). Now each IndicatorLoader owns
+an OutputBuffer of growable typed NumPy columns where indicators write their output directly, and the DataFrame is a
+zero-copy wrap of those columns.
+
+Column dtypes follow what pandas would infer from the written values: bool, int64, float64, or object when values
+are mixed (int and float become float64).
+"""
+import numpy as np
+import pandas as pd
+
+# Dtype of each kind of value
+cdef dict DTYPES = {'b': np.bool_, 'i': np.int64, 'f': np.float64, 'O': object}
+
+
+cdef class OutputBuffer:
+    """
+    Growable typed NumPy columns. Rows are added first through '.add_rows()' and then written column by column.
+    """
+
+    def __init__(self, list columns, Py_ssize_t capacity=1024):
+        """
+        Initializes OutputBuffer, column arrays are only allocated when first written, as dtype depends on values.
+
+        :param columns: (list of str) Column names
+        :param capacity: (int) Initial number of rows
+        """
+        self.columns = columns
+        self.capacity = capacity
+        self.n_rows = 0
+        self._arrays = [None] * len(columns)
+        self._kinds = [None] * len(columns)
+
+    cpdef Py_ssize_t add_rows(self, Py_ssize_t n):
+        """
+        Adds rows to the buffer, growing columns when necessary.
+
+        :param n: (int) Number of rows
+
+        :return: Index of the first added row
+        :rtype: int
+        """
+        cdef Py_ssize_t row = self.n_rows
+
+        # Doubles capacity, so growing is O(1) on average
+        if row + n > self.capacity:
+            self.capacity = max(row + n, 2 * self.capacity)
+            for i, array in enumerate(self._arrays):
+                if array is not None:
+                    self._arrays[i] = np.empty(self.capacity, dtype=array.dtype)
+                    self._arrays[i][:row] = array[:row]
+
+        self.n_rows += n
+        return row
+
+    cpdef void write(self, Py_ssize_t row, Py_ssize_t column, tuple values):
+        """
+        Writes a tuple of values in consecutive columns of a row.
+
+        :param row: (int) Row to be written
+        :param column: (int) First column to be written
+        :param values: (tuple) Values, one for each column
+        """
+        cdef Py_ssize_t i
+
+        for i in range(len(values)):
+            self.set_kind(column + i, kind_of(values[i]))
+            self._arrays[column + i][row] = values[i]
+
+    cpdef void write_many(self, Py_ssize_t row, Py_ssize_t column, list values):
+        """
+        Writes a list of tuples of values in consecutive rows, starting from 'row'.
+
+        :param row: (int) First row to be written
+        :param column: (int) First column to be written
+        :param values: (list of tuples) Values, one tuple for each row
+        """
+        cdef Py_ssize_t i
+
+        if not values:
+            return
+
+        for i in range(len(values[0])):
+            self.write_array(row, column + i, [value[i] for value in values])
+
+    cpdef void write_array(self, Py_ssize_t row, Py_ssize_t column, object values):
+        """
+        Writes values of a single column in consecutive rows, starting from 'row'.
+
+        :param row: (int) First row to be written
+        :param column: (int) Column to be written
+        :param values: (list or numpy Array) Values
+        """
+        cdef str kind
+
+        # Gets kind of values
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'bif':
+            kind = values.dtype.kind
+        else:
+            kind = None
+            for value in values:
+                kind = merge_kinds(kind, kind_of(value))
+                if kind == 'O':
+                    break
+
+        if kind is None:
+            return
+
+        self.set_kind(column, kind)
+        self._arrays[column][row:row + len(values)] = values
+
+    cdef void set_kind(self, Py_ssize_t column, str kind):
+        """
+        Allocates column on its first write and promotes its dtype when a new kind of value arrives.
+
+        :param column: (int) Column
+        :param kind: (str) Kind of the value to be written
+        """
+        cdef str merged = merge_kinds(self._kinds[column], kind)
+
+        if merged == self._kinds[column]:
+            return
+
+        if self._arrays[column] is None:
+            self._arrays[column] = np.empty(self.capacity, dtype=DTYPES[merged])
+        else:
+            self._arrays[column] = self._arrays[column].astype(DTYPES[merged])
+
+        self._kinds[column] = merged
+
+    cpdef object column(self, Py_ssize_t column):
+        """
+        Written rows of a column (a view, not a copy).
+
+        :param column: (int) Column
+
+        :return: Values of column
+        :rtype: numpy Array
+        """
+        if self._arrays[column] is None:
+            return np.empty(self.n_rows, dtype=object)
+
+        return self._arrays[column][:self.n_rows]
+
+    cpdef object generate_df(self, list columns, object index):
+        """
+        Wraps columns into a DataFrame without copying them and starts a new buffer, so the DataFrame is never
+        overwritten.
+
+        :param columns: (list of int) Columns to be in the DataFrame
+        :param index: (numpy Array) Index of DataFrame
+
+        :return: DataFrame of written rows
+        :rtype: pandas DataFrame
+        """
+        df = pd.DataFrame({i: self.column(column) for i, column in enumerate(columns)}, index=index, copy=False)
+        df.columns = [self.columns[column] for column in columns]
+
+        self.clear()
+
+        return df
+
+    cpdef Py_ssize_t nbytes(self):
+        """
+        Memory held by the buffer (allocated capacity, not only written rows).
+
+        :rtype: int
+        """
+        return sum([array.nbytes for array in self._arrays if array is not None])
+
+    cpdef void clear(self):
+        """
+        Starts a new buffer with the same capacity.
+        """
+        self.n_rows = 0
+        self._arrays = [None] * len(self.columns)
+        self._kinds = [None] * len(self.columns)
+
+
+cdef str kind_of(object value):
+    """
+    Kind of a value, 'b' for bool, 'i' for int, 'f' for float and 'O' for any other object.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return 'b'
+    elif isinstance(value, (int, np.integer)):
+        return 'i'
+    elif isinstance(value, (float, np.floating)):
+        return 'f'
+    else:
+        return 'O'
+
+
+cdef str merge_kinds(str kind, str other):
+    """
+    Kind of a column that holds both kinds of values.
+    """
+    if kind is None or kind == other:
+        return other
+    elif (kind == 'i' and other == 'f') or (kind == 'f' and other == 'i'):
+        return 'f'
+    else:
+        return 'O'
@@ -0,0 +1,53 @@
+cdef class RollingWindow:
+    cdef double* buffer
+    cdef readonly int period
+    cdef readonly int count
+    cdef int head
+    cdef int n_appends
+
+    cdef double push(self, double value)
+
+    cpdef void append(self, double value)
+
+    cpdef bint is_full(self)
+
+    cpdef list values(self)
+
+    cdef void recalculate(self)
+
+cdef class RollingSum(RollingWindow):
+    cdef double total
+
+    cpdef double sum(self)
+
+    cpdef double mean(self)
+
+cdef class RollingMoments(RollingWindow):
+    cdef double shift
+    cdef double total
+    cdef double total_sq
+
+    cpdef double mean(self)
+
+    cpdef double pvariance(self)
+
+    cpdef double pstdev(self)
+
+cdef class ExponentialDecay(RollingWindow):
+    cdef readonly double rate_of_decay
+    cdef double decay
+    cdef double last_weight
+    cdef double total
+    cdef double weights
+
+    cpdef double sum(self)
+
+    cpdef double mean(self)
+
+cdef class WilderAverage(RollingWindow):
+    cdef double total
+    cdef double average
+
+    cpdef bint is_ready(self)
+
+    cpdef double mean(self)
@@ -0,0 +1,344 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+Rolling accumulators shared by the indicators.
+
+18/10/2026 - Created to replace the deques that were summed over and over again on every closed Candle. Each
+accumulator keeps its window in a fixed size ring buffer and updates its totals in O(1) per value, so indicators cost
+the same no matter how large 'period' is. Running totals are recalculated from the ring buffer once every 'period'
+values, which keeps floating point error from piling up while still being O(1) on average.
+
+18/10/2026 - Added '.snapshot()' and '.restore()', used by indicators to write their state into state snapshots.
+"""
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.math cimport sqrt
+
+
+cdef class RollingWindow:
+    """
+    Fixed size ring buffer of the last 'period' values.
+
+    This is a base class for the accumulators, it keeps values but doesn't accumulate anything.
+    """
+
+    def __cinit__(self, int period, *args, **kwargs):
+        """
+        Allocates ring buffer.
+
+        :param period: (int) Number of values kept in the window
+        """
+        if period < 1:
+            raise ValueError('Rolling window period must be at least 1, got {}.'.format(period))
+
+        self.buffer = <double*> PyMem_Malloc(period * sizeof(double))
+        if not self.buffer:
+            raise MemoryError()
+
+        self.period = period
+        self.count = 0
+        self.head = 0
+        self.n_appends = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.buffer)
+
+    def __len__(self):
+        return self.count
+
+    def __reduce__(self):
+        return self.__class__, self.init_args(), self.snapshot()
+
+    def __setstate__(self, state):
+        values, accumulators = state
+
+        # Refills ring buffer and restores totals exactly as they were
+        for value in values:
+            self.push(value)
+        self.set_state(accumulators)
+
+    def snapshot(self):
+        """
+        Values in the window and running totals, made of plain Python values.
+
+        :rtype: tuple
+        """
+        return self.values(), self.state()
+
+    def restore(self, snapshot):
+        """
+        Replaces values in the window and running totals by the ones of a '.snapshot()'.
+
+        :param snapshot: (tuple) Output of '.snapshot()'
+        """
+        self.count, self.head = 0, 0
+        self.__setstate__(snapshot)
+
+    cdef double push(self, double value):
+        """
+        Stores value in the ring buffer.
+
+        :param value: (float) New value
+
+        :return: Value that left the window (0.0 while window is not full)
+        :rtype: float
+        """
+        cdef double dropped = 0.0
+
+        if self.count == self.period:
+            dropped = self.buffer[self.head]
+        else:
+            self.count += 1
+
+        self.buffer[self.head] = value
+        self.head = (self.head + 1) % self.period
+
+        return dropped
+
+    cpdef void append(self, double value):
+        self.push(value)
+
+    cpdef bint is_full(self):
+        return self.count == self.period
+
+    cpdef list values(self):
+        """
+        Values in the window, from oldest to newest.
+
+        :rtype: list of float
+        """
+        cdef int i, start = self.head - self.count + self.period
+        return [self.buffer[(start + i) % self.period] for i in range(self.count)]
+
+    cdef void recalculate(self):
+        """
+        Recalculates running totals from the ring buffer.
+        """
+        self.n_appends = 0
+
+    def init_args(self):
+        return self.period,
+
+    def state(self):
+        return self.n_appends,
+
+    def set_state(self, state):
+        self.n_appends, = state
+
+
+cdef class RollingSum(RollingWindow):
+    """
+    Rolling sum (and simple moving average) of the last 'period' values.
+    """
+
+    cpdef void append(self, double value):
+        cdef double dropped = self.push(value)
+
+        # Updates total
+        self.total += value - dropped
+
+        # Recalculates total once per period
+        self.n_appends += 1
+        if self.n_appends >= self.period:
+            self.recalculate()
+
+    cdef void recalculate(self):
+        cdef int i, start = self.head - self.count + self.period
+        cdef double total = 0.0
+
+        # Sums from oldest to newest
+        for i in range(self.count):
+            total += self.buffer[(start + i) % self.period]
+
+        self.total = total
+        self.n_appends = 0
+
+    cpdef double sum(self):
+        return self.total
+
+    cpdef double mean(self):
+        return self.total / self.count
+
+    def state(self):
+        return self.n_appends, self.total
+
+    def set_state(self, state):
+        self.n_appends, self.total = state
+
+
+cdef class RollingMoments(RollingWindow):
+    """
+    Rolling mean and population standard deviation of the last 'period' values.
+
+    Sums and sums of squares are taken around a shift (the mean of the last recalculation) to avoid losing precision
+    when the deviation is small compared to the values (as it is with prices).
+    """
+
+    cpdef void append(self, double value):
+        cdef bint is_full = self.count == self.period
+        cdef double x, dropped
+
+        # First value defines the shift
+        if self.count == 0:
+            self.shift = value
+
+        dropped = self.push(value)
+
+        # Adds new value
+        x = value - self.shift
+        self.total += x
+        self.total_sq += x * x
+
+        # Removes value that left the window
+        if is_full:
+            x = dropped - self.shift
+            self.total -= x
+            self.total_sq -= x * x
+
+        # Recalculates totals once per period
+        self.n_appends += 1
+        if self.n_appends >= self.period:
+            self.recalculate()
+
+    cdef void recalculate(self):
+        cdef int i, start = self.head - self.count + self.period
+        cdef double x, total = 0.0, total_sq = 0.0
+
+        # New shift is current mean
+        self.shift = self.mean()
+
+        for i in range(self.count):
+            x = self.buffer[(start + i) % self.period] - self.shift
+            total += x
+            total_sq += x * x
+
+        self.total = total
+        self.total_sq = total_sq
+        self.n_appends = 0
+
+    cpdef double mean(self):
+        return self.shift + self.total / self.count
+
+    cpdef double pvariance(self):
+        cdef double variance = (self.total_sq - self.total * self.total / self.count) / self.count
+
+        # Anything this small compared to the squares is just rounding error of the running sums (window is flat)
+        if variance <= self.total_sq / self.count * 1e-12:
+            return 0.0
+
+        return variance
+
+    cpdef double pstdev(self):
+        return sqrt(self.pvariance())
+
+    def state(self):
+        return self.n_appends, self.shift, self.total, self.total_sq
+
+    def set_state(self, state):
+        self.n_appends, self.shift, self.total, self.total_sq = state
+
+
+cdef class ExponentialDecay(RollingWindow):
+    """
+    Rolling sum of the last 'period' values weighted by exponential decay, newest value has weight 1 and each older
+    value has its weight multiplied by (1 - rate_of_decay).
+    """
+
+    def __init__(self, int period, double rate_of_decay):
+        """
+        :param period: (int) Number of values kept in the window
+        :param rate_of_decay: (float) Rate in which weights decay for each older value
+        """
+        self.rate_of_decay = rate_of_decay
+        self.decay = 1 - rate_of_decay
+        self.last_weight = self.decay ** period
+
+    cpdef void append(self, double value):
+        cdef bint is_full = self.count == self.period
+        cdef double dropped = self.push(value)
+
+        # Older values decay and new value comes in with weight 1
+        self.total = self.decay * self.total + value
+        self.weights = self.decay * self.weights + 1
+
+        # Removes value that left the window
+        if is_full:
+            self.total -= self.last_weight * dropped
+            self.weights -= self.last_weight
+
+        # Recalculates totals once per period
+        self.n_appends += 1
+        if self.n_appends >= self.period:
+            self.recalculate()
+
+    cdef void recalculate(self):
+        cdef int i, end = self.head - 1 + self.period
+        cdef double total = 0.0, weights = 0.0, weight = 1.0
+
+        # Sums from newest to oldest
+        for i in range(self.count):
+            total += self.buffer[(end - i) % self.period] * weight
+            weights += weight
+            weight *= self.decay
+
+        self.total = total
+        self.weights = weights
+        self.n_appends = 0
+
+    cpdef double sum(self):
+        return self.total
+
+    cpdef double mean(self):
+        return self.total / self.weights
+
+    def init_args(self):
+        return self.period, self.rate_of_decay
+
+    def state(self):
+        return self.n_appends, self.total, self.weights
+
+    def set_state(self, state):
+        self.n_appends, self.total, self.weights = state
+
+
+cdef class WilderAverage(RollingWindow):
+    """
+    Wilder smoothing (as in Wilder's RSI and ATR), it starts as a simple moving average of the first 'period' values
+    and then each new value weights 1 / period.
+    """
+
+    cpdef void append(self, double value):
+        self.push(value)
+
+        # Seeding with simple moving average
+        if self.n_appends < self.period:
+            self.n_appends += 1
+            self.total += value
+            self.average = self.total / self.n_appends
+
+        # Wilder smoothing
+        else:
+            self.average += (value - self.average) / self.period
+
+    cpdef bint is_ready(self):
+        return self.n_appends == self.period
+
+    cpdef double mean(self):
+        return self.average
+
+    def state(self):
+        return self.n_appends, self.total, self.average
+
+    def set_state(self, state):
+        self.n_appends, self.total, self.average = state
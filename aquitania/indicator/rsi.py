@@ -12,10 +12,11 @@
 
 """
 .. moduleauthor:: H Roark
-"""
-from collections import deque
 
+18/10/2026 - Gains and losses are now kept in RollingSum accumulators, they used to be summed on every Candle.
+"""
 from aquitania.indicator.abstract.indicator_output_abc import AbstractIndicatorOutput
+from aquitania.indicator.rolling import RollingSum
 
 
 class RSI(AbstractIndicatorOutput):
@@ -42,16 +43,38 @@ class RSI(AbstractIndicatorOutput):
 
         # Instantiate attributes
         self.period = period
-        self.high = deque(maxlen=period)
-        self.low = deque(maxlen=period)
+        self.high = RollingSum(period)
+        self.low = RollingSum(period)
         self.last_close = None
 
     def indicator_logic(self, candle):
         """
         Logic of the indicator that will be run candle by candle.
         """
+        return self.strength(candle.close[1])
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator that will be run over a whole CandleArray, same output as '.indicator_logic()'.
+        """
+        return [self.strength(close) for close in candles.close[1].tolist()]
+
+    def indicator_state(self):
+        return self.high.snapshot(), self.low.snapshot(), self.last_close
+
+    def set_indicator_state(self, state):
+        high, low, self.last_close = state
+        self.high.restore(high)
+        self.low.restore(low)
+
+    def strength(self, close):
+        """
+        Feeds a close value and calculates the Relative Strength Index.
+
+        :param close: (float) Close value
+        """
         # Initializes close diff
-        close_diff = candle.close[1] - self.last_close if self.last_close is not None else 0
+        close_diff = close - self.last_close if self.last_close is not None else 0
 
         # Saves diff to 'self.high' if green candle
         if close_diff > 0:
@@ -63,7 +86,7 @@ class RSI(AbstractIndicatorOutput):
         # Checks if there are enough periods instantiated for both 'self.high' and 'self.low'
         if self.period == len(self.high) == len(self.low):
             # Calculates Relative Strength
-            rs = sum(self.high) / sum(self.low)
+            rs = self.high.sum() / self.low.sum()
 
             # Calculates Relative Strength Index
             rsi = 100 - (100 / (1 + rs))
@@ -73,7 +96,7 @@ class RSI(AbstractIndicatorOutput):
             rsi = -1.0
 
         # Sets last close for next loop
-        self.last_close = candle.close[1]
+        self.last_close = close
 
         # Returns RSI in form of a 1 element tuple (mandatory for indicators)
         return (rsi,)
@@ -13,6 +13,8 @@
 """
 .. moduleauthor:: H Roark
 """
+import numpy as np
+
 from aquitania.indicator.signal.abstract_signal import AbstractSignal
 
 
@@ -48,3 +50,32 @@ class Doji(AbstractSignal):
             entry = candle.close[self.up]
 
         return is_ok, profit, loss, entry
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator that will be run over a whole CandleArray, same output as '.indicator_logic()'.
+        """
+        # Same as 'candle.upper_shadow(True) < candle.lower_shadow(True)' for every candle
+        body_max = np.maximum(candles.close[1], candles.open[1])
+        body_min = np.minimum(candles.close[1], candles.open[1])
+        up = (candles.high[1] - body_max) < (body_min - candles.low[1])
+
+        # Selects values according to each candle direction
+        open_, high, low, close = [np.where(up, values[1], values[0]) for values in
+                                   (candles.open, candles.high, candles.low, candles.close)]
+
+        # Check if it is a Doji
+        body = np.abs(open_ - close)
+        shadow = (high - low) - body
+        with np.errstate(divide='ignore', invalid='ignore'):
+            is_ok = (body == 0) | (shadow / body >= 12)
+
+        # Generate Exit points
+        profit = np.where(is_ok, close * 1.003, 0.0)
+        loss = np.where(is_ok, close * 0.997, 0.0)
+        entry = np.where(is_ok, close, 0.0)
+
+        # Keeps direction of the last candle, as '.indicator_logic()' does
+        self.up = bool(up[-1])
+
+        return list(zip(is_ok.tolist(), profit.tolist(), loss.tolist(), entry.tolist()))
@@ -15,9 +15,11 @@
 
 These was one of the first indicators ever to be evaluated. At some point I was getting too much overfitting in the AI
 models, that I've decided to turn this indicator into a categorical one instead of a continuous one.
+
+18/10/2026 - Moving average of volume now comes from a RollingSum accumulator.
 """
 from aquitania.indicator.abstract.indicator_output_abc import AbstractIndicatorOutput
-from collections import *
+from aquitania.indicator.rolling import RollingSum
 
 
 class Volume(AbstractIndicatorOutput):
@@ -43,30 +45,50 @@ class Volume(AbstractIndicatorOutput):
         super().__init__(obs_id, ['abs_len', 'rel'], False, (0, -1.0))
 
         # Instantiates necessary variables
-        self.mm = deque(maxlen=period)  # maxlen is a trick to adjust len automatically
+        self.mm = RollingSum(period)
         self.period = period
 
     def indicator_logic(self, candle):
         """
         Logic of the indicator that will be run candle by candle.
         """
+        return self.relative_volume(candle.volume)
+
+    def indicator_logic_batch(self, candles):
+        """
+        Logic of the indicator that will be run over a whole CandleArray, same output as '.indicator_logic()'.
+        """
+        return [self.relative_volume(volume) for volume in candles.volume.tolist()]
+
+    def indicator_state(self):
+        return self.mm.snapshot()
+
+    def set_indicator_state(self, state):
+        self.mm.restore(state)
+
+    def relative_volume(self, volume):
+        """
+        Feeds a volume value and calculates absolute and relative volume.
+
+        :param volume: (int) Candle volume
+        """
         # Gets a proxy for absolute value, it only measures the order of magnitude (quantity of digits)
-        abs_vol = int(candle.volume)
+        abs_vol = int(volume)
 
         # Instantiates a relative value for volume, -1 means it is not instantiated
         rel_vol = -1.0
 
-        # Appends volume to deque
-        self.mm.append(candle.volume)
+        # Appends volume to moving average
+        self.mm.append(volume)
 
-        # If deque is of appropriate size, generates output
+        # If moving average is of appropriate size, generates output
         if len(self.mm) == self.period:
 
             # Gets average
-            avg = sum(self.mm) / self.period
+            avg = self.mm.mean()
 
             # Calculates relative volume in relation to average
-            rel_vol = candle.volume / avg
+            rel_vol = volume / avg
 
         # Returns Absolute and Relative volume
         return abs_vol, rel_vol
@@ -12,15 +12,51 @@
 
 """
 .. moduleauthor:: H Roark
+
+18/10/2026 - Exits used to be created by turning all candles into a tuple of tuples and walking up to 'max_candles'
+candles of each signal in Python. Now 'manage_exit_creation()' works on contiguous NumPy arrays and finds the first
+crossing candle of all signals at once through 'first_crossing()', with identical results.
+
+18/10/2026 - Exit points of an asset can be built in parallel by a Pool of worker processes ('pool' in
+'build_exits()'), candles are shared with workers through shared memory instead of being copied into each task.
+'build_exits()' returns elapsed time of each stage, so that Bot can report them for all assets.
+
+18/10/2026 - First crossing candles are found through an ExtremesIndex (pyramid of block maxima of highs and minima of
+lows persisted next to the candles file) in O(log n) per signal, instead of scanning blocks of candles.
+
+18/10/2026 - 'virada()' used to look for the opposite signal of each signal by iterating over all the following ones,
+O(n ** 2). Now it takes a single pass over precomputed next opposite rows.
+
+18/10/2026 - Exits are consolidated column by column: earliest exit of each signal is a row-wise argmin over exit
+DateTime columns, invalid entries are masked with array operations and only 'is_dentro' is a (Cython) sequential pass.
+
+18/10/2026 - 'build_entry_points()' finds candles of signals that are not in the 1 Minute candles through a single
+as-of join (searchsorted), instead of slicing a month of candles and enlarging the DataFrame for each signal.
+
+18/10/2026 - Exits and consolidated exits are saved into the liquidation store (liquidation_store.py) as 'exits' and
+'consolidate' partitions of signal and asset, instead of HDF5 tables.
+
+18/10/2026 - Exits are built incrementally: when stored exits were built with the same parameters and candles were only
+appended since then, exits of stored signals whose 'max_candles' window ended before the new candles are kept, and
+only new signals and signals whose window reaches new candles are built. 'virada' and consolidation still take the
+whole history, both are linear passes.
+
+18/10/2026 - Stored exits are only kept if a digest of the signals they were built from (DateTime, entry and exit point
+values) matches current signals, so that exits of a Strategy whose stop or profit levels changed under the same column
+names are rebuilt instead of being merged.
 """
-import bisect
+import hashlib
+import multiprocessing
+import time
 import pandas as pd
 import numpy as np
-import os
+from multiprocessing import resource_tracker, shared_memory
 from aquitania.data_processing.analytics_loader import build_liquidation_dfs
-from cpython.datetime cimport datetime
+from aquitania.liquidation.extremes_index import ExtremesIndex, get_extremes_index
+from aquitania.liquidation.liquidation_store import load_liquidation, read_manifest, save_liquidation
 
-cpdef build_exits(broker_instance, str asset, signal, int max_candles, bint is_dentro=False, bint is_virada=False):
+cpdef dict build_exits(broker_instance, str asset, signal, int max_candles, bint is_dentro=False,
+                       bint is_virada=False, object pool=None, bint is_incremental=True):
     """
     Calculates exit DateTime for a list of Exit Points. It will be used in later module that evaluates winning or
     losing positions.
@@ -31,33 +67,49 @@ cpdef build_exits(broker_instance, str asset, signal, int max_candles, bint is_d
     :param max_candles: (int) Number of max G01 candles to look in the future to liquidate trade
     :param is_dentro: (bool) True if when positioned, don't look for new positions in the same side
     :param is_virada: (bool) True if when positioned, if there is a trade in the same side, you switch positions
+    :param pool: (multiprocessing Pool) Worker processes that build exit points in parallel (None for no workers)
+    :param is_incremental: (bool) True to only build exits of signals that were not final in stored exits
+
+    :return: Elapsed seconds of each stage
+    :rtype: dict
     """
 
     # Initializes variables
     entry = signal.entry
     exit_points = {signal.stop, signal.profit}
-    exits = None
-    import time
-    time_a = time.time()
+    cdef dict timing = {}
 
+    time_a = time.time()
     df, candles_df = build_dfs(broker_instance, asset, exit_points, entry)
-    print('build_dfs: ', time.time() - time_a)
+    timing['build_dfs'] = time.time() - time_a
 
-    time_b = time.time()
-    exits = process_exit_points(df, exit_points, candles_df, max_candles, is_virada)
-    print('process exit points: ', time.time() - time_b)
+    # Gets ExtremesIndex of candles (only built when candles changed)
+    time_a = time.time()
+    candles = candle_arrays(candles_df)
+    extremes = get_extremes_index(broker_instance.get_candles_extremes_filename(asset), candles[0],
+                                  candles_df['high'].values, candles_df['low'].values)
+    timing['extremes_index'] = time.time() - time_a
 
-    # Sets filename
-    filename = 'data/liquidation/' + asset + '_' + entry
+    # Gets exits of a previous run that can be extended (None if all of them need to be built)
+    time_a = time.time()
+    metadata = {'max_candles': max_candles, 'is_virada': is_virada, 'exit_points': sorted(exit_points),
+                'n_candles': candles[0].shape[0],
+                'last_candle': int(candles[0][-1].astype(np.int64)) if candles[0].shape[0] > 0 else None,
+                'signals_digest': signals_digest(df, sorted(exit_points))}
+    stored = get_stored_exits(asset, entry, df, candles, metadata) if is_incremental else None
+    exits = process_exit_points(df, exit_points, candles, extremes, max_candles, is_virada, pool, stored)
+    timing['process_exit_points'] = time.time() - time_a
 
     # Save liquidation to disk
-    time_c = time.time()
-    save_liquidation_to_disk(filename, exits)
-    print('save liquidation to disk: ', time.time() - time_c)
+    time_a = time.time()
+    save_liquidation(exits, asset, entry, 'exits', metadata)
+    timing['save_liquidation'] = time.time() - time_a
 
-    time_d = time.time()
+    time_a = time.time()
     consolidate_exits(asset, entry, exits, is_dentro)
-    print('consolidate exits: ', time.time() - time_d)
+    timing['consolidate_exits'] = time.time() - time_a
+
+    return timing
 
 cdef build_dfs(broker_instance, asset, exit_points, entry):
     # Load DataFrames
@@ -79,23 +131,100 @@ cdef build_dfs(broker_instance, asset, exit_points, entry):
 
     return df.sort_index(), candles_df
 
-cdef process_exit_points(df, exit_points, candles_df, max_candles, is_virada):
+cdef object get_stored_exits(str asset, str entry, df, tuple candles, dict metadata):
+    """
+    Gets exits saved by a previous run if they can be extended: they were built with the same parameters and candles
+    were only appended since then. Exits of stored signals whose 'max_candles' window ended before new candles are
+    final, other signals (new ones and those whose window reaches new candles) need to be built.
+
+    :param asset: (str) Input asset
+    :param entry: (str) Signal name (entry)
+    :param df: (pandas DataFrame) Signals ordered by DateTime
+    :param candles: (tuple of numpy Array) Output of 'candle_arrays()'
+    :param metadata: (dict) Metadata of exits that are about to be built
+
+    :return: Stored exits and True for signals that need to be built (None if all of them need to be built)
+    :rtype: tuple
+    """
+    try:
+        stored_metadata = read_manifest(asset, entry, 'exits')['metadata']
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # Checks parameters
+    if any(stored_metadata.get(key) != metadata[key] for key in ('max_candles', 'is_virada', 'exit_points')):
+        return None
+
+    # Checks that stored candles are the first candles of current ones
+    n_stored = stored_metadata.get('n_candles', 0)
+    if not 0 < n_stored <= candles[0].shape[0]:
+        return None
+    if int(candles[0][n_stored - 1].astype(np.int64)) != stored_metadata.get('last_candle'):
+        return None
+
+    stored_exits = load_liquidation(asset, entry, 'exits')
+
+    # Checks that stored signals didn't change (entry and exit point values included)
+    is_stored = df.index.isin(stored_exits.index)
+    if signals_digest(df[is_stored], metadata['exit_points']) != stored_metadata.get('signals_digest'):
+        return None
+
+    # Selects signals that are not stored or whose window reaches candles that were not stored
+    positions = np.searchsorted(candles[0], df.index.values.astype('datetime64[ns]'), side='left')
+    is_update = ~is_stored | (positions + metadata['max_candles'] > n_stored)
+
+    return stored_exits, is_update
+
+cdef str signals_digest(df, list exit_points):
+    """
+    Digest of the signals exits are built from, to find out if stored exits were built from the same signals.
+
+    :param df: (pandas DataFrame) Signals ordered by DateTime, with 'entry_point' and exit point columns
+    :param exit_points: (list of str) Exit point columns, in a stable order
+
+    :return: Hexadecimal SHA-1 of DateTimes, entry points and exit points
+    :rtype: str
+    """
+    digest = hashlib.sha1(np.ascontiguousarray(df.index.values.astype('datetime64[ns]').view(np.int64)).tobytes())
+    for column in ['entry_point'] + exit_points:
+        digest.update(np.ascontiguousarray(df[column].values, dtype=np.float64).tobytes())
+
+    return digest.hexdigest()
+
+cdef process_exit_points(df, exit_points, tuple candles, extremes, max_candles, is_virada, pool, tuple stored=None):
     cdef object exits = None
+    cdef list exit_list = list(exit_points)
 
-    # Create exits for all exit points
-    for exit_point in exit_points:
-        # Run multiprocessing routine
-        temp_exit = manage_exit_creation(df[['close', 'entry_point', exit_point]], exit_point, candles_df, max_candles)
+    # Only signals that are not final in stored exits are built (output of 'get_stored_exits()')
+    if stored is None:
+        update_df = df
+    else:
+        stored_exits, is_update = stored
+        update_df = df[is_update]
+        kept_index = df.index[~is_update]
+
+    # Create exits for all exit points, in worker processes if there is a pool
+    if pool is None:
+        temp_exits = [manage_exit_creation(update_df[['close', 'entry_point', exit_point]], exit_point, candles,
+                                           extremes, max_candles) for exit_point in exit_list]
+    else:
+        temp_exits = exit_points_parallel(update_df, exit_list, candles, extremes, max_candles, pool)
 
+    for exit_point, temp_exit in zip(exit_list, temp_exits):
         # Routine for df_alta
         temp_exit.columns = [exit_point + '_dt', exit_point + '_saldo']
 
+        # Merges final exits of stored signals
+        if stored is not None:
+            temp_exit = pd.concat([stored_exits.loc[kept_index, temp_exit.columns], temp_exit]).sort_index()
+
         # Concat exits
         if exits is None:
             exits = temp_exit
         else:
             exits = pd.concat([exits, temp_exit], axis=1)
         del temp_exit
+    del temp_exits
 
     # Routine if for every trade an opposite trade is automatically an entry
     if is_virada:
@@ -128,109 +257,196 @@ cdef build_entry_points(df, candles_df):
     # Generates inner join DataFrame
     df_inner = pd.concat([candles_df[['close', 'entry_point']], df], join='inner', axis=1)
 
-    # Finds exit points for elements outside the inner join DataFrame
-    for element in df.index.difference(df_inner.index):
-        # Selects 1 month prior to the DataFrame, which is the highest period we use
-        w = candles_df.loc[element - pd.offsets.Day(31):element + pd.offsets.Minute(1)].iloc[-1][
-            ['close', 'entry_point']]
-
-        # Changes index to be able to concat correctly
-        w.name = element
+    # Routine for when all signals are in the 1 Minute candles
+    missing = df.index.difference(df_inner.index)
+    if missing.shape[0] == 0:
+        return df_inner.sort_index()
 
-        # Creates line to be added
-        x = pd.concat([df.loc[element], w])
+    # As-of join: each missing signal gets the last candle up to 1 minute after it, within 1 month prior to the signal
+    # (the highest period we use)
+    pos = candles_df.index.searchsorted(missing + pd.Timedelta(minutes=1), side='right') - 1
+    is_found = pos >= 0
+    is_found[is_found] = candles_df.index[pos[is_found]] >= missing[is_found] - pd.Timedelta(days=31)
+    if not is_found.all():
+        raise ValueError('There is no 1 Minute candle in the month before signal at {}.'.format(missing[~is_found][0]))
 
-        # Add line to DataFrame
-        df_inner.loc[element] = x
+    # Builds lines of missing signals
+    df_outer = candles_df[['close', 'entry_point']].iloc[pos]
+    df_outer.index = missing
+    df_outer = pd.concat([df_outer, df.loc[missing]], axis=1)
 
     # Returns ordered DataFrame
-    return df_inner.sort_index()
-
-cdef manage_exit_creation(df, ep_str, candles_df_pd, max_candles):
-    cdef tuple candles_index = tuple(candles_df_pd.index)
-    cdef tuple candles_df = tuple(tuple(x) for x in candles_df_pd.itertuples())
-    cdef list raw_df = []
-    cdef list index = []
-    cdef datetime dt
-    cdef double close
-    cdef double entry_point
-    cdef double exit_point
-
-    for dt, close, entry_point, exit_point in (tuple(x) for x in df.itertuples()):
-        pos = bisect.bisect_left(candles_index, dt)
-        x = candles_df[pos:pos+max_candles]
-        raw_df.append(create_exits(dt, close, entry_point, exit_point, ep_str, x))
-        index.append(dt)
-
-    return pd.DataFrame(raw_df, index=index)
-
-def create_exits(datetime dt, double close, double entry_point, double exitp, str exit_str, tuple remaining):
+    return pd.concat([df_inner, df_outer]).sort_index()
+
+cdef list exit_points_parallel(df, list exit_list, tuple candles, extremes, int max_candles, object pool):
     """
-    Calculate exit datetime for each possible exit point.
+    Same as creating exits of every exit point with 'manage_exit_creation()', but each exit point is a task for a
+    worker process of 'pool'. Candles and ExtremesIndex are shared with workers through shared memory, so that each
+    task carries only the signal columns of its exit point.
+
+    :param df: (pandas DataFrame) Signals with 'close', 'entry_point' and exit point columns
+    :param exit_list: (list of str) Exit point column names
+    :param candles: (tuple) Output of 'candle_arrays()'
+    :param extremes: (ExtremesIndex) Index of highs and lows of candles
+    :param max_candles: (int) Number of max G01 candles to look in the future to liquidate trade
+    :param pool: (multiprocessing Pool) Worker processes
 
-    :param df_line: Input df_line
+    :return: Exit DateTime and saldo of every signal, for each exit point
+    :rtype: list of pandas DataFrame
+    """
+    cdef Py_ssize_t n_candles = candles[0].shape[0]
+    cdef Py_ssize_t n_levels = extremes.high_levels.shape[0]
+
+    # Shares datetimes and open of candles, and ExtremesIndex levels with worker processes
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * (2 * n_candles + 2 * n_levels)))
+    try:
+        shared = np.ndarray(2 * n_candles + 2 * n_levels, np.int64, shm.buf)
+        for i, array in enumerate(shared_arrays(shared, n_candles, n_levels)):
+            array[:] = (candles[0], candles[1], extremes.high_levels, extremes.neg_low_levels)[i]
+        del shared, array
+
+        return pool.map(exit_point_worker, [(shm.name, n_candles, n_levels, df[['close', 'entry_point', exit_point]],
+                                              exit_point, max_candles) for exit_point in exit_list])
+    finally:
+        shm.close()
+        shm.unlink()
+
+cdef tuple shared_arrays(object shared, Py_ssize_t n_candles, Py_ssize_t n_levels):
+    """
+    Views of shared memory of 'exit_points_parallel()': datetimes and open of candles, and both ExtremesIndex levels.
+
+    :param shared: (numpy Array) Shared memory as int64
+    :param n_candles: (int) Number of candles
+    :param n_levels: (int) Size of each flat pyramid of ExtremesIndex
 
-    :return: pd.Series([Hora da Saida, Saldo])
+    :rtype: tuple of numpy Array
     """
+    return (shared[:n_candles].view('datetime64[ns]'), shared[n_candles:2 * n_candles].view(np.float64),
+            shared[2 * n_candles:2 * n_candles + n_levels].view(np.float64),
+            shared[2 * n_candles + n_levels:].view(np.float64))
 
-    if exitp < 0:
-        exitp = exitp * -1
+cdef tuple candle_arrays(candles_df):
+    """
+    Candles as contiguous NumPy arrays, the way exit engine uses them.
 
-    # Evaluate if it is stop or not
-    is_stop = 'stop' in exit_str
+    :param candles_df: (pandas DataFrame) G01 candles with 'open' column
 
-    # Evaluate if alta ou baixa
-    is_high = close < exitp
+    :return: Datetimes (datetime64[ns]) and open of candles
+    :rtype: tuple of numpy Array
+    """
+    return (np.ascontiguousarray(candles_df.index.as_unit('ns').values),
+            np.ascontiguousarray(candles_df['open'].values, dtype=np.float64))
 
-    # Checks if it is not the last value
-    if len(remaining) < 2:
-        # Need to return series as this outputs a DataFrame when used in a DF.apply()
-        return [np.datetime64('NaT'), 0.0]
+cdef manage_exit_creation(df, ep_str, tuple candles, extremes, max_candles):
+    """
+    Calculates exit DateTime and saldo of every signal for a given exit point.
+
+    For each signal the window is made of the 'max_candles' G01 candles starting at the signal (the signal candle
+    itself is never an exit). If the first candle after the signal already opens beyond exit price, the trade can't be
+    placed and saldo is -1000.0 (gap marker). Otherwise exit is the first candle whose high (or low) crosses exit
+    price, and if no candle crosses it exit is NaT with saldo 0.0.
 
-    # Iter through DataFrame to find exit
+    First crossing candles of all signals are found at once through ExtremesIndex.
 
-    cdef datetime index
-    cdef double open
-    cdef double high
-    cdef double low
+    :param df: (pandas DataFrame) Signals with 'close', 'entry_point' and exit point columns
+    :param ep_str: (str) Exit point column name
+    :param candles: (tuple) Output of 'candle_arrays()'
+    :param extremes: (ExtremesIndex) Index of highs and lows of candles
+    :param max_candles: (int) Number of max G01 candles to look in the future to liquidate trade
 
-    index, open, high, low = remaining[1]
+    :return: Exit DateTime and saldo of every signal
+    :rtype: pandas DataFrame
+    """
+    candle_dts, open_ = candles
 
-    # Routine if high
-    if is_high:
-        if open >= exitp:
-            return [np.datetime64('NaT'), -1000.0]
+    # Signals as arrays
+    close = df['close'].values.astype(np.float64)
+    entry_point = df['entry_point'].values.astype(np.float64)
+    exitp = df[ep_str].values.astype(np.float64)
+    exitp = np.where(exitp < 0, exitp * -1, exitp)
 
-    # Routine if low
-    else:
-        if open <= exitp:
-            return [np.datetime64('NaT'), -1000.0]
+    # Evaluate if it is stop or not, and if alta ou baixa
+    is_stop = 'stop' in ep_str
+    is_high = close < exitp
 
-    # Iter through DataFrame to find exit
-    for index, open, high, low in remaining[1:]:
+    # Window of each signal is [first, stop), 'first' being the first candle after the signal
+    pos = np.searchsorted(candle_dts, df.index.as_unit('ns').values, side='left')
+    first = pos + 1
+    stop = np.minimum(pos + max_candles, open_.shape[0])
+
+    # Output arrays
+    exit_row = np.full(df.shape[0], -1, dtype=np.int64)
+    saldo = np.zeros(df.shape[0], dtype=np.float64)
+
+    # Gap routine, first candle after signal opens beyond exit price
+    valid = np.flatnonzero(first < stop)
+    first_open = open_[first[valid]]
+    is_gap = np.where(is_high[valid], first_open >= exitp[valid], first_open <= exitp[valid])
+    saldo[valid[is_gap]] = -1000.0
+
+    # Searches first candle that crosses exit price, for alta and baixa signals
+    valid = valid[~is_gap]
+    rows = valid[is_high[valid]]
+    exit_row[rows] = extremes.first_above(first[rows], stop[rows], exitp[rows])
+    rows = valid[~is_high[valid]]
+    exit_row[rows] = extremes.first_below(first[rows], stop[rows], exitp[rows])
+
+    # Exit price can't be better than the open of the exit candle
+    rows = np.flatnonzero(exit_row >= 0)
+    exit_open, exit_price = open_[exit_row[rows]], exitp[rows]
+    exit_price = np.where(is_high[rows], np.where(exit_price > exit_open, exit_price, exit_open),
+                          np.where(exit_price < exit_open, exit_price, exit_open))
+
+    # Calculates saldo
+    exit_saldo = np.where(is_high[rows], exit_price - entry_point[rows], entry_point[rows] - exit_price)
+    if is_stop:
+        exit_saldo = exit_saldo * -1
+    saldo[rows] = exit_saldo
+
+    # Exit DateTimes, NaT when there is no exit
+    exit_dt = np.full(df.shape[0], np.datetime64('NaT'), dtype='datetime64[ns]')
+    exit_dt[rows] = candle_dts[exit_row[rows]]
+
+    return pd.DataFrame({0: exit_dt, 1: saldo}, index=df.index.rename(None))
+
+def exit_pool(int n_processes):
+    """
+    Instantiates a Pool of worker processes for 'build_exits()'.
 
-        # Routine if high
-        if is_high:
-            if high >= exitp:
-                exitp = max(open, exitp)
-                saldo = exitp - entry_point
+    Resource tracker is started before workers, so that shared memory of candles is only unlinked by its owner.
 
-                if is_stop:
-                    saldo = saldo * -1
-                return [index, saldo]
+    :param n_processes: (int) Number of worker processes
 
-        # Routine if low
-        else:
-            if low <= exitp:
-                exitp = min(open, exitp)
-                saldo = entry_point - exitp
+    :return: Pool of worker processes
+    :rtype: multiprocessing Pool
+    """
+    resource_tracker.ensure_running()
+    return multiprocessing.Pool(n_processes)
 
-                if is_stop:
-                    saldo = saldo * -1
-                return [index, saldo]
+def exit_point_worker(tuple task):
+    """
+    Worker process routine of 'exit_points_parallel()'.
 
-    # If no values found returns blank
-    return [np.datetime64('NaT'), 0.0]
+    :param task: (tuple) Shared memory name, number of candles, size of ExtremesIndex levels, signals, exit point name
+                         and max candles
+
+    :return: Exit DateTime and saldo of every signal
+    :rtype: pandas DataFrame
+    """
+    name, n_candles, n_levels, df, exit_point, max_candles = task
+
+    # Gets candles and ExtremesIndex from shared memory (views, so that worker doesn't hold a copy of them)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        shared = np.ndarray(2 * n_candles + 2 * n_levels, np.int64, shm.buf)
+        candle_dts, open_, high_levels, neg_low_levels = shared_arrays(shared, n_candles, n_levels)
+        extremes = ExtremesIndex(high_levels, neg_low_levels, n_candles)
+        exits = manage_exit_creation(df, exit_point, (candle_dts, open_), extremes, max_candles)
+        del shared, candle_dts, open_, high_levels, neg_low_levels, extremes
+    finally:
+        shm.close()
+
+    return exits
 
 cdef void consolidate_exits(str asset, str entry, object exits, bint is_dentro):
     """
@@ -239,105 +455,138 @@ cdef void consolidate_exits(str asset, str entry, object exits, bint is_dentro):
     # Sort DataFrame
     exits.sort_index(inplace=True)
 
-    # Instantiates DataFrame
-    cdef tuple col_names = tuple(exits.columns.values)
-    cdef list output = []
-    cdef datetime last_trade = None
-
-    for row in exits.itertuples():
-        last_trade, tmp = juntate_exits(last_trade, tuple(row), is_dentro, col_names)
-        output.append(tmp)
-
-    df = pd.DataFrame(output, index=exits.index)
-    df.columns = ['exit_reference', 'exit_date', 'exit_saldo']
-
-    # Sets filename
-    filename = 'data/liquidation/' + asset + '_' + entry + '_CONSOLIDATE'
+    df = juntate_exits(exits, is_dentro)
 
     # Save liquidation to disk
-    save_liquidation_to_disk(filename, df)
+    save_liquidation(df, asset, entry, 'consolidate')
 
-cdef tuple juntate_exits(datetime last_trade, tuple df_line, bint is_dentro, tuple column_names):
+cdef object juntate_exits(object exits, bint is_dentro):
     """
-    Gets a DataFrame line and evaluate what exit will it be.
+    Evaluates which exit each signal will have: the earliest exit DateTime among all exit points (ties go to the first
+    exit point). Signals with a gap marker (-1000.0) on any exit point, or without any exit, have no exit, and when
+    'is_dentro' signals that happen while positioned in a previous trade are skipped.
+
+    Every datetime column of 'exits' is an exit point, followed by its saldo column.
 
-    :param df_line: Input DF Line
-    :return: Output DF Line containing:
+    :param exits: (pandas DataFrame) Exits ordered by signal DateTime
+    :param is_dentro: (bool) True if when positioned, don't look for new positions in the same side
+
+    :return: DataFrame containing:
         1. 'exit_reference' - String
         2. 'exit_date' - DateTime
         3. 'exit_saldo' - Float
-    :rtype: pandas Series
+    :rtype: pandas DataFrame
     """
-    #  (Timestamp('2017-01-01 22:00:00'),
-    #  a_doji_profit_dt      2017-01-05 05:19:00
-    #  a_doji_profit_saldo   0.00301459
-    #  a_doji_stop_dt         2017-01-02 09:01:00
-    #  aa_doji_stop_saldo              -0.00329459
-    #  entry                              1.05167
+    cdef Py_ssize_t n_rows = exits.shape[0]
+
+    # Exit DateTimes (NaT is negative) and saldos of every exit point
+    dt_columns = [i for i, dtype in enumerate(exits.dtypes) if dtype.kind == 'M']
+    names = np.array([exits.columns[i][:-3] for i in dt_columns] + [''], dtype=object)
+    dts = np.empty((n_rows, len(dt_columns)), dtype=np.int64)
+    saldos = np.empty((n_rows, len(dt_columns)), dtype=np.float64)
+    for j, i in enumerate(dt_columns):
+        dts[:, j] = exits.iloc[:, i].values.astype('datetime64[ns]').view(np.int64)
+        saldos[:, j] = exits.iloc[:, i + 1].values
+
+    # Earliest valid exit of each row
+    is_valid = dts > 0
+    first = np.where(is_valid, dts, np.iinfo(np.int64).max).argmin(axis=1) if dt_columns else np.zeros(n_rows, int)
+
+    # Rows with an exit that aren't invalid entries (gap marker without exit DateTime)
+    is_invalid = ((saldos == -1000.0) & ~is_valid).any(axis=1)
+    rows = np.flatnonzero(is_valid.any(axis=1) & ~is_invalid)
+    exit_dts = dts[rows, first[rows]]
 
     # Dentro Routine
-    if is_dentro and last_trade is not None and last_trade > df_line[0]:
-        return last_trade, ['', np.datetime64('NaT'), 0]
-
-    if check_if_invalid_entry(df_line):
-        return last_trade, ['', np.datetime64('NaT'), 0]
-
-    dt_min = None
-    # Select only dates
-    for i, dt in enumerate(df_line[1:]):
-        if isinstance(dt, datetime):
-            if dt.value > 0:
-                if dt_min is None or dt < dt_min:
-                    dt_min = dt
-                    saldo_min = df_line[i + 2]
-                    col_name = column_names[i]
-
-    # If dates returns empty return empty
-    if dt_min is None:
-        return last_trade, ['', np.datetime64('NaT'), 0]
-
-    # Generates output# TODO use named tuples to get 'nome da saida'
-    return dt_min, [col_name[:-3], dt_min, saldo_min]
-
-cdef check_if_invalid_entry(df_line):
-    if not any(i == -1000.0 for i in df_line):
-        return False
-    else:
-        for i, el in enumerate(df_line):
-            if el == -1000.0:
-                if not df_line[i - 1].value > 0:
-                    return True
-    return False
-
-def save_liquidation_to_disk(filename, df):
+    if is_dentro:
+        is_kept = dentro_trades(exits.index.as_unit('ns').asi8[rows], exit_dts)
+        rows, exit_dts = rows[is_kept], exit_dts[is_kept]
+
+    # Generates output, rows without exit are empty
+    column = np.full(n_rows, len(dt_columns), dtype=np.int64)
+    column[rows] = first[rows]
+    exit_date = np.full(n_rows, np.datetime64('NaT'), dtype='datetime64[ns]')
+    exit_date[rows] = exit_dts.view('datetime64[ns]')
+    exit_saldo = np.zeros(n_rows, dtype=np.float64)
+    exit_saldo[rows] = saldos[rows, first[rows]]
+
+    return pd.DataFrame({'exit_reference': names[column], 'exit_date': exit_date, 'exit_saldo': exit_saldo},
+                        index=exits.index)
+
+cdef object dentro_trades(long long[:] signal_dts, long long[:] exit_dts):
     """
-    Saves liquidation to disk in HDF5 format.
+    Sequential pass of dentro routine: a trade is skipped when its signal happens before the exit of the last trade
+    that was kept.
+
+    :param signal_dts: (numpy Array) Signal DateTime of each trade in nanoseconds, ordered
+    :param exit_dts: (numpy Array) Exit DateTime of each trade in nanoseconds
 
-    :param filename: Selects filename to be saved
-    :param df: DataFrame to be saved
+    :return: True for each trade that is kept
+    :rtype: numpy Array of bool
     """
-    # Remove liquidation File if exists
-    if os.path.isfile(filename):
-        os.unlink(filename)
+    cdef Py_ssize_t i
+    cdef long long last_trade = 0
+    cdef bint is_positioned = False
+
+    is_kept = np.zeros(signal_dts.shape[0], dtype=np.uint8)
+    cdef unsigned char[:] kept = is_kept
+
+    for i in range(signal_dts.shape[0]):
+        if is_positioned and last_trade > signal_dts[i]:
+            continue
+
+        kept[i] = 1
+        last_trade = exit_dts[i]
+        is_positioned = True
 
-    # Save liquidations to disk
-    with pd.HDFStore(filename) as hdf:
-        hdf.append(key='liquidation', value=df, format='table', data_columns=True)
+    return is_kept.view(np.bool_)
 
 def virada(df):
+    """
+    For each signal, finds the next signal in the opposite direction (given by the sign of the stop column), where
+    position would be switched, and the saldo of switching there. Signals are compared with every signal from their
+    own DateTime on.
+
+    Runs in a single pass: for each row, the next row of each direction is precomputed by 'next_index()'.
+
+    :param df: (pandas DataFrame) Signals ordered by DateTime, with close, entry point, profit and stop columns
+
+    :return: DateTime and saldo of switching position, and entry point of each signal
+    :rtype: pandas DataFrame
+    """
     # TODO virada is dependent on column order. improve this.
-    output = []
-    for index_a, close_a, ep_a, profit_a, stop_a in df.itertuples():
-        for index_b, close_b, ep_b, profit_b, stop_b in df[index_a:].itertuples():
-            if stop_a > 0:
-                if stop_b < 0:
-                    output.append([index_b, ep_b - ep_a, ep_a])
-                    break
-            else:
-                if stop_b > 0:
-                    output.append([index_b, ep_a - ep_b, ep_a])
-                    break
-        else:
-            output.append([np.datetime64('NaT'), 0.0, ep_a])
+    close, entry_point, profit, stop = (df.iloc[:, i].values for i in range(df.shape[1]))
+    entry_point = entry_point.astype(np.float64)
+    stop = stop.astype(np.float64)
+
+    # First row of the DateTime of each signal, from where it looks for the opposite signal
+    start = df.index.searchsorted(df.index, side='left')
+
+    # Next opposite signal, bought signals (stop > 0) look for sold ones (stop < 0) and all the others for bought ones
+    is_bought = stop > 0
+    opposite = np.where(is_bought, next_index(stop < 0)[start], next_index(is_bought)[start])
+    rows = np.flatnonzero(opposite < df.shape[0])
+
+    # Calculates saldo of switching position
+    saldo = np.zeros(df.shape[0], dtype=np.float64)
+    opposite_entry = entry_point[opposite[rows]]
+    saldo[rows] = np.where(is_bought[rows], opposite_entry - entry_point[rows], entry_point[rows] - opposite_entry)
+
+    # DateTimes of switching position, NaT when there is no opposite signal
+    virada_dt = np.full(df.shape[0], np.datetime64('NaT'), dtype='datetime64[ns]')
+    virada_dt[rows] = df.index.as_unit('ns').values[opposite[rows]]
+
+    return pd.DataFrame({'virada_dt': virada_dt, 'virada_saldo': saldo, 'entry': entry_point}, index=df.index)
+
+def next_index(is_true):
+    """
+    For each row, the first row from it on (itself included) that is True.
+
+    :param is_true: (numpy Array of bool) Condition of each row
+
+    :return: First True row from each row on, number of rows when there is none (with an extra row at the end)
+    :rtype: numpy Array
+    """
+    rows = np.where(is_true, np.arange(is_true.shape[0]), is_true.shape[0])
 
-    return pd.DataFrame(output, index=df.index, columns=['virada_dt', 'virada_saldo', 'entry'])
+    return np.append(np.minimum.accumulate(rows[::-1])[::-1], is_true.shape[0])
@@ -0,0 +1,211 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created ExtremesIndex. Finding when a trade exits used to mean walking candles one by one until a high or
+a low crossed the exit price, O(holding period) per trade. ExtremesIndex keeps a pyramid of block maxima of G01 highs
+(and of negated lows) that answers "first candle in [start, stop) whose high >= price" in O(log n), for all trades at
+once. It is persisted next to the candles file and rebuilt whenever candles change.
+"""
+import os
+
+import numpy as np
+
+from aquitania.data_processing.util import atomic_write
+
+
+class ExtremesIndex:
+    """
+    Pyramids of block maxima of highs and of negated lows of G01 candles. Level 0 holds the candles themselves and each
+    element of level k is the maximum of two elements of level k - 1, so level k covers aligned blocks of 2 ** k
+    candles. Levels are stored one after the other in a flat array.
+    """
+
+    def __init__(self, high_levels, neg_low_levels, n_rows):
+        """
+        Initializes ExtremesIndex, use 'build_extremes_index()' to build it from candles.
+
+        :param high_levels: (numpy Array) Flat pyramid of maxima of highs
+        :param neg_low_levels: (numpy Array) Flat pyramid of maxima of negated lows
+        :param n_rows: (int) Number of candles
+        """
+        self.high_levels = high_levels
+        self.neg_low_levels = neg_low_levels
+        self.n_rows = n_rows
+        self.offsets = level_offsets(n_rows)
+
+    def first_above(self, start, stop, prices):
+        """
+        First candle in [start, stop) whose high >= price, for many queries at once.
+
+        :param start: (numpy Array) First candle of each query
+        :param stop: (numpy Array) End of each query (not included)
+        :param prices: (numpy Array) Price of each query
+
+        :return: Row of first candle that reaches price, -1 if there is none
+        :rtype: numpy Array
+        """
+        return first_reaching(self.high_levels, self.offsets, start, stop, prices)
+
+    def first_below(self, start, stop, prices):
+        """
+        First candle in [start, stop) whose low <= price, for many queries at once.
+
+        :param start: (numpy Array) First candle of each query
+        :param stop: (numpy Array) End of each query (not included)
+        :param prices: (numpy Array) Price of each query
+
+        :return: Row of first candle that reaches price, -1 if there is none
+        :rtype: numpy Array
+        """
+        return first_reaching(self.neg_low_levels, self.offsets, start, stop, np.negative(prices))
+
+
+def build_extremes_index(high, low):
+    """
+    Builds ExtremesIndex of G01 candles.
+
+    :param high: (numpy Array) Highs of candles
+    :param low: (numpy Array) Lows of candles
+
+    :rtype: ExtremesIndex
+    """
+    return ExtremesIndex(build_levels(np.asarray(high, dtype=np.float64)),
+                         build_levels(np.negative(np.asarray(low, dtype=np.float64))), len(high))
+
+
+def get_extremes_index(filename, datetimes, high, low):
+    """
+    Loads ExtremesIndex persisted in 'filename', rebuilding (and persisting) it when there is none or when it was
+    built for other candles (number of candles, first or last datetime don't match).
+
+    :param filename: (str) ExtremesIndex file path
+    :param datetimes: (numpy Array) Datetimes of candles (datetime64[ns])
+    :param high: (numpy Array) Highs of candles
+    :param low: (numpy Array) Lows of candles
+
+    :rtype: ExtremesIndex
+    """
+    bounds = np.asarray(datetimes[[0, -1]] if len(datetimes) > 0 else [], dtype='datetime64[ns]').view(np.int64)
+
+    # Routine for persisted index that matches candles
+    if os.path.isfile(filename):
+        with np.load(filename) as stored:
+            if int(stored['n_rows']) == len(high) and np.array_equal(stored['bounds'], bounds):
+                return ExtremesIndex(stored['high_levels'], stored['neg_low_levels'], len(high))
+
+    # Builds and persists index
+    index = build_extremes_index(high, low)
+    atomic_write(filename, lambda f: np.savez(f, n_rows=index.n_rows, bounds=bounds, high_levels=index.high_levels,
+                                              neg_low_levels=index.neg_low_levels))
+
+    return index
+
+
+def level_offsets(n_rows):
+    """
+    Offset of each level in a flat pyramid of 'n_rows' candles.
+
+    :param n_rows: (int) Number of candles
+
+    :rtype: list of int
+    """
+    offsets, length = [0], n_rows
+    while length > 1:
+        offsets.append(offsets[-1] + length)
+        length = (length + 1) // 2
+
+    return offsets
+
+
+def build_levels(values):
+    """
+    Builds flat pyramid of block maxima. NaN values are ignored (a block of NaN values has a NaN maximum).
+
+    :param values: (numpy Array) Values of level 0
+
+    :return: All levels, one after the other
+    :rtype: numpy Array
+    """
+    levels = [values]
+    while levels[-1].shape[0] > 1:
+        level = levels[-1]
+
+        # Odd levels get a NaN at the end, so that every element has a pair
+        if level.shape[0] % 2 == 1:
+            level = np.append(level, np.nan)
+
+        levels.append(np.fmax(level[0::2], level[1::2]))
+
+    return np.concatenate(levels)
+
+
+def first_reaching(levels, offsets, start, stop, prices):
+    """
+    First row in [start, stop) whose value >= price, for many queries at once.
+
+    Each query climbs from 'start' through aligned blocks that don't reach its price (skipping a block of 2 ** k rows
+    whenever bit k of its position is set), until it finds a block that reaches its price or goes past 'stop'. Then it
+    descends inside this block, skipping each half that doesn't. Both ways take a NumPy operation per level.
+
+    :param levels: (numpy Array) Flat pyramid of block maxima
+    :param offsets: (list of int) Offset of each level
+    :param start: (numpy Array) First row of each query
+    :param stop: (numpy Array) End of each query (not included)
+    :param prices: (numpy Array) Price of each query
+
+    :return: First row that reaches price, -1 if there is none
+    :rtype: numpy Array
+    """
+    pos = np.array(start, dtype=np.int64)
+    stop = np.asarray(stop, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+
+    # Level from which each query descends, queries that never stop climbing descend from the top level
+    top = len(offsets) - 1
+    descent = np.full(pos.shape[0], top, dtype=np.int64)
+    is_climbing = np.ones(pos.shape[0], dtype=bool)
+
+    # Climbs through blocks that don't reach price
+    for k in range(top):
+        rows = np.flatnonzero(is_climbing & (pos < stop) & ((pos >> k) & 1 == 1))
+        is_skip = skip_blocks(levels, offsets[k], k, pos[rows], stop[rows], prices[rows])
+        pos[rows[is_skip]] += 1 << k
+
+        descent[rows[~is_skip]] = k
+        is_climbing[rows[~is_skip]] = False
+
+    # Descends inside the block that reaches price (or goes past stop)
+    for k in range(top - 1, -1, -1):
+        rows = np.flatnonzero((descent > k) & (pos < stop))
+        is_skip = skip_blocks(levels, offsets[k], k, pos[rows], stop[rows], prices[rows])
+        pos[rows[is_skip]] += 1 << k
+
+    # Position is either the first row that reaches price or 'stop'
+    output = np.full(pos.shape[0], -1, dtype=np.int64)
+    rows = np.flatnonzero(pos < stop)
+    rows = rows[levels[pos[rows]] >= prices[rows]]
+    output[rows] = pos[rows]
+
+    return output
+
+
+def skip_blocks(levels, offset, k, pos, stop, prices):
+    """
+    Checks which blocks of 2 ** k rows starting at 'pos' can be skipped: they end before 'stop' and none of their values
+    reaches price.
+
+    :rtype: numpy Array of bool
+    """
+    return (pos + (1 << k) <= stop) & ~(levels[offset + (pos >> k)] >= prices)
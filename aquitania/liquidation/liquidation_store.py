@@ -0,0 +1,280 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created liquidation store. Liquidations used to be saved as HDF5 tables with data columns (one file per
+asset and signal, deleted and rewritten every time), and BrainsManager read every '_CONSOLIDATE' file whole before
+concatenating them. Now each liquidation is a partition per signal and asset:
+
+    data/liquidation/<signal>/<asset>/<name>.json         manifest
+    data/liquidation/<signal>/<asset>/<name>.<token>.npz  compressed typed columns, split in row groups
+
+The manifest holds dtypes and, for each row group, min/max/null count of the index and of every column, so that
+loaders open only the columns and row groups (date ranges) they need. Strings are stored as integer codes of a list of
+categories. Data file has a new token on every save and the manifest is replaced last, so readers never see half a
+liquidation.
+
+18/10/2026 - Manifest keeps 'metadata' of how a liquidation was built, so that exits can be extended incrementally.
+"""
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from aquitania.data_processing.util import atomic_write, generate_folder
+
+# Root folder of liquidation partitions
+LIQUIDATION_FOLDER = 'data/liquidation'
+
+# Number of rows per row group
+ROW_GROUP_SIZE = 65536
+
+# Version of manifest layout
+VERSION = 1
+
+
+def get_partition_folder(asset, signal):
+    """
+    Folder of liquidations of an asset and signal.
+
+    :param asset: (str) Asset name
+    :param signal: (str) Signal name (entry)
+
+    :rtype: str
+    """
+    return '{}/{}/{}'.format(LIQUIDATION_FOLDER, signal, asset)
+
+
+def save_liquidation(df, asset, signal, name, metadata=None):
+    """
+    Saves liquidation DataFrame (indexed by DateTime) into its partition, replacing previous one.
+
+    :param df: (pandas DataFrame) Liquidation to be saved
+    :param asset: (str) Asset name
+    :param signal: (str) Signal name (entry)
+    :param name: (str) Liquidation name (ex.: 'exits', 'consolidate')
+    :param metadata: (dict) JSON serializable information on how liquidation was built, kept in manifest
+    """
+    folder = get_partition_folder(asset, signal)
+    generate_folder(folder)
+
+    # Encodes index and columns into typed arrays
+    index, index_meta = encode_values(df.index.values)
+    encoded = [encode_values(df[column].values) for column in df.columns]
+
+    # Splits them in row groups
+    arrays, row_groups = {}, []
+    for group, row in enumerate(range(0, max(df.shape[0], 1), ROW_GROUP_SIZE)):
+        rows = slice(row, row + ROW_GROUP_SIZE)
+
+        arrays['index.{}'.format(group)] = index[rows]
+        stats = {'index': column_stats(index[rows], index_meta)}
+        for i, (values, meta) in enumerate(encoded):
+            arrays['c{}.{}'.format(i, group)] = values[rows]
+            stats[str(i)] = column_stats(values[rows], meta)
+
+        row_groups.append({'n_rows': index[rows].shape[0], 'stats': stats})
+
+    # Writes data file under a new token
+    data_filename = '{}.{}.npz'.format(name, uuid.uuid4().hex)
+    atomic_write('{}/{}'.format(folder, data_filename), lambda f: np.savez_compressed(f, **arrays))
+
+    # Writes manifest, which makes new data visible to readers
+    manifest = {'version': VERSION, 'data': data_filename, 'n_rows': df.shape[0],
+                'index': dict(index_meta, name=df.index.name),
+                'columns': [dict(meta, name=str(column)) for column, (values, meta) in zip(df.columns, encoded)],
+                'row_groups': row_groups, 'metadata': {} if metadata is None else metadata}
+    manifest_filename = '{}/{}.json'.format(folder, name)
+    atomic_write(manifest_filename, lambda f: json.dump(manifest, f), mode='w')
+
+    # Removes data files of previous saves
+    for filename in os.listdir(folder):
+        if filename.startswith(name + '.') and filename.endswith('.npz') and filename != data_filename:
+            os.remove('{}/{}'.format(folder, filename))
+
+
+def read_manifest(asset, signal, name):
+    """
+    Reads manifest of a liquidation.
+
+    :param asset: (str) Asset name
+    :param signal: (str) Signal name (entry)
+    :param name: (str) Liquidation name
+
+    :return: Manifest
+    :rtype: dict
+    """
+    with open('{}/{}.json'.format(get_partition_folder(asset, signal), name)) as f:
+        return json.load(f)
+
+
+def load_liquidation(asset, signal, name, columns=None, start=None, end=None):
+    """
+    Loads liquidation of an asset and signal, optionally only some columns and DateTimes between 'start' and 'end'
+    (both included). Row groups out of the range are not read.
+
+    :param asset: (str) Asset name
+    :param signal: (str) Signal name (entry)
+    :param name: (str) Liquidation name (ex.: 'exits', 'consolidate')
+    :param columns: (list of str) Columns to be loaded, None for all
+    :param start: (datetime) First DateTime to be loaded
+    :param end: (datetime) Last DateTime to be loaded
+
+    :return: Liquidation
+    :rtype: pandas DataFrame
+    """
+    manifest = read_manifest(asset, signal, name)
+
+    # Selects columns
+    names = [meta['name'] for meta in manifest['columns']]
+    selected = range(len(names)) if columns is None else [names.index(column) for column in columns]
+
+    # Selects row groups that might hold the range
+    start = None if start is None else pd.Timestamp(start).as_unit('ns').value
+    end = None if end is None else pd.Timestamp(end).as_unit('ns').value
+    groups = [group for group, row_group in enumerate(manifest['row_groups'])
+              if is_overlap(row_group['stats']['index'], start, end)]
+
+    # Reads only selected arrays
+    index, values = [], [[] for i in selected]
+    with np.load('{}/{}'.format(get_partition_folder(asset, signal), manifest['data'])) as data:
+        for group in groups:
+            index.append(data['index.{}'.format(group)])
+            for j, i in enumerate(selected):
+                values[j].append(data['c{}.{}'.format(i, group)])
+
+    index = decode_values(concat_arrays(index), manifest['index'])
+    values = [decode_values(concat_arrays(arrays), manifest['columns'][i]) for i, arrays in zip(selected, values)]
+
+    # Trims rows of row groups that are partially in range
+    is_selected = np.ones(index.shape[0], dtype=bool)
+    if start is not None:
+        is_selected &= index.view(np.int64) >= start
+    if end is not None:
+        is_selected &= index.view(np.int64) <= end
+
+    df = pd.DataFrame({names[i]: array[is_selected] for i, array in zip(selected, values)},
+                      index=pd.DatetimeIndex(index[is_selected], name=manifest['index']['name']))
+
+    return df
+
+
+def load_liquidations(assets, signal, name, columns=None, start=None, end=None):
+    """
+    Loads liquidations of many assets for a signal into a single DataFrame (see 'load_liquidation()').
+
+    :param assets: (list of str) Asset names
+    :param signal: (str) Signal name (entry)
+    :param name: (str) Liquidation name (ex.: 'exits', 'consolidate')
+    :param columns: (list of str) Columns to be loaded, None for all
+    :param start: (datetime) First DateTime to be loaded
+    :param end: (datetime) Last DateTime to be loaded
+
+    :return: Liquidations, in the order of 'assets'
+    :rtype: pandas DataFrame
+    """
+    return pd.concat([load_liquidation(asset, signal, name, columns, start, end) for asset in assets])
+
+
+def encode_values(values):
+    """
+    Encodes values of a column into a typed array: datetimes become int64 nanoseconds and strings become int32 codes
+    of a list of categories.
+
+    :param values: (numpy Array) Values of column
+
+    :return: Typed array and its metadata
+    :rtype: tuple
+    """
+    values = np.asarray(values)
+
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').view(np.int64), {'dtype': 'datetime64[ns]'}
+
+    if values.dtype.kind in 'biuf':
+        return values, {'dtype': values.dtype.str}
+
+    # Routine for strings
+    if pd.api.types.infer_dtype(values, skipna=False) not in ('string', 'empty'):
+        raise TypeError('Liquidation columns must be numbers, booleans, datetimes or strings.')
+    codes, categories = pd.factorize(values)
+
+    return codes.astype(np.int32), {'dtype': 'category', 'categories': [str(category) for category in categories]}
+
+
+def decode_values(values, meta):
+    """
+    Decodes typed array made by 'encode_values()'.
+
+    :param values: (numpy Array) Typed array
+    :param meta: (dict) Metadata of column
+
+    :return: Values of column
+    :rtype: numpy Array
+    """
+    if meta['dtype'] == 'category':
+        return np.array(meta['categories'], dtype=object)[values]
+
+    return values.view(meta['dtype']) if meta['dtype'] == 'datetime64[ns]' else values.astype(meta['dtype'])
+
+
+def column_stats(values, meta):
+    """
+    Statistics of a typed array in a row group: min, max (None when there is no value) and null count (NaN or NaT).
+
+    :param values: (numpy Array) Typed array
+    :param meta: (dict) Metadata of column
+
+    :rtype: dict
+    """
+    # Routine for strings, categories already list their values
+    if meta['dtype'] == 'category':
+        return {'null_count': 0}
+
+    # Selects non null values
+    if meta['dtype'] == 'datetime64[ns]':
+        is_null = values == np.iinfo(np.int64).min
+    elif values.dtype.kind == 'f':
+        is_null = np.isnan(values)
+    else:
+        is_null = np.zeros(values.shape[0], dtype=bool)
+    not_null = values[~is_null]
+
+    if not_null.shape[0] == 0:
+        return {'min': None, 'max': None, 'null_count': int(values.shape[0])}
+
+    return {'min': not_null.min().item(), 'max': not_null.max().item(), 'null_count': int(is_null.sum())}
+
+
+def is_overlap(stats, start, end):
+    """
+    Checks if values of a row group might be between 'start' and 'end'.
+
+    :param stats: (dict) Statistics of row group
+    :param start: (int) Start in nanoseconds (None for no limit)
+    :param end: (int) End in nanoseconds (None for no limit)
+
+    :rtype: bool
+    """
+    if stats['min'] is None:
+        return start is None and end is None
+
+    return (start is None or stats['max'] >= start) and (end is None or stats['min'] <= end)
+
+
+def concat_arrays(arrays):
+    # Concatenates arrays of row groups, an empty list means no row was read
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
@@ -0,0 +1,42 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created CandleArray to feed indicators with whole columns of closed Candles at once (used by NumpyFeeder).
+"""
+
+
+class CandleArray:
+    """
+    CandleArray is the columnar counterpart of the Candle class. It stores many Candles of a single timestamp as NumPy
+    arrays, keeping the same (down, up) tuple convention of Candle attributes, so 'candles.close[self.up]' returns the
+    close values of every Candle in the same way 'candle.close[self.up]' returns the close value of a single Candle.
+    """
+
+    def __init__(self, values, volume):
+        """
+        Initializes CandleArray from a matrix of Candle values.
+
+        :param values: (numpy Array) float64 matrix with 8 columns in the following order:
+            open[0], open[1], high[0], high[1], low[0], low[1], close[0], close[1]
+        :param volume: (numpy Array) int64 volume of each Candle
+        """
+        self.open = (values[:, 0], values[:, 1])
+        self.high = (values[:, 2], values[:, 3])
+        self.low = (values[:, 4], values[:, 5])
+        self.close = (values[:, 6], values[:, 7])
+        self.volume = volume
+
+    def __len__(self):
+        return self.volume.shape[0]
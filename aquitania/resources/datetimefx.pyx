@@ -15,13 +15,226 @@
 
 These were one of the first files ever to be built. Since then Aquitania became each time more object-oriented and I
 have been not using some much these libraries of static functions. This one was one of the few useful survivors.
+
+18/10/2026 - Added 'is_fx_working_hours_array()', FX working hours of many candles at once.
+
+18/10/2026 - Added MarketCalendar, FX market sessions (Sunday 17h to Friday 17h in New York, split by holidays)
+precomputed as UTC epoch seconds. It answers if market is open, next and last close and session id of whole arrays
+through binary search, and of a single datetime through typed methods for Cython callers. FX working hours and market
+closes are evaluated through MARKET_CALENDAR instead of converting each datetime to New York time.
 """
 
+import calendar
 import pytz
 import datetime as dtm
+import numpy as np
 import pandas as pd
 from cpython.datetime cimport datetime
 
+# Years covered by MARKET_CALENDAR
+CALENDAR_START_YEAR = 1970
+CALENDAR_END_YEAR = 2100
+
+# Market week ends on Friday midnight in New York, 7 hours after market close
+cdef long long WEEK_END_SECONDS = 7 * 3600
+
+
+cdef class MarketCalendar:
+    """
+    FX market sessions as UTC epoch seconds. A session opens on Sunday 17h and closes on Friday 17h in New York time
+    (DST transitions included), holidays close market from 17h of the previous day to 17h of the holiday.
+    """
+    cdef public object opens
+    cdef public object closes
+    cdef public object week_closes
+    cdef long long[:] _opens
+    cdef long long[:] _closes
+    cdef long long[:] _week_closes
+
+    def __init__(self, start_year=CALENDAR_START_YEAR, end_year=CALENDAR_END_YEAR, holidays=()):
+        """
+        Precomputes market sessions.
+
+        :param start_year: (int) First year of calendar
+        :param end_year: (int) Last year of calendar
+        :param holidays: (list of datetime.date) Days when market is closed
+        """
+        # Sundays that open a market week, in New York time
+        sundays = pd.date_range('{}-12-20'.format(start_year - 1), '{}-01-10'.format(end_year + 1), freq='W-SUN')
+        opens = ny_to_epoch_seconds(sundays + pd.Timedelta(hours=17))
+        closes = ny_to_epoch_seconds(sundays + pd.Timedelta(days=5, hours=17))
+
+        # Weekly closes are kept apart, market week rules don't change with holidays
+        self.week_closes = closes
+
+        # Cuts holidays out of sessions
+        if len(holidays) > 0:
+            days = pd.DatetimeIndex(sorted(holidays))
+            opens, closes = cut_sessions(opens, closes, ny_to_epoch_seconds(days - pd.Timedelta(hours=7)),
+                                         ny_to_epoch_seconds(days + pd.Timedelta(hours=17)))
+
+        self.opens, self.closes = opens, closes
+        self._opens, self._closes, self._week_closes = opens, closes, self.week_closes
+
+    cpdef object is_open(self, object seconds):
+        """
+        :param seconds: (numpy Array) UTC epoch seconds
+
+        :return: True for each datetime when market is open
+        :rtype: numpy Array of bool
+        """
+        return self.session_id(seconds) >= 0
+
+    cpdef object session_id(self, object seconds):
+        """
+        :param seconds: (numpy Array) UTC epoch seconds
+
+        :return: Session of each datetime, -1 when market is closed
+        :rtype: numpy Array of int64
+        """
+        session = np.searchsorted(self.opens, seconds, side='right') - 1
+        is_open = (session >= 0) & (seconds < self.closes[np.maximum(session, 0)])
+
+        return np.where(is_open, session, -1)
+
+    cpdef object next_close(self, object seconds):
+        """
+        :param seconds: (numpy Array) UTC epoch seconds
+
+        :return: First market close after each datetime
+        :rtype: numpy Array of int64
+        """
+        return self.closes[np.searchsorted(self.closes, seconds, side='right')]
+
+    cpdef object last_close(self, object seconds):
+        """
+        :param seconds: (numpy Array) UTC epoch seconds
+
+        :return: Last market close at or before each datetime
+        :rtype: numpy Array of int64
+        """
+        return self.closes[np.searchsorted(self.closes, seconds, side='right') - 1]
+
+    cpdef object week_close(self, object seconds):
+        """
+        :param seconds: (numpy Array) UTC epoch seconds
+
+        :return: Friday close of the market week of each datetime (weeks end on Friday midnight in New York)
+        :rtype: numpy Array of int64
+        """
+        return self.week_closes[np.searchsorted(self.week_closes, seconds - WEEK_END_SECONDS, side='right')]
+
+    cpdef long long session_id_at(self, long long second):
+        """
+        Scalar version of '.session_id()'.
+        """
+        cdef Py_ssize_t session = bisect_right(self._opens, second) - 1
+        if session >= 0 and second < self._closes[session]:
+            return session
+        return -1
+
+    cpdef bint is_open_at(self, long long second):
+        """
+        Scalar version of '.is_open()'.
+        """
+        return self.session_id_at(second) >= 0
+
+    cpdef long long next_close_at(self, long long second):
+        """
+        Scalar version of '.next_close()'.
+        """
+        return self._closes[bisect_right(self._closes, second)]
+
+    cpdef long long last_close_at(self, long long second):
+        """
+        Scalar version of '.last_close()'.
+        """
+        return self._closes[bisect_right(self._closes, second) - 1]
+
+    cpdef long long week_close_at(self, long long second):
+        """
+        Scalar version of '.week_close()'.
+        """
+        return self._week_closes[bisect_right(self._week_closes, second - WEEK_END_SECONDS)]
+
+
+cdef inline Py_ssize_t bisect_right(long long[:] values, long long value) nogil:
+    # First position of a sorted array whose value is greater than 'value'
+    cdef Py_ssize_t low = 0, high = values.shape[0], middle
+    while low < high:
+        middle = (low + high) // 2
+        if values[middle] <= value:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def ny_to_epoch_seconds(ny_datetimes):
+    """
+    Converts naive New York datetimes into UTC epoch seconds.
+
+    :param ny_datetimes: (pandas DatetimeIndex) Naive New York datetimes
+
+    :rtype: numpy Array of int64
+    """
+    return pd.DatetimeIndex(ny_datetimes).tz_localize('America/New_York').as_unit('s').asi8.copy()
+
+
+def cut_sessions(opens, closes, cut_starts, cut_ends):
+    """
+    Removes intervals (holidays) from market sessions, sessions that become empty are dropped.
+
+    :param opens: (numpy Array) Opens of sessions
+    :param closes: (numpy Array) Closes of sessions
+    :param cut_starts: (numpy Array) Starts of intervals
+    :param cut_ends: (numpy Array) Ends of intervals
+
+    :return: Opens and closes of remaining sessions
+    :rtype: tuple of numpy Arrays
+    """
+    new_opens, new_closes = [], []
+    for open_, close in zip(opens.tolist(), closes.tolist()):
+        # Intervals that overlap session
+        first = np.searchsorted(cut_ends, open_, side='right')
+        last = np.searchsorted(cut_starts, close, side='left')
+        for start, end in zip(cut_starts[first:last].tolist(), cut_ends[first:last].tolist()):
+            if start > open_:
+                new_opens.append(open_)
+                new_closes.append(start)
+            open_ = max(open_, end)
+        if open_ < close:
+            new_opens.append(open_)
+            new_closes.append(close)
+
+    return np.array(new_opens, dtype=np.int64), np.array(new_closes, dtype=np.int64)
+
+
+cpdef long long to_epoch_second(object dt):
+    """
+    Converts datetime into UTC epoch seconds, naive datetimes are GMT.
+
+    :param dt: (datetime) Datetime
+
+    :rtype: int
+    """
+    return calendar.timegm(dt.utctimetuple())
+
+
+cpdef datetime from_epoch_second(long long second):
+    """
+    Converts UTC epoch seconds into naive GMT datetime.
+
+    :param second: (int) UTC epoch seconds
+
+    :rtype: datetime
+    """
+    return dtm.datetime(1970, 1, 1) + dtm.timedelta(seconds=second)
+
+
+# FX market calendar (no holidays, same hours as 'is_fx_working_hours()')
+MARKET_CALENDAR = MarketCalendar()
+
 cpdef str now():
     return '[{}]: '.format(str(dtm.datetime.now())[0:19])
 
@@ -41,19 +254,23 @@ def is_fx_working_hours_from_tz(candle_time):
     """
     Evaluates if a candle is part of the normal FX working hours.
 
-    :param candle_time: Datetime that will be evaluated for being in the 17-17 NY TZ
-    :param tz: candle_time timezone to be evaluated
+    :param candle_time: Datetime that will be evaluated for being in the 17-17 NY TZ (naive datetimes are GMT)
 
     :return: Returns True if the candle is a valid working hour in 17-17 NY TZ
     :rtype: Boolean
     """
-    #  Instantiates NY TimeZone
-    ny_tz = pytz.timezone('America/New_York')
+    return MARKET_CALENDAR.is_open_at(to_epoch_second(candle_time))
+
+def is_fx_working_hours_array(datetimes):
+    """
+    Evaluates if candles are part of the normal FX working hours, for many candles at once.
+
+    :param datetimes: (numpy Array or pandas DatetimeIndex) Naive GMT datetimes to be evaluated
 
-    # If naive transforms to aware
-    gmt_time = transform_to_gmt(candle_time)
-    ny_time = gmt_time.astimezone(ny_tz)
-    return is_fx_working_hours(ny_time)
+    :return: True for each datetime that is a valid working hour in 17-17 NY TZ
+    :rtype: numpy Array of bool
+    """
+    return MARKET_CALENDAR.is_open(pd.DatetimeIndex(datetimes).as_unit('ns').asi8 // 1000000000)
 
 def transform_to_tz(candle_time, tz_name):
     gmt_tz = pytz.timezone('GMT')
@@ -107,39 +324,25 @@ def last_market_close(datetime_value):
     :return: Datetime of the last market close in GMT hours
     :rtype: datetime
     """
+    second = to_epoch_second(datetime_value)
 
-    datetime_value = datetime_as_ny(datetime_value)
-
-    weekday = datetime_value.weekday()
-    hour_value = datetime_value.hour
-    if weekday <= 4:
-        if weekday < 4:
-            weekday += 7
-        elif hour_value < 17:
-            weekday += 7
-
-    datetime_value = datetime_value + dtm.timedelta(days=4 - weekday)
-    datetime_value = datetime_value.replace(hour=16, minute=59)
-
-    gmt_tz = pytz.timezone('GMT')
-    return datetime_value.astimezone(gmt_tz).replace(tzinfo=None)
+    # Last Friday close (16h59 candle), keeping seconds of 'datetime_value'
+    close = MARKET_CALENDAR.week_closes[np.searchsorted(MARKET_CALENDAR.week_closes, second, side='right') - 1]
+    return from_epoch_second(close - 60).replace(second=datetime_value.second, microsecond=datetime_value.microsecond)
 
 cpdef datetime next_market_close(datetime datetime_value):
     """
-    Returns the next FX market open given a datetime value.
+    Returns the next FX market close given a datetime value.
 
-    :param: candle_time Reference candle from which the next FX market open will be calculated
-    :return: Returns the date and time of the next FX market open
+    :param: candle_time Reference candle from which the next FX market close will be calculated
+    :return: Returns the date and time of the next FX market close (16h59 candle on Friday)
     :rtype: datetime
     """
-    datetime_value = datetime_as_ny(datetime_value)
-
-    weekday = datetime_value.weekday()
-    weekday = weekday if weekday <= 4 else weekday - 7
+    cdef long long close = MARKET_CALENDAR.week_close_at(to_epoch_second(datetime_value))
 
-    datetime_value = datetime_value + dtm.timedelta(days=4 - weekday)
-    datetime_value = datetime_value.replace(hour=16, minute=59)
-    return datetime_value.astimezone(pytz.timezone('GMT')).replace(tzinfo=None)
+    # Keeps seconds of 'datetime_value'
+    return from_epoch_second(close - 60).replace(second=datetime_value.second,
+                                                 microsecond=datetime_value.microsecond)
 
 def next_market_open(candle_time):
     """
@@ -15,13 +15,19 @@
 
 This modules creates a class of a Python multiprocess pool that is not daemonic.
 Useful in case you need your pool to have children.
+
+18/10/2026 - Since Python 3.8 Pool creates its workers through 'Process(ctx, ...)', MyPool creates them with the
+process class of the context of the pool, made non-daemonic by NoDaemonMixin.
 """
 
+import sys
 import multiprocessing
 import multiprocessing.pool
 
+from multiprocessing import context
+
 
-class NoDaemonProcess(multiprocessing.Process):
+class NoDaemonMixin:
     # make 'daemon' attribute always return False
     def _get_daemon(self):
         return False
@@ -32,7 +38,31 @@ class NoDaemonProcess(multiprocessing.Process):
     daemon = property(_get_daemon, _set_daemon)
 
 
+class NoDaemonProcess(NoDaemonMixin, multiprocessing.Process):
+    pass
+
+
+class NoDaemonSpawnProcess(NoDaemonMixin, context.SpawnProcess):
+    pass
+
+
+# Non-daemonic version of the process class of each context (module level classes, so that spawn can pickle them)
+NO_DAEMON_PROCESSES = {context.Process: NoDaemonProcess, context.SpawnProcess: NoDaemonSpawnProcess}
+
+if sys.platform != 'win32':
+    class NoDaemonForkProcess(NoDaemonMixin, context.ForkProcess):
+        pass
+
+    class NoDaemonForkServerProcess(NoDaemonMixin, context.ForkServerProcess):
+        pass
+
+    NO_DAEMON_PROCESSES.update({context.ForkProcess: NoDaemonForkProcess,
+                                context.ForkServerProcess: NoDaemonForkServerProcess})
+
+
 # We sub-class multiprocessing.pool.Pool instead of multiprocessing.Pool
 # because the latter is only a wrapper function, not a proper class.
 class MyPool(multiprocessing.pool.Pool):
-    Process = NoDaemonProcess
+    @staticmethod
+    def Process(ctx, *args, **kwds):
+        return NO_DAEMON_PROCESSES[ctx.Process](*args, **kwds)
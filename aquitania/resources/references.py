@@ -76,7 +76,8 @@ currency_list = ['AUD', 'CAD', 'CHF', 'CNH', 'CZK', 'DKK', 'EUR', 'GBP', 'HKD',
 
 ohlc_dict = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
 
-data_folders = ['data/ai', 'data/model_manager', 'data/indicator', 'data/order_manager', 'data/state', 'data/liquidation']
+data_folders = ['data/ai', 'data/model_manager', 'data/indicator', 'data/indicator_index', 'data/order_manager',
+                'data/state', 'data/liquidation']
 
 ts_to_letter = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
 
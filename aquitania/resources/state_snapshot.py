@@ -0,0 +1,82 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+18/10/2026 - Created to replace the pickling of whole IndicatorManager objects. A snapshot only holds what is needed to
+resume a simulation (rolling state of each indicator and in-progress Candles of the Feeder), made exclusively of plain
+Python values (tuples, lists, numbers, strings, None), so its size and writing time depend on indicator periods and not
+on the objects around them (broker instance, HistoricDataManager, loaders...).
+
+File layout:
+    magic (4 bytes) | format version (uint16) | payload length (uint64) | payload crc32 (uint32) | payload
+
+Payload is the state serialized with pickle protocol 4, which is stable across Python versions for plain values.
+
+18/10/2026 - Version 2, indicators that don't implement their own state hooks save their pickled instance attributes
+(version 1 snapshots have no state for them, so they can't be resumed).
+"""
+import _pickle
+import struct
+import zlib
+
+from aquitania.data_processing.util import atomic_write
+
+MAGIC = b'AQSN'
+VERSION = 2
+
+HEADER = struct.Struct('<4sHQI')
+
+
+def write_snapshot(filename, state):
+    """
+    Writes state to disk through 'atomic_write()'.
+
+    :param filename: (str) Path of snapshot file
+    :param state: State made exclusively of plain Python values
+    """
+    # Serializes state
+    payload = _pickle.dumps(state, protocol=4)
+    header = HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload))
+
+    # Replaces previous snapshot
+    atomic_write(filename, lambda f: f.write(header + payload))
+
+
+def read_snapshot(filename):
+    """
+    Reads state written by 'write_snapshot()'.
+
+    :param filename: (str) Path of snapshot file
+
+    :return: State made exclusively of plain Python values
+    :raises ValueError: If file is not a snapshot, has an unknown version or is corrupted
+    """
+    with open(filename, 'rb') as f:
+        header = f.read(HEADER.size)
+        payload = f.read()
+
+    # Validates header
+    if len(header) < HEADER.size:
+        raise ValueError('{} is too short to be a state snapshot.'.format(filename))
+    magic, version, length, crc = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('{} is not a state snapshot.'.format(filename))
+    if version != VERSION:
+        raise ValueError('{} has snapshot version {}, expected {}.'.format(filename, version, VERSION))
+
+    # Validates payload
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ValueError('{} is corrupted.'.format(filename))
+
+    return _pickle.loads(payload)
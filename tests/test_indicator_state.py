@@ -0,0 +1,89 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+Resuming indicators from state snapshots gives the same output as an uninterrupted run.
+"""
+import collections
+import datetime
+
+import numpy as np
+
+from aquitania.indicator.abstract.indicator_output_abc import AbstractIndicatorOutput
+from aquitania.indicator.ema import EMA
+from aquitania.resources.candle import Candle
+from aquitania.resources.state_snapshot import read_snapshot, write_snapshot
+
+
+class LastCloses(AbstractIndicatorOutput):
+    """
+    User written indicator that keeps its state in attributes and doesn't implement the state hooks.
+    """
+
+    def __init__(self, obs_id, period):
+        super().__init__(obs_id, ['sum', 'count'], False, (0.0, 0))
+        self.closes = collections.deque(maxlen=period)
+        self.count = 0
+
+    def indicator_logic(self, candle):
+        self.closes.append(candle.close[self.up])
+        self.count += 1
+        return sum(self.closes), self.count
+
+
+def generate_candles(n_candles):
+    # Random walk of G01 Candles
+    closes = 1.1 + np.cumsum(np.random.default_rng(0).normal(0, 0.001, n_candles))
+    start = datetime.datetime(2018, 1, 1)
+
+    candles = []
+    for i, close in enumerate(closes.tolist()):
+        dt = start + datetime.timedelta(minutes=i)
+        candles.append(Candle(0, 1, dt, dt, dt, close, close + 0.001, close - 0.001, close, 1, True))
+    return candles
+
+
+def run(indicator, candles):
+    for candle in candles:
+        indicator.feed(candle)
+        indicator.save_output()
+    return indicator.output_list
+
+
+def resume(new_indicator, indicator, candles, tmp_path):
+    # Saves indicator into a snapshot file and restores it into a fresh indicator
+    filename = str(tmp_path / 'indicator.snap')
+    write_snapshot(filename, indicator.state())
+    new_indicator.set_state(read_snapshot(filename))
+    return run(new_indicator, candles)
+
+
+def test_resume_custom_stateful_indicator(tmp_path):
+    candles = generate_candles(100)
+    expected = run(LastCloses('last', 10), candles)
+
+    indicator = LastCloses('last', 10)
+    output = run(indicator, candles[:55]) + resume(LastCloses('last', 10), indicator, candles[55:], tmp_path)
+
+    assert output == expected
+
+
+def test_resume_indicator_with_state_hooks(tmp_path):
+    candles = generate_candles(100)
+    expected = run(EMA('ema', 20, 0.9), candles)
+
+    indicator = EMA('ema', 20, 0.9)
+    output = run(indicator, candles[:55]) + resume(EMA('ema', 20, 0.9), indicator, candles[55:], tmp_path)
+
+    assert output == expected
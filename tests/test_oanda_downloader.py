@@ -0,0 +1,143 @@
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||| AQUITANIA ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||| To be a thinker means to go by the factual evidence of a case, not by the judgment of others |||||||||||||||||| #
+# |||| As there is no group stomach to digest collectively, there is no group mind to think collectively. |||||||||||| #
+# |||| Each man must accept responsibility for his own life, each must be sovereign by his own judgment. ||||||||||||| #
+# |||| If a man believes a claim to be true, then he must hold to this belief even though society opposes him. ||||||| #
+# |||| Not only know what you want, but be willing to break all established conventions to accomplish it. |||||||||||| #
+# |||| The merit of a design is the only credential that you require. |||||||||||||||||||||||||||||||||||||||||||||||| #
+# |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+"""
+.. moduleauthor:: H Roark
+
+OandaDownloader against a local HTTP server that stands in for Oanda and fails some of the requests.
+"""
+import collections
+import datetime
+import json
+import random
+import threading
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aquitania.data_source.broker.oanda_downloader import OandaDownloader, WINDOW_MINUTES
+
+START = datetime.datetime(2018, 1, 1)
+N_WINDOWS = 24
+
+
+class StandInOanda(BaseHTTPRequestHandler):
+    """
+    Answers candles requests with one candle per minute (both ends of the range included, as Oanda does).
+
+    Financial Security 'FAIL' always gets a 503, 'BAD' always gets a 400, others get a 429 or a 503 on
+    'server.failure_rate' of the requests.
+    """
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        finsec = url.path.split('/')[3]
+        params = dict(urllib.parse.parse_qsl(url.query))
+
+        with self.server.lock:
+            self.server.requests[finsec] += 1
+            is_failure = self.server.random.random() < self.server.failure_rate
+
+        if finsec == 'BAD':
+            return self.reply(400, {'errorMessage': 'Invalid value specified for \'instrument\''})
+        if finsec == 'FAIL' or is_failure:
+            return self.reply(self.server.random.choice([429, 503]), {'errorMessage': 'Try again'})
+
+        # Candles from 'from' to 'to' (or 'count' candles)
+        start = datetime.datetime.strptime(params['from'], '%Y-%m-%dT%H:%M:%SZ')
+        if 'to' in params:
+            end = datetime.datetime.strptime(params['to'], '%Y-%m-%dT%H:%M:%SZ')
+            n_candles = int((end - start).total_seconds() // 60) + 1
+        else:
+            n_candles = int(params['count'])
+
+        candles = []
+        for minute in range(n_candles):
+            dt = start + datetime.timedelta(minutes=minute)
+            candles.append({'complete': True, 'volume': 1, 'time': dt.strftime('%Y-%m-%dT%H:%M:%S.000000000Z'),
+                            'bid': {'o': '1.1', 'h': '1.2', 'l': '1.0', 'c': '1.1'}})
+
+        self.reply(200, {'instrument': finsec, 'granularity': 'M1', 'candles': candles})
+
+    def reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInOanda)
+    server.lock = threading.Lock()
+    server.random = random.Random(1)  # First request already fails
+    server.requests = collections.Counter()
+    server.failure_rate = 0.15
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def downloader(server, max_retries=8):
+    return OandaDownloader('token', base_url='http://127.0.0.1:{}'.format(server.server_address[1]), n_connections=4,
+                           requests_per_second=1000, max_retries=max_retries, backoff=0)
+
+
+def test_download_with_failures(server):
+    end = START + datetime.timedelta(minutes=N_WINDOWS * WINDOW_MINUTES)
+    oanda = downloader(server)
+    try:
+        windows = list(oanda.download('EUR_USD', START, end))
+    finally:
+        oanda.close()
+
+    times = [candle['time'] for raw_data in windows for candle in raw_data['candles']]
+    expected = [(START + datetime.timedelta(minutes=minute)).strftime('%Y-%m-%dT%H:%M:%S.000000000Z')
+                for minute in range(N_WINDOWS * WINDOW_MINUTES)]
+
+    # Complete, in order and without duplicates, even though some requests failed
+    assert len(windows) == N_WINDOWS
+    assert times == expected
+    assert server.requests['EUR_USD'] > N_WINDOWS
+
+
+def test_retries_stop_after_max_retries(server):
+    oanda = downloader(server, max_retries=3)
+    try:
+        with pytest.raises(IOError):
+            list(oanda.download('FAIL', START, START + datetime.timedelta(minutes=WINDOW_MINUTES)))
+    finally:
+        oanda.close()
+
+    assert server.requests['FAIL'] == 4
+
+
+def test_client_errors_are_not_retried(server):
+    oanda = downloader(server)
+    try:
+        with pytest.raises(ValueError):
+            list(oanda.download('BAD', START, START + datetime.timedelta(minutes=WINDOW_MINUTES)))
+    finally:
+        oanda.close()
+
+    assert server.requests['BAD'] == 1